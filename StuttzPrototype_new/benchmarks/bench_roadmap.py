@@ -0,0 +1,72 @@
+"""
+BENCHMARK DA TELA DO ROADMAP
+Compara o tempo de construção da lista completa de fases, da lista virtualizada
+e do mapa visual (canvas)
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.bench_roadmap [--sizes 10 1000 10000] [--repeat 3]
+"""
+
+import argparse
+import time
+import tracemalloc
+from types import SimpleNamespace
+from benchmarks.synthetic import generate_course, generate_profile
+from models.data_models import RoadmapData, UserData
+from models.roadmap_store import RoadmapStore
+from views.roadmap_view import RoadmapView
+
+def make_controller(num_phases: int):
+    """Cria um controlador mínimo com um curso sintético (sem página do Flet)"""
+    roadmap_data = RoadmapData.from_dict(generate_course(num_phases, completed=num_phases // 2))
+    user_data = UserData.from_dict(generate_profile(completed=num_phases // 2))
+    return SimpleNamespace(
+        roadmap_data=roadmap_data,
+        user_data=user_data,
+        roadmap=RoadmapStore(roadmap_data, user_data.completed_phases),
+        handle_phase_click=lambda phase_id: None
+    )
+
+# Modos comparados: nome → argumentos da RoadmapView
+MODES = {
+    "completo": {"lazy": False, "canvas": False},
+    "lazy": {"lazy": True},
+    "canvas": {"lazy": False, "canvas": True},
+}
+
+def measure_build(num_phases: int, mode: dict, repeat: int):
+    """
+    Mede o tempo e a memória para construir a tela do roadmap
+    
+    Returns:
+        Tupla (melhor tempo em ms, pico de memória em KiB)
+    """
+    controller = make_controller(num_phases)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        RoadmapView(controller, **mode).build()
+        best = min(best, time.perf_counter() - start)
+    
+    tracemalloc.start()
+    RoadmapView(controller, **mode).build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return best * 1000, peak / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da construção do roadmap")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    print(f"{'fases':>8} | {'modo':>8} | {'tempo (ms)':>11} | {'memória (KiB)':>14}")
+    print("-" * 52)
+    for size in args.sizes:
+        for name, mode in MODES.items():
+            elapsed, peak = measure_build(size, mode, args.repeat)
+            print(f"{size:>8} | {name:>8} | {elapsed:>11.2f} | {peak:>14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""
+SUÍTE DE BENCHMARKS
+Mede os caminhos críticos do aplicativo (views, controlador, armazenamento e
+IA) com cursos sintéticos e compara o resultado com um arquivo de referência
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.bench_suite [--sizes 10 1000 10000] [--only views storage]
+    python -m benchmarks.bench_suite --save benchmarks/baseline.json
+    python -m benchmarks.bench_suite --compare benchmarks/baseline.json [--tolerance 1.0]
+
+Com --compare, o processo termina com código 1 se alguma medida ficar mais
+lenta que a referência além da tolerância (1.0 = duas vezes mais lenta), se
+alguma medida não existir na referência ou se algum benchmark for ignorado
+por falta do Flet (use --allow-missing para aceitar esses dois últimos casos).
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from benchmarks.synthetic import generate_course, generate_profile, write_fixture
+from models.data_models import RoadmapData, UserData
+from models.roadmap_store import RoadmapStore
+from utils.ai_cache import AICache, make_cache_key
+from utils.ai_helper import cache_namespace, get_gemini_response, set_provider
+from utils.ai_providers import FakeProvider
+from utils.storage import JSONStorage, SQLiteStorage
+from utils.headless import NullPage
+from utils.roadmap_layout import trail_layout
+
+# Os benchmarks da interface e do controlador dependem do Flet
+FLET_AVAILABLE = importlib.util.find_spec("flet") is not None
+
+# Duração mínima de cada amostra
+MIN_SAMPLE_SECONDS = 0.05
+
+@dataclass
+class Benchmark:
+    """Um benchmark da suíte"""
+    name: str  # Nome exibido e usado no arquivo de referência
+    group: str  # Grupo selecionável com --only
+    setup: Callable[[int, str], Callable[[], None]]  # (tamanho, pasta) → operação medida
+    sized: bool = True  # Se é executado para cada tamanho de curso
+    needs_flet: bool = False  # Se depende do Flet instalado
+    number: int = 20  # Execuções mínimas da operação por amostra
+
+def _quiet():
+    """Descarta as mensagens do aplicativo durante as medições"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+# === FIXTURES ===
+
+def _models(size: int) -> Tuple[RoadmapData, UserData]:
+    """Curso e perfil sintéticos já convertidos para os modelos"""
+    roadmap_data = RoadmapData.from_dict(generate_course(size, completed=size // 2))
+    user_data = UserData.from_dict(generate_profile(completed=size // 2))
+    return roadmap_data, user_data
+
+def _controller(size: int, workdir: str):
+    """
+    Cria um AppController sobre um curso sintético gravado em workdir
+    
+    A IA usa o provedor simulado sem latência e um cache só em memória, e o
+    pré-carregamento é desativado para não disputar a CPU com a medição
+    """
+    from controllers.app_controller import AppController
+    
+    fixture_dir = os.path.join(workdir, f"course-{size}")
+    write_fixture(fixture_dir, size, completed=size // 2)
+    os.chdir(fixture_dir)
+    controller = AppController(NullPage(), storage=JSONStorage())
+    controller.ai_cache = controller.prefetcher.cache = AICache(path=None)
+    controller.prefetcher.enabled = False
+    controller.get_view_host()
+    return controller
+
+# === BENCHMARKS ===
+
+def setup_roadmap_build(size: int, workdir: str) -> Callable[[], None]:
+    from views.roadmap_view import RoadmapView
+    controller = _controller(size, workdir)
+    return lambda: RoadmapView(controller).build()
+
+def setup_trail_layout(size: int, workdir: str) -> Callable[[], None]:
+    # Cálculo sem o cache (o custo pago uma vez por curso)
+    return lambda: trail_layout.__wrapped__(size)
+
+def setup_phase_detail_build(size: int, workdir: str) -> Callable[[], None]:
+    from views.phase_detail_view import PhaseDetailView
+    controller = _controller(size, workdir)
+    phase_id = controller.roadmap.phases[size // 2].id
+    return lambda: PhaseDetailView(controller, phase_id).build()
+
+def setup_update_view(size: int, workdir: str) -> Callable[[], None]:
+    controller = _controller(size, workdir)
+    phase_id = controller.roadmap.phases[size // 2].id
+    
+    def navigate():
+        # Abrir uma fase e voltar ao mapa (views já em cache após a primeira volta)
+        controller.handle_phase_click(phase_id)
+        controller.handle_back_to_roadmap()
+    return navigate
+
+def setup_get_phase_by_id(size: int, workdir: str) -> Callable[[], None]:
+    controller = _controller(size, workdir)
+    ids = [phase.id for phase in controller.roadmap.phases]
+    
+    def lookup():
+        for phase_id in ids[::max(1, len(ids) // 100)]:
+            controller.get_phase_by_id(phase_id)
+    return lookup
+
+def setup_store_lookup(size: int, workdir: str) -> Callable[[], None]:
+    roadmap_data, user_data = _models(size)
+    store = RoadmapStore(roadmap_data, user_data.completed_phases)
+    ids = [phase.id for phase in roadmap_data.phases]
+    
+    def lookup():
+        for phase_id in ids[::max(1, len(ids) // 100)]:
+            store.get_phase(phase_id)
+            store.next_phase(phase_id)
+        store.phases_with_status("unlocked")
+    return lookup
+
+def setup_json_save(size: int, workdir: str) -> Callable[[], None]:
+    roadmap_data, user_data = _models(size)
+    directory = os.path.join(workdir, f"json-{size}")
+    os.makedirs(directory, exist_ok=True)
+    storage = JSONStorage(user_file=os.path.join(directory, "user_data.json"),
+                          progress_file=os.path.join(directory, "progress.json"))
+    storage.attach(user_data, roadmap_data)
+    
+    def save():
+        # Gravação completa: agendar e aguardar a escrita atômica dos dois arquivos
+        storage.save_user_data(user_data)
+        storage.save_roadmap_data(roadmap_data)
+        storage.flush()
+    return save
+
+def setup_sqlite_save(size: int, workdir: str) -> Callable[[], None]:
+    roadmap_data, user_data = _models(size)
+    storage = SQLiteStorage(db_file=os.path.join(workdir, f"bench-{size}.db"))
+    storage.attach(user_data, roadmap_data)
+    
+    def save():
+        storage.save_user_data(user_data)
+        storage.save_roadmap_data(roadmap_data)
+    return save
+
+def _ai_prompts(count: int) -> List[str]:
+    return [f"Explique o tópico sintético número {i} em duas frases." for i in range(count)]
+
+def setup_ai_cache_hit(size: int, workdir: str) -> Callable[[], None]:
+    set_provider(FakeProvider(latency=0, seed=0))
+    cache = AICache(path=None)
+    prompts = _ai_prompts(100)
+    for prompt in prompts:
+        cache.set(make_cache_key(prompt, cache_namespace(), 150), f"resposta: {prompt}", persist=False)
+    
+    def hit():
+        for prompt in prompts:
+            cache.get(make_cache_key(prompt, cache_namespace(), 150))
+    return hit
+
+def setup_ai_cache_miss(size: int, workdir: str) -> Callable[[], None]:
+    set_provider(FakeProvider(latency=0, seed=0))
+    cache = AICache(path=None)
+    prompts = _ai_prompts(100)
+    
+    def miss():
+        # Caminho completo de uma resposta nova: chave, consulta, provedor e gravação
+        cache.clear()
+        for prompt in prompts:
+            key = make_cache_key(prompt, cache_namespace(), 150)
+            if cache.get(key) is None:
+                cache.set(key, get_gemini_response(prompt, 150), persist=False)
+    return miss
+
+def setup_controller_ai(size: int, workdir: str) -> Callable[[], None]:
+    controller = _controller(10, workdir)
+    set_provider(FakeProvider(latency=0, seed=0))
+    prompts = _ai_prompts(100)
+    
+    def respond():
+        # Metade das requisições já está no cache (preenchido na rodada anterior)
+        controller.ai_cache.clear()
+        for prompt in prompts[:50]:
+            controller.get_ai_response(prompt, 150)
+        for prompt in prompts:
+            controller.get_ai_response(prompt, 150)
+    return respond
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("roadmap_view.build", "views", setup_roadmap_build, needs_flet=True, number=3),
+    Benchmark("roadmap_layout.compute", "views", setup_trail_layout),
+    Benchmark("phase_detail_view.build", "views", setup_phase_detail_build, needs_flet=True),
+    Benchmark("controller.update_view", "controller", setup_update_view, needs_flet=True),
+    Benchmark("controller.get_phase_by_id", "controller", setup_get_phase_by_id, needs_flet=True),
+    Benchmark("roadmap_store.lookup", "controller", setup_store_lookup),
+    Benchmark("json_storage.save", "storage", setup_json_save, number=5),
+    Benchmark("sqlite_storage.save", "storage", setup_sqlite_save, number=5),
+    Benchmark("ai_cache.hit", "ai", setup_ai_cache_hit, sized=False),
+    Benchmark("ai_cache.miss", "ai", setup_ai_cache_miss, sized=False),
+    Benchmark("controller.get_ai_response", "ai", setup_controller_ai, sized=False, needs_flet=True),
+]
+
+# === EXECUÇÃO ===
+
+def measure(operation: Callable[[], None], number: int, repeat: int) -> Dict[str, float]:
+    """
+    Mede uma operação
+    
+    Executa a operação uma vez para aquecer os caches, aumenta o número de
+    execuções por amostra até que cada amostra dure MIN_SAMPLE_SECONDS (para
+    que operações muito rápidas não fiquem abaixo da resolução do relógio) e
+    depois coleta repeat amostras
+    
+    Returns:
+        Mediana e mínimo do tempo por execução, em milissegundos
+    """
+    operation()
+    while number < 100_000:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        if time.perf_counter() - start >= MIN_SAMPLE_SECONDS:
+            break
+        number *= 2
+    
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        samples.append((time.perf_counter() - start) / number * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples)}
+
+def run_suite(sizes: List[int], groups: Optional[List[str]] = None,
+              repeat: int = 5) -> Tuple[Dict[str, Dict[str, float]], List[str]]:
+    """
+    Executa os benchmarks selecionados
+    
+    Args:
+        sizes: Números de fases dos cursos sintéticos
+        groups: Grupos a executar (None executa todos)
+        repeat: Amostras por medida
+        
+    Returns:
+        Tupla (resultados {nome[tamanho]: medidas}, benchmarks ignorados)
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    skipped: List[str] = []
+    original_dir = os.getcwd()
+    
+    with tempfile.TemporaryDirectory(prefix="stuttz-bench-") as workdir:
+        for bench in BENCHMARKS:
+            if groups and bench.group not in groups:
+                continue
+            if bench.needs_flet and not FLET_AVAILABLE:
+                skipped.append(bench.name)
+                continue
+            
+            for size in (sizes if bench.sized else [0]):
+                name = f"{bench.name}[{size}]" if bench.sized else bench.name
+                try:
+                    with _quiet():
+                        operation = bench.setup(size, workdir)
+                        results[name] = measure(operation, bench.number, repeat)
+                finally:
+                    os.chdir(original_dir)
+                print(f"{name:>38} | {results[name]['median_ms']:>12.3f} | {results[name]['min_ms']:>9.3f}")
+    
+    return results, skipped
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> Tuple[List[str], List[str]]:
+    """
+    Compara os resultados com a referência
+    
+    Usa o menor tempo de cada medida, menos sensível a interferências de
+    outros processos que a mediana
+    
+    Returns:
+        Tupla (medidas mais lentas que a referência além da tolerância,
+        medidas sem entrada na referência, que não puderam ser verificadas)
+    """
+    regressions = []
+    missing = []
+    print(f"\n{'mín (ms)':>38} | {'referência':>10} | {'atual':>10} | {'variação':>9}")
+    print("-" * 78)
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:>38} | {'-':>10} | {current['min_ms']:>10.3f} | {'sem ref.':>9} ⚠️")
+            missing.append(name)
+            continue
+        change = current["min_ms"] / reference["min_ms"] - 1 if reference["min_ms"] else 0.0
+        flag = " ⚠️" if change > tolerance else ""
+        print(f"{name:>38} | {reference['min_ms']:>10.3f} | {current['min_ms']:>10.3f} | {change:>+8.0%}{flag}")
+        if change > tolerance:
+            regressions.append(name)
+    return regressions, missing
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos do Stuttz")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000],
+                        help="Números de fases dos cursos sintéticos")
+    parser.add_argument("--only", nargs="+", choices=sorted({b.group for b in BENCHMARKS}),
+                        help="Executar apenas estes grupos")
+    parser.add_argument("--repeat", type=int, default=5, help="Amostras por medida")
+    parser.add_argument("--save", help="Gravar os resultados neste arquivo de referência")
+    parser.add_argument("--compare", help="Comparar com este arquivo de referência")
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="Piora relativa aceita na comparação (1.0 = duas vezes mais lenta)")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="Não falhar na comparação com medidas sem referência ou benchmarks ignorados")
+    args = parser.parse_args()
+    
+    print(f"{'medida':>38} | {'mediana (ms)':>12} | {'mín (ms)':>9}")
+    print("-" * 66)
+    results, skipped = run_suite(args.sizes, args.only, args.repeat)
+    if skipped:
+        print(f"\nIgnorados (Flet não instalado): {', '.join(skipped)}")
+    
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({
+                "meta": {
+                    "date": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "sizes": args.sizes,
+                    "repeat": args.repeat,
+                    "skipped": skipped,
+                },
+                "results": results,
+            }, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"\nReferência gravada em {args.save}")
+    
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions, missing = compare(results, baseline, args.tolerance)
+        
+        # Medidas que não foram comparadas não podem ser consideradas aprovadas
+        unchecked = missing + [f"{name} (ignorado)" for name in skipped]
+        failed = False
+        if unchecked:
+            print(f"\n⚠️ Medidas não verificadas (regrave a referência com --save e as dependências de requirements.txt instaladas): "
+                  f"{', '.join(unchecked)}")
+            failed = not args.allow_missing
+        if regressions:
+            print(f"\n❌ Regressões acima de {args.tolerance:.0%}: {', '.join(regressions)}")
+            failed = True
+        if failed:
+            sys.exit(1)
+        print("\n✅ Nenhuma regressão acima da tolerância")
+
+if __name__ == "__main__":
+    main()
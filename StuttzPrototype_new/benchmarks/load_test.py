@@ -0,0 +1,173 @@
+"""
+TESTE DE CARGA DO MODO SERVIDOR
+Simula N sessões simultâneas navegando pelas fases, respondendo quizzes e
+voltando ao mapa, todas no mesmo processo (como no modo servidor web). As
+sessões usam páginas sem interface (utils.headless), sem um cliente Flet
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.load_test [--sessions 50] [--phases 200] [--rounds 5] [--workers 32]
+    python -m benchmarks.load_test --sessions 5000 --workers 64
+    python -m benchmarks.load_test --ai [--ai-latency 0.2] [--ai-failure-rate 0.05]
+
+Com --ai, cada rodada também pede a dica de estudo e a explicação do quiz ao
+provedor de IA simulado (FakeProvider), sem acesso à rede
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from benchmarks.synthetic import generate_course
+from config import Config
+from controllers.app_controller import AppController
+from models.data_models import PhaseStatus
+from utils.ai_cache import AICache
+from utils.ai_helper import set_provider
+from utils.ai_providers import FakeProvider
+from utils.course_catalog import course_catalog
+from utils.headless import RecordingPage
+from utils.profiles import profile_registry
+
+def start_session(session_index: int, ai_cache: Optional[AICache] = None):
+    """
+    Abre uma sessão simulada sobre uma página sem interface
+    
+    Returns:
+        Tupla (controlador da sessão, tempo de abertura em segundos)
+    """
+    start = time.perf_counter()
+    controller = AppController(RecordingPage(web=True), profile_id=f"load-{session_index}")
+    if ai_cache is not None:
+        # Cache só em memória, para não misturar com o cache real do aplicativo
+        controller.ai_cache = controller.prefetcher.cache = ai_cache
+    controller.get_view_host()
+    return controller, time.perf_counter() - start
+
+def run_session(controller, rounds: int, use_ai: bool = False) -> Dict[str, List[float]]:
+    """
+    Executa as rodadas de uma sessão simulada
+    
+    Em cada rodada a sessão abre a primeira fase desbloqueada, escolhe a
+    resposta correta, confirma (ganhando XP e desbloqueando a próxima fase)
+    e volta ao mapa. Com use_ai, também pede a dica de estudo e a explicação
+    do quiz da fase
+    
+    Returns:
+        Dicionário {ação: tempos em segundos}
+    """
+    local = defaultdict(list)
+    
+    for _ in range(rounds):
+        unlocked = controller.roadmap.phases_with_status(PhaseStatus.UNLOCKED)
+        if not unlocked:
+            break
+        phase = unlocked[0]
+        
+        start = time.perf_counter()
+        controller.handle_phase_click(phase.id)
+        local["open_phase"].append(time.perf_counter() - start)
+        view = controller.view_cache[("phase_detail", phase.id)][0]
+        
+        start = time.perf_counter()
+        view.handle_option_click(phase.quiz.correct_answer_index)
+        view.handle_quiz_submit(None)
+        local["answer_quiz"].append(time.perf_counter() - start)
+        
+        if use_ai:
+            quiz = phase.quiz
+            start = time.perf_counter()
+            controller.generate_study_tip(phase.title, phase.tasks[0] if phase.tasks else "Python")
+            local["ai_tip"].append(time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            controller.get_personalized_explanation(quiz.question, quiz.correct_answer)
+            local["ai_explanation"].append(time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        controller.handle_back_to_roadmap()
+        local["back_to_map"].append(time.perf_counter() - start)
+    
+    controller.shutdown()
+    return local
+
+def percentile(values, fraction: float) -> float:
+    """Percentil simples (valores em segundos, resultado em milissegundos)"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * fraction))
+    return ordered[index] * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga com várias sessões simultâneas")
+    parser.add_argument("--sessions", type=int, default=50, help="Número de sessões simultâneas")
+    parser.add_argument("--workers", type=int, default=32, help="Threads que executam as sessões")
+    parser.add_argument("--phases", type=int, default=200, help="Número de fases do curso sintético")
+    parser.add_argument("--rounds", type=int, default=5, help="Fases completadas por sessão")
+    parser.add_argument("--ai", action="store_true", help="Incluir as requisições de IA (provedor simulado)")
+    parser.add_argument("--ai-latency", type=float, default=Config.AI_FAKE_LATENCY_SECONDS,
+                        help="Latência (s) do provedor simulado")
+    parser.add_argument("--ai-failure-rate", type=float, default=0.0,
+                        help="Fração de chamadas do provedor simulado que falham")
+    parser.add_argument("--verbose", action="store_true", help="Exibir as mensagens do aplicativo")
+    args = parser.parse_args()
+    
+    # Executar em uma pasta temporária para não tocar nos dados reais
+    workdir = tempfile.mkdtemp(prefix="stuttz-load-")
+    os.chdir(workdir)
+    with open(Config.DEFAULT_ROADMAP_FILE, "w", encoding="utf-8") as f:
+        json.dump(generate_course(args.phases), f)
+    
+    profile_registry.enable_server_mode()
+    course_catalog.clear()
+    
+    # A IA sempre usa o provedor simulado: o teste de carga nunca acessa a rede
+    fake_provider = FakeProvider(latency=args.ai_latency, failure_rate=args.ai_failure_rate, seed=0)
+    set_provider(fake_provider)
+    ai_cache = AICache(path=None)
+    
+    timings: Dict[str, List[float]] = defaultdict(list)
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    
+    start = time.perf_counter()
+    with output, ThreadPoolExecutor(max_workers=args.workers) as pool:
+        # Abrir todas as sessões antes de navegar, para que todas disputem os recursos ao mesmo tempo
+        sessions = list(pool.map(lambda i: start_session(i, ai_cache), range(args.sessions)))
+        controllers = [controller for controller, _ in sessions]
+        timings["session_start"] = [elapsed for _, elapsed in sessions]
+        
+        for local in pool.map(lambda c: run_session(c, args.rounds, args.ai), controllers):
+            for action, values in local.items():
+                timings[action].extend(values)
+    elapsed = time.perf_counter() - start
+    profile_registry.close_all()
+    
+    # Atualizações enviadas às páginas e progresso obtido pelas sessões
+    page_stats = [controller.page.stats() for controller in controllers]
+    update_calls = sum(stats["update_calls"] for stats in page_stats)
+    controls_sent = sum(stats["controls_sent"] for stats in page_stats)
+    completed = sum(len(controller.user_data.completed_phases) for controller in controllers)
+    xp = sum(controller.user_data.xp for controller in controllers)
+    
+    actions = sum(len(v) for k, v in timings.items() if k != "session_start")
+    print(f"Sessões: {args.sessions} | Fases: {args.phases} | Rodadas: {args.rounds} | Pasta: {workdir}")
+    print(f"Tempo total: {elapsed:.2f}s | Ações: {actions} | Vazão: {actions / elapsed:.1f} ações/s")
+    print(f"Atualizações da página: {update_calls} ({controls_sent} controles) | "
+          f"Fases completadas: {completed} | XP atual somado: {xp}")
+    if args.ai:
+        print(f"IA simulada: {fake_provider.calls} chamadas | cache: {ai_cache.stats()}")
+    print(f"{'ação':>14} | {'n':>6} | {'média (ms)':>10} | {'p50':>8} | {'p95':>8} | {'p99':>8}")
+    print("-" * 68)
+    for action, values in timings.items():
+        if not values:
+            continue
+        print(f"{action:>14} | {len(values):>6} | {statistics.mean(values) * 1000:>10.2f} | "
+              f"{percentile(values, 0.50):>8.2f} | {percentile(values, 0.95):>8.2f} | {percentile(values, 0.99):>8.2f}")
+
+if __name__ == "__main__":
+    main()
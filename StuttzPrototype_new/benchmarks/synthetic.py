@@ -0,0 +1,88 @@
+"""
+GERADOR DE DADOS SINTÉTICOS
+Cria cursos e perfis de tamanho arbitrário para os benchmarks
+"""
+
+import json
+import os
+from typing import Any, Dict
+from config import Config
+
+def generate_course(num_phases: int, completed: int = 0) -> Dict[str, Any]:
+    """
+    Gera um roadmap sintético com o número de fases informado
+    
+    Args:
+        num_phases: Quantidade de fases do curso
+        completed: Quantidade de fases iniciais já completadas
+        
+    Returns:
+        Dicionário no mesmo formato de roadmap_data.json
+    """
+    phases = []
+    for i in range(1, num_phases + 1):
+        if i <= completed:
+            status = "completed"
+        elif i == completed + 1:
+            status = "unlocked"
+        else:
+            status = "locked"
+        
+        phases.append({
+            "id": i,
+            "title": f"Tópico {i}",
+            "description": f"Descrição sintética da fase {i}",
+            "status": status,
+            "tasks": [f"Tarefa {i}.{t}" for t in range(1, 4)],
+            "quiz": {
+                "question": f"Pergunta da fase {i}?",
+                "options": ["Opção A", "Opção B", "Opção C", "Opção D"],
+                "correct_answer_index": i % 4,
+                "explanation": f"Explicação da fase {i}."
+            }
+        })
+    
+    return {
+        "course_name": f"Curso Sintético ({num_phases} fases)",
+        "total_phases": num_phases,
+        "phases": phases
+    }
+
+def generate_profile(completed: int = 0, name: str = "Estudante") -> Dict[str, Any]:
+    """
+    Gera dados de usuário compatíveis com um curso sintético
+    
+    Args:
+        completed: Quantidade de fases já completadas
+        name: Nome do usuário
+        
+    Returns:
+        Dicionário no mesmo formato de user_data.json
+    """
+    return {
+        "name": name,
+        "level": 1 + completed // 4,
+        "xp": (completed * Config.XP_PER_CORRECT_ANSWER) % Config.XP_PER_LEVEL,
+        "xp_to_next": Config.XP_PER_LEVEL,
+        "streak": 1,
+        "last_activity": None,
+        "completed_phases": list(range(1, completed + 1))
+    }
+
+def write_fixture(directory: str, num_phases: int, completed: int = 0):
+    """
+    Grava um curso e um perfil sintéticos com os nomes de arquivo do aplicativo
+    
+    Com a pasta como diretório atual, o AppController carrega esses dados
+    no lugar de roadmap_data.json e user_data.json
+    
+    Args:
+        directory: Pasta onde os arquivos são criados
+        num_phases: Quantidade de fases do curso
+        completed: Quantidade de fases iniciais já completadas
+    """
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, Config.DEFAULT_ROADMAP_FILE), "w", encoding="utf-8") as f:
+        json.dump(generate_course(num_phases, completed), f)
+    with open(os.path.join(directory, Config.USER_DATA_FILE), "w", encoding="utf-8") as f:
+        json.dump(generate_profile(completed), f)
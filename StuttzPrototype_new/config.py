@@ -23,6 +23,9 @@ class Config:
     TITLE_FONT: Final[str] = "Workbench"  # Fonte para títulos
     INTERFACE_FONT: Final[str] = "Roboto"  # Fonte para interface (será usada como Bold)
     TEXT_FONT: Final[str] = "Roboto"  # Fonte para texto geral
+    ASSETS_DIR: Final[str] = "assets"  # Pasta de arquivos estáticos servidos pelo Flet
+    FONTS_DIR: Final[str] = "fonts"  # Pasta das fontes, dentro de ASSETS_DIR
+    FONT_SUBSET: Final[bool] = True  # Usa as versões reduzidas das fontes, se já tiverem sido geradas
     
     # === TAMANHOS DE FONTE ===
     FONT_SIZE_TITLE: Final[int] = 28     # Títulos principais
@@ -31,8 +34,45 @@ class Config:
     FONT_SIZE_BODY: Final[int] = 16      # Texto normal
     FONT_SIZE_CAPTION: Final[int] = 14   # Texto secundário
     
+    # === CACHE DE VIEWS ===
+    VIEW_CACHE_SIZE: Final[int] = 8  # Número máximo de telas mantidas montadas
+    
+    # === ROADMAP VIRTUALIZADO ===
+    ROADMAP_LAZY_THRESHOLD: Final[int] = 100  # A partir deste número de fases, a lista é construída sob demanda
+    ROADMAP_ITEM_EXTENT: Final[int] = 100  # Altura fixa (em pixels) de cada fase na lista virtualizada
+    ROADMAP_PAGE_SIZE: Final[int] = 30  # Quantidade de fases construídas por vez durante a rolagem
+    
+    # === MAPA VISUAL (CANVAS) ===
+    ROADMAP_CANVAS: Final[bool] = True  # Desenha as fases em uma trilha (canvas) nos cursos que não usam a lista virtualizada
+    ROADMAP_MAP_WIDTH: Final[int] = 360  # Largura (em pixels) do mapa
+    ROADMAP_NODE_SPACING: Final[int] = 110  # Distância vertical entre fases consecutivas na trilha
+    ROADMAP_NODE_RADIUS: Final[int] = 26  # Raio do círculo de cada fase
+    ROADMAP_TRAIL_SWING: Final[float] = 0.28  # Deslocamento lateral máximo da trilha (fração da largura)
+    ROADMAP_LAYOUT_CACHE_SIZE: Final[int] = 16  # Número de layouts de trilha mantidos em cache
+    
     # === CONFIGURAÇÕES DE IA ===
     AI_MODEL: Final[str] = "models/gemini-2.0-flash"  # Modelo do Gemini a ser usado
+    AI_PROVIDER: Final[str] = "gemini"  # Provedor de IA: "gemini", "fake", "record" ou "replay"
+    AI_WARM_UP_ON_START: Final[bool] = True  # Inicializa a IA em segundo plano após a primeira renderização
+    AI_FAKE_LATENCY_SECONDS: Final[float] = 0.2  # Latência das respostas do provedor simulado
+    AI_FAKE_FAILURE_RATE: Final[float] = 0.0  # Fração de chamadas que falham no provedor simulado
+    AI_RECORDINGS_FILE: Final[str] = "ai_recordings.json"  # Respostas gravadas pelo provedor record/replay
+    AI_MAX_WORKERS: Final[int] = 4  # Número máximo de requisições de IA simultâneas
+    AI_CACHE_FILE: Final[str] = "ai_cache.json"  # Arquivo do cache persistente de respostas da IA
+    AI_CACHE_MAX_ENTRIES: Final[int] = 500  # Número máximo de respostas guardadas no cache
+    AI_CACHE_TTL_SECONDS: Final[int] = 7 * 24 * 60 * 60  # Validade de cada resposta (7 dias)
+    AI_TIMEOUT_SECONDS: Final[float] = 15.0  # Tempo máximo de cada tentativa de chamada à API
+    AI_DEADLINE_SECONDS: Final[float] = 30.0  # Tempo máximo de uma requisição, somando as novas tentativas
+    AI_MAX_RETRIES: Final[int] = 3  # Novas tentativas após erros temporários (429, 5xx, timeout)
+    AI_RETRY_BASE_DELAY: Final[float] = 0.5  # Espera base (s) do recuo exponencial entre tentativas
+    AI_RETRY_MAX_DELAY: Final[float] = 8.0  # Espera máxima (s) entre tentativas
+    AI_BREAKER_FAILURE_THRESHOLD: Final[int] = 5  # Falhas seguidas que abrem o disjuntor da IA
+    AI_BREAKER_RESET_SECONDS: Final[float] = 30.0  # Tempo com o disjuntor aberto antes de testar a API
+    WARM_CONCURRENCY: Final[int] = 4  # Requisições simultâneas no pré-aquecimento do cache
+    WARM_RATE_PER_SECOND: Final[float] = 2.0  # Máximo de requisições por segundo no pré-aquecimento
+    PREFETCH_ENABLED: Final[bool] = True  # Gera antecipadamente o conteúdo de IA da próxima fase
+    PREFETCH_BUDGET: Final[int] = 20  # Máximo de requisições antecipadas por sessão
+    STREAM_UPDATE_INTERVAL: Final[float] = 0.1  # Intervalo mínimo (s) entre atualizações do texto em streaming
     
     # === CONFIGURAÇÕES DE GAMIFICAÇÃO ===
     XP_PER_LEVEL: Final[int] = 100  # XP necessário para subir de nível
@@ -80,7 +120,27 @@ class Config:
     
     # === ARQUIVOS E CAMINHOS ===
     DEFAULT_ROADMAP_FILE: Final[str] = "roadmap_data.json"  # Arquivo com dados do roadmap
+    ROADMAP_SNAPSHOT_DIR: Final[str] = ".roadmap_cache"  # Pasta com os snapshots do roadmap já validados
     USER_DATA_FILE: Final[str] = "user_data.json"  # Arquivo com dados do usuário
+    
+    # === PERSISTÊNCIA ===
+    STORAGE_BACKEND: Final[str] = "json"  # Armazenamento do progresso: "json" ou "sqlite"
+    SQLITE_DB_FILE: Final[str] = "stuttz.db"  # Banco de dados usado pelo armazenamento SQLite
+    PROFILES_DIR: Final[str] = "profiles"  # Pasta com os dados dos perfis (exceto o padrão)
+    PROFILE_CACHE_SIZE: Final[int] = 32  # Número de perfis mantidos em memória
+    SAVE_DEBOUNCE_SECONDS: Final[float] = 0.5  # Espera sem novas alterações antes de gravar
+    SAVE_MAX_DELAY_SECONDS: Final[float] = 3.0  # Tempo máximo que uma alteração aguarda para ser gravada
+    
+    # === MODO SERVIDOR ===
+    SERVER_PORT: Final[int] = 8550  # Porta usada ao executar com --web
+    
+    # === DIAGNÓSTICO ===
+    STARTUP_TRACE_FILE: Final[str] = "startup_trace.json"  # Relatório da abertura (STUTTZ_TRACE_STARTUP=1)
+    METRICS_ENABLED: Final[bool] = True  # Registra a latência dos eventos, views e chamadas de IA
+    METRICS_WINDOW: Final[int] = 1024  # Medidas recentes usadas nos percentis do painel
+    METRICS_TRACK_BYTES: Final[bool] = False  # Estima os bytes enviados ao cliente (serializa cada envio)
+    METRICS_EXPORT_DIR: Final[str] = "metrics"  # Pasta dos arquivos exportados pelo painel de diagnóstico
+    DEBUG_PANEL: Final[bool] = True  # Painel de diagnóstico (Ctrl+Shift+D); sempre desativado no modo servidor
 
 class Messages:
     """
@@ -104,6 +164,11 @@ class Messages:
     API_KEY_MISSING: Final[str] = "⚠️ Chave de API não configurada. Algumas funcionalidades estarão limitadas."
     DATA_LOAD_ERROR: Final[str] = "❌ Erro ao carregar dados. Usando configurações padrão."
     
+    # === MENSAGENS DE IA ===
+    AI_LOADING_TIP: Final[str] = "⏳ Gerando dica de estudo..."
+    AI_LOADING_EXPLANATION: Final[str] = "⏳ Gerando explicação..."
+    AI_REQUEST_ERROR: Final[str] = "❌ Não foi possível obter uma resposta da IA. Tente novamente."
+    
     # === OUTRAS MENSAGENS ===
     WELCOME: Final[str] = "👋 Bem-vindo ao Stuttz, sua jornada de aprendizado em Python!"
     TASK_COMPLETED: Final[str] = "✅ Tarefa concluída! Você ganhou {xp} XP!"
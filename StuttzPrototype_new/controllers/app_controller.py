@@ -4,12 +4,44 @@ Este arquivo gerencia todo o funcionamento do app, seguindo o padrão MVC (Model
 """
 
 import flet as ft  # Biblioteca para construção da interface gráfica
-import json  # Módulo para manipulação de dados JSON
-import os  # Módulo para interagir com o sistema operacional
+import sqlite3  # Usado para identificar erros do armazenamento SQLite
+from collections import OrderedDict  # Dicionário ordenado usado no cache de views
+from concurrent.futures import Future  # Representa uma requisição de IA em andamento
 from datetime import datetime  # Classe para manipulação de datas e horários
-from typing import Optional, Dict, Any, List, cast  # Tipos para anotações de tipo
+from typing import Optional, Any, List, Callable, Tuple, cast  # Tipos para anotações de tipo
 from config import Config, Messages  # Importa configurações e mensagens do sistema
-from utils.ai_helper import get_gemini_response  # Importa função para comunicação com a API Gemini
+from models.data_models import PhaseData, PhaseStatus, RoadmapData, UserData  # Modelos de dados
+from models.roadmap_store import RoadmapStore  # Índices das fases do roadmap
+from utils.course_catalog import course_catalog, build_session_roadmap  # Conteúdo compartilhado dos cursos
+from utils.profiles import Profile, profile_registry  # Perfis compartilhados entre sessões
+from utils.storage import DEFAULT_PROFILE, StorageBackend  # Armazenamento do progresso
+from utils.ai_helper import (  # Comunicação com o provedor de IA
+    get_gemini_response, stream_gemini_response, is_error_response, cache_namespace,
+    EMPTY_RESPONSE_MESSAGE
+)
+from utils.ai_cache import get_shared_ai_cache, make_cache_key  # Cache persistente das respostas da IA
+from utils.ai_executor import get_shared_executor  # Executa as chamadas de IA em segundo plano
+from utils.single_flight import get_shared_single_flight  # Agrupa requisições de IA duplicadas
+from utils.metrics import metrics  # Métricas de desempenho (painel de diagnóstico)
+from utils.startup_trace import startup_tracer  # Medição das etapas da abertura
+from utils.ai_prefetcher import AIPrefetcher  # Gera antecipadamente o conteúdo de IA das fases
+from utils.ai_prompts import (  # Prompts compartilhados com o pré-aquecimento do cache
+    build_explanation_prompt, build_study_tip_prompt, EXPLANATION_MAX_TOKENS, STUDY_TIP_MAX_TOKENS
+)
+
+class _StaticView:
+    """
+    View simples que exibe um controle fixo (usada para mensagens de erro)
+    """
+    
+    def __init__(self, control: ft.Control):
+        self.control = control
+    
+    def build(self) -> ft.Control:
+        return self.control
+    
+    def refresh(self) -> List[ft.Control]:
+        return []
 
 class AppController:
     """
@@ -23,14 +55,22 @@ class AppController:
     - Coordenar a comunicação com a IA
     """
     
-    def __init__(self, page: ft.Page):
+    def __init__(self, page: ft.Page, storage: Optional[StorageBackend] = None,
+                 profile_id: str = DEFAULT_PROFILE):
         """
         Inicializa o controlador com a página principal e carrega os dados necessários
         
         Args:
-            page: Objeto Page do Flet que representa a janela principal do aplicativo
+            page: Objeto Page do Flet que representa a janela principal do aplicativo,
+                  ou uma página sem interface de utils.headless (testes de carga)
+            storage: Mecanismo de armazenamento exclusivo deste controlador. Se
+                     omitido, o perfil é obtido do registro de perfis compartilhado
+            profile_id: Identificador do perfil do usuário desta sessão
         """
         self.page = page  # Armazena referência à página principal do Flet
+        # Página sem cliente conectado (utils.headless): os controles nunca são
+        # montados, mas as atualizações continuam passando pela página
+        self.headless = getattr(page, "headless", False)
         
         # === ESTADOS DO APP ===
         self.current_view = "roadmap"  # Define a tela inicial como o roadmap
@@ -46,130 +86,219 @@ class AppController:
         # Variável para armazenar a opção selecionada no quiz atual
         self.selected_option = None
         
-        # === CACHE DE DICAS E EXPLICAÇÕES ===
-        # Armazena dicas já geradas para evitar chamadas repetidas à API
-        self.study_tips_cache = {}  # Formato: {f"{phase_title}:{topic}": "dica gerada"}
-        self.explanations_cache = {}  # Formato: {f"{question}:{answer}": "explicação gerada"}
+        # === CACHE DE VIEWS ===
+        # As views já construídas ficam montadas em um container hospedeiro e
+        # são apenas mostradas/ocultadas na navegação, evitando reconstruir e
+        # reenviar toda a árvore de controles
+        self.view_host: Optional[ft.Column] = None  # Container que hospeda as views
+        # Formato: {(nome_da_view, phase_id): (instância_da_view, controle_raiz)}
+        self.view_cache: "OrderedDict[Tuple[str, Optional[int]], Tuple[Any, ft.Control]]" = OrderedDict()
+        
+        # === CACHE DE RESPOSTAS DA IA ===
+        # Cache persistente compartilhado por dicas, explicações e sugestões (e
+        # por todas as sessões do processo), indexado pelo hash de prompt + modelo
+        # + limite de tokens
+        self.ai_cache = get_shared_ai_cache()
+        
+        # === REQUISIÇÕES DE IA EM SEGUNDO PLANO ===
+        # Pool limitado de threads, compartilhado pelo processo, para que as
+        # chamadas à API não bloqueiem a interface
+        self.ai_executor = get_shared_executor()
+        
+        # Requisições de IA em andamento, para que prompts repetidos (cliques
+        # duplos ou várias sessões) aguardem a mesma chamada à API
+        self.ai_inflight = get_shared_single_flight()
+        
+        # === PRÉ-CARREGAMENTO DA IA ===
+        # Gera em segundo plano o conteúdo de IA das fases que o usuário deve abrir
+        self.prefetcher = AIPrefetcher(self.ai_executor, self.ai_cache, self.get_ai_response)
+        
+        # === PERFIL E ARMAZENAMENTO ===
+        # Sessões do mesmo perfil compartilham os dados em memória e o armazenamento
+        # (JSON ou SQLite, ver Config.STORAGE_BACKEND), evitando gravações conflitantes
+        if storage is not None:
+            self.profile = Profile(profile_id, storage)
+            self._shared_profile = False
+        else:
+            self.profile = profile_registry.acquire(profile_id)
+            self._shared_profile = True
+        self.storage: StorageBackend = self.profile.storage
+        self._closed = False  # Indica se shutdown() já foi chamado
         
         # === CARREGAR DADOS ===
-        # Carrega os dados do usuário e do roadmap ao inicializar
-        self.user_data = self.load_user_data()  # Dados do usuário (progresso, nível, etc.)
-        self.roadmap_data = self.load_roadmap_data()  # Dados do roadmap (fases, quizzes, etc.)
+        # Carrega os dados do perfil apenas na primeira sessão que o utiliza
+        self.profile.load(self.load_user_data, self.load_roadmap_data)
+        self.user_data = self.profile.user_data  # Dados do usuário (progresso, nível, etc.)
+        self.roadmap_data = self.profile.roadmap_data  # Dados do roadmap (fases, quizzes, etc.)
+        # Índices das fases (por ID, posição e status) e das fases completadas
+        self.roadmap: RoadmapStore = self.profile.roadmap
         
         print("✅ Controlador inicializado com sucesso!")
     
-    def load_user_data(self) -> Dict[str, Any]:
+    def load_user_data(self) -> UserData:
         """
-        Carrega dados do usuário do arquivo JSON ou cria novos dados padrão
+        Carrega dados do usuário do armazenamento ou cria novos dados padrão
         
         Returns:
-            Dicionário com os dados do usuário (nome, nível, XP, etc.)
+            Dados do usuário (nome, nível, XP, etc.)
         """
-        # Tentar carregar dados salvos do arquivo user_data.json
-        if os.path.exists("user_data.json"):
-            try:
-                # Abre o arquivo e carrega os dados JSON
-                with open("user_data.json", "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                # Erro específico para problemas de formatação JSON
-                print(f"❌ Erro ao decodificar JSON: {e}")
-            except PermissionError as e:
-                # Erro específico para problemas de permissão de arquivo
-                print(f"❌ Erro de permissão ao acessar o arquivo: {e}")
-            except Exception as e:
-                # Captura outros erros inesperados
-                print(f"❌ Erro inesperado ao carregar dados do usuário: {e}")
+        # Tentar carregar os dados salvos pelo mecanismo de armazenamento
+        with startup_tracer.phase("load_user_data"):
+            user_data = self.storage.load_user_data()
+        if user_data is not None:
+            return user_data
         
         # Criar dados padrão se o arquivo não existir ou ocorrer erro na leitura
         print("ℹ️ Criando dados padrão do usuário")
-        return {
-            "name": "Estudante",  # Nome padrão do usuário
-            "level": 1,  # Nível inicial
-            "xp": 0,  # Experiência inicial
-            "xp_to_next": Config.XP_PER_LEVEL,  # XP necessário para o próximo nível
-            "streak": 0,  # Dias consecutivos de estudo
-            "last_activity": None,  # Data da última atividade
-            "completed_phases": []  # Lista de IDs das fases completadas
-        }
+        return UserData(
+            name="Estudante",  # Nome padrão do usuário
+            level=1,  # Nível inicial
+            xp=0,  # Experiência inicial
+            xp_to_next=Config.XP_PER_LEVEL,  # XP necessário para o próximo nível
+            streak=0,  # Dias consecutivos de estudo
+            last_activity=None,  # Data da última atividade
+            completed_phases=[]  # Lista de IDs das fases completadas
+        )
     
-    def load_roadmap_data(self) -> Dict[str, Any]:
+    def load_roadmap_data(self) -> RoadmapData:
         """
-        Carrega dados do roadmap (para protótipo, usa dados fixos)
+        Carrega dados do roadmap do arquivo Config.DEFAULT_ROADMAP_FILE
+        
+        O conteúdo do curso é obtido do catálogo compartilhado pelo processo
+        (lido e validado uma única vez, ver utils.course_catalog). Sobre ele é
+        criada a camada de progresso desta sessão, com o status de cada fase.
         
         Returns:
-            Dicionário com os dados do roadmap (nome do curso, fases, etc.)
-        """
-        # Nesta versão do protótipo, os dados são definidos diretamente no código
-        # Em uma versão completa, poderiam ser carregados de um arquivo ou banco de dados
-        return {
-            "course_name": "Python para Iniciantes",  # Nome do curso
-            "total_phases": 5,  # Número total de fases
-            "phases": [
-                {
-                    "id": 1,  # Identificador único da fase
-                    "title": "Fundamentos",  # Título da fase
-                    "description": "Aprenda os conceitos básicos do Python",  # Descrição da fase
-                    "status": "unlocked",  # Estado inicial: desbloqueada (primeira fase)
-                    "tasks": [  # Lista de tarefas da fase
-                        "Instalar Python e configurar ambiente",
-                        "Entender variáveis e tipos de dados",
-                        "Criar seu primeiro programa"
-                    ],
-                    "quiz": {  # Quiz associado à fase
-                        "question": "Qual comando exibe texto na tela em Python?",  # Pergunta
-                        "options": ["show()", "print()", "display()", "output()"],  # Opções
-                        "correct_answer_index": 1,  # Índice (0-based) da resposta correta
-                        "explanation": "print() é a função padrão para exibir texto na tela."  # Explicação
-                    }
-                },
-                {
-                    "id": 2,
-                    "title": "Estruturas de Dados",
-                    "description": "Trabalhe com listas, tuplas e dicionários",
-                    "status": "locked",  # Estado inicial: bloqueada (será desbloqueada após completar a fase 1)
-                    "tasks": [
-                        "Criar e manipular listas",
-                        "Entender tuplas e suas características", 
-                        "Trabalhar com dicionários"
-                    ],
-                    "quiz": {
-                        "question": "Como criar uma lista vazia em Python?",
-                        "options": ["list()", "[]", "new list()", "empty()"],
-                        "correct_answer_index": 1,
-                        "explanation": "[] é a sintaxe mais comum e simples."
-                    }
-                },
-                # Adicione mais fases conforme necessário
-            ]
-        }
+            Dados do roadmap (nome do curso, fases, etc.)
+        """
+        with startup_tracer.phase("load_roadmap_data"):
+            course = course_catalog.get(Config.DEFAULT_ROADMAP_FILE)
+            
+            if self.storage.progress_in_course_file:
+                # O progresso é gravado no próprio arquivo do curso
+                return build_session_roadmap(course)
+            
+            # O progresso fica fora do arquivo do curso: aplicar o progresso salvo
+            return build_session_roadmap(course, self.storage.load_phase_states())
     
-    def get_current_view(self) -> ft.Control:
+    def get_view_host(self) -> ft.Column:
         """
-        Retorna a tela atual baseada no estado do controlador
+        Retorna o container que hospeda todas as views montadas
         
-        Este método é responsável por instanciar a view correta com base no valor
-        de self.current_view, permitindo a navegação entre diferentes telas
+        Deve ser usado como conteúdo do container principal da página
         
         Returns:
-            Componente Flet que representa a tela atual
+            Coluna que contém as views já construídas
         """
-        if self.current_view == "roadmap":
+        if self.view_host is None:
+            self.view_host = ft.Column(expand=True, spacing=0)
+            self.activate_current_view()
+        return self.view_host
+    
+    def create_view(self, view_name: str, phase_id: Optional[int]):
+        """
+        Instancia a view correspondente ao nome informado
+        
+        Args:
+            view_name: Nome da view ("roadmap", "phase_detail" ou "debug")
+            phase_id: ID da fase (apenas para a view de detalhes)
+            
+        Returns:
+            Instância da view, com os métodos build() e refresh()
+        """
+        if view_name == "roadmap":
             # Carrega a view do roadmap (mapa de fases)
             from views.roadmap_view import RoadmapView
-            return RoadmapView(self).build()
-        elif self.current_view == "phase_detail":
+            return RoadmapView(self)
+        elif view_name == "debug":
+            # Carrega o painel de diagnóstico (métricas de desempenho)
+            from views.debug_view import DebugView
+            return DebugView(self)
+        elif view_name == "phase_detail":
             # Carrega a view de detalhes da fase
             from views.phase_detail_view import PhaseDetailView
             # Garantir que temos um ID de fase válido antes de instanciar a view
-            if self.active_phase_id is not None:
-                return PhaseDetailView(self, self.active_phase_id).build()
+            if phase_id is not None:
+                return PhaseDetailView(self, phase_id)
             else:
                 # Caso não tenha uma fase ativa, exibe mensagem de erro
-                return ft.Text("Erro: ID de fase inválido")
+                return _StaticView(ft.Text("Erro: ID de fase inválido"))
         else:
             # Caso o nome da view não seja reconhecido
-            return ft.Text("Erro: Tela não encontrada")
+            return _StaticView(ft.Text("Erro: Tela não encontrada"))
+    
+    def activate_current_view(self) -> Tuple[List[ft.Control], bool]:
+        """
+        Torna visível a view atual, reaproveitando-a do cache quando possível
+        
+        Views já construídas são apenas atualizadas com refresh(), que
+        devolve somente os controles cujos dados mudaram. As demais views
+        montadas são ocultadas. O cache é limitado a Config.VIEW_CACHE_SIZE
+        views; as menos usadas recentemente são desmontadas.
+        
+        Returns:
+            Tupla (controles alterados, True se a estrutura do hospedeiro mudou)
+        """
+        host = self.view_host
+        if host is None:
+            host = self.view_host = ft.Column(expand=True, spacing=0)
+        
+        key = (self.current_view, self.active_phase_id if self.current_view == "phase_detail" else None)
+        changed: List[ft.Control] = []
+        structure_changed = False
+        
+        if key in self.view_cache:
+            # View já construída: atualizar apenas o que mudou
+            view, root = self.view_cache[key]
+            self.view_cache.move_to_end(key)
+            changed.extend(view.refresh())
+        else:
+            # Primeira visita: construir e montar a view
+            with metrics.timer("stuttz_view_build_seconds", view=self.current_view):
+                view = self.create_view(*key)
+                root = view.build()
+            root.expand = True
+            self.view_cache[key] = (view, root)
+            host.controls.append(root)
+            structure_changed = True
+            
+            # Desmontar as views menos usadas recentemente
+            while len(self.view_cache) > Config.VIEW_CACHE_SIZE:
+                _, (_, old_root) = self.view_cache.popitem(last=False)
+                host.controls.remove(old_root)
+        
+        # Mostrar apenas a view atual
+        for _, other_root in self.view_cache.values():
+            visible = other_root is root
+            if other_root.visible != visible:
+                other_root.visible = visible
+                changed.append(other_root)
+        
+        return changed, structure_changed
+    
+    def get_current_view(self) -> ft.Control:
+        """
+        Retorna a tela atual baseada no estado do controlador
+        
+        A view é obtida do cache de views (ou construída na primeira visita),
+        permitindo a navegação entre diferentes telas sem reconstruí-las
+        
+        Returns:
+            Componente Flet que representa a tela atual
+        """
+        self.activate_current_view()
+        key = (self.current_view, self.active_phase_id if self.current_view == "phase_detail" else None)
+        return self.view_cache[key][1]
+    
+    def invalidate_views(self):
+        """
+        Descarta todas as views em cache
+        
+        Deve ser chamado quando os dados do roadmap são substituídos por completo
+        """
+        self.view_cache.clear()
+        if self.view_host is not None:
+            self.view_host.controls.clear()
     
     def handle_phase_click(self, phase_id: int):
         """
@@ -189,17 +318,48 @@ class AppController:
             return
         
         # Verificar se a fase está desbloqueada
-        if phase["status"] == "locked":
+        if phase.status is PhaseStatus.LOCKED:
             print("🔒 Fase bloqueada!")
             self.show_message("Esta fase ainda está bloqueada. Complete as fases anteriores primeiro.")
             return
         
+        # Pré-carregar o conteúdo de IA da fase aberta, cancelando o das outras
+        self.prefetcher.cancel_all(keep=phase_id)
+        self.prefetcher.prefetch_phase(phase)
+        
         # Navegar para a fase (atualiza o estado e a interface)
         self.active_phase_id = phase_id  # Define a fase ativa
         self.current_view = "phase_detail"  # Muda para a view de detalhes
         self.reset_quiz_state()  # Reseta o estado do quiz
         self.update_view()  # Atualiza a interface
     
+    def debug_panel_enabled(self) -> bool:
+        """
+        Verifica se esta sessão pode abrir o painel de diagnóstico
+        
+        No modo servidor o painel fica desativado: as métricas e o cache da IA
+        são do processo inteiro, e qualquer visitante poderia vê-los, zerá-los
+        ou gravar arquivos de exportação no servidor
+        """
+        return Config.DEBUG_PANEL and not (self.page.web or profile_registry.server_mode)
+    
+    def handle_show_debug_panel(self):
+        """
+        Abre o painel de diagnóstico com as métricas de desempenho
+        
+        Chamado pelo atalho Ctrl+Shift+D
+        """
+        if not self.debug_panel_enabled():
+            print("⚠️ Painel de diagnóstico desativado nesta sessão")
+            return
+        print("📊 Abrindo painel de diagnóstico")
+        if self.active_phase_id is not None:
+            # Cancelar o pré-carregamento pendente da fase que o usuário deixou
+            self.prefetcher.cancel(self.active_phase_id)
+        self.active_phase_id = None
+        self.current_view = "debug"
+        self.update_view()
+    
     def handle_back_to_roadmap(self):
         """
         Volta para o mapa principal (roadmap)
@@ -207,11 +367,28 @@ class AppController:
         Este método é chamado quando o usuário clica no botão "Voltar"
         """
         print("⬅️ Voltando ao mapa")
+        if self.active_phase_id is not None:
+            # Cancelar o pré-carregamento pendente da fase que o usuário deixou
+            self.prefetcher.cancel(self.active_phase_id)
         self.active_phase_id = None  # Remove a fase ativa
         self.current_view = "roadmap"  # Muda para a view do roadmap
         self.reset_quiz_state()  # Reseta o estado do quiz
         self.update_view()  # Atualiza a interface
     
+    def prefetch_next_phase(self, phase_id: int):
+        """
+        Pré-carrega o conteúdo de IA da fase seguinte a phase_id
+        
+        Chamado quando uma fase é concluída e a próxima é desbloqueada, pois
+        é ela que o usuário provavelmente vai abrir em seguida
+        
+        Args:
+            phase_id: ID da fase concluída
+        """
+        next_phase = self.roadmap.next_phase(phase_id)
+        if next_phase and next_phase.status is not PhaseStatus.LOCKED:
+            self.prefetcher.prefetch_phase(next_phase)
+    
     def reset_quiz_state(self):
         """
         Reseta o estado do quiz para o estado inicial
@@ -226,47 +403,40 @@ class AppController:
         }
         self.selected_option = None  # Reseta a opção selecionada
     
+    @metrics.timed("stuttz_update_view_seconds")
     def update_view(self):
         """
         Atualiza a interface para refletir o estado atual
         
-        Este método é responsável por reconstruir a interface quando
-        o estado do aplicativo muda
+        Em vez de reconstruir a interface, mostra a view atual a partir do
+        cache e envia apenas os controles que realmente mudaram
         """
         try:
-            # Verifica se a página tem o container principal
-            if not hasattr(self.page, 'controls') or not self.page.controls:
-                print("Estrutura de controles não encontrada para atualizar!")
+            # Verifica se a página tem o container hospedeiro das views
+            if self.view_host is None or (self.view_host.page is None and not self.headless):
+                print("Container de views não encontrado para atualizar!")
                 return
-                
-            # Obtém o container principal (primeiro controle)
-            if len(self.page.controls) == 0:
-                print("A página não possui controles para atualizar")
-                return
-                
-            container = self.page.controls[0]
             
-            # Verifica se o controle é um Container
-            if not isinstance(container, ft.Container):
-                print(f"O controle principal não é um Container, é um {type(container).__name__}")
-                return
-                
-            # Atualiza o conteúdo do container com a nova view
-            container.content = self.get_current_view()
+            # Ativa a view atual e obtém os controles alterados
+            changed, structure_changed = self.activate_current_view()
             
             # Registra informações sobre a atualização
             print(f"Atualizando para a view: {self.current_view}")
             if self.current_view == "phase_detail":
                 print(f"Mostrando fase {self.active_phase_id}")
-                
-            # Atualiza a página para refletir as mudanças
-            self.page.update()
+            
+            if structure_changed:
+                # Uma view foi montada ou desmontada: enviar o hospedeiro
+                self.page.update(self.view_host)
+            elif changed:
+                # Enviar apenas os controles alterados
+                self.page.update(*changed)
             
         except Exception as e:
             # Captura qualquer erro durante a atualização
             print(f"Erro ao atualizar view: {e}")
     
-    def get_phase_by_id(self, phase_id: int) -> Optional[Dict[str, Any]]:
+    def get_phase_by_id(self, phase_id: int) -> Optional[PhaseData]:
         """
         Encontra uma fase pelo ID
         
@@ -274,7 +444,7 @@ class AppController:
             phase_id: ID da fase a ser encontrada
             
         Returns:
-            Dicionário com os dados da fase ou None se não encontrada
+            Dados da fase ou None se não encontrada
         """
         # Validar o tipo do ID
         if not isinstance(phase_id, int):
@@ -286,10 +456,10 @@ class AppController:
             print(f"❌ ID de fase inválido: {phase_id} deve ser maior que zero")
             return None
             
-        # Percorre todas as fases procurando pelo ID especificado
-        for phase in self.roadmap_data["phases"]:
-            if phase["id"] == phase_id:
-                return phase
+        # Consulta o índice de fases por ID
+        phase = self.roadmap.get_phase(phase_id)
+        if phase is not None:
+            return phase
                 
         # Fase não encontrada
         print(f"❌ Fase com ID {phase_id} não encontrada")
@@ -313,64 +483,260 @@ class AppController:
     
     def save_user_data(self):
         """
-        Salva dados do usuário no arquivo JSON
+        Salva todos os dados do usuário
         
-        Persiste os dados do usuário para que possam ser
-        recuperados em sessões futuras
+        Com o armazenamento JSON, a gravação é feita em segundo plano:
+        alterações próximas são agrupadas em uma única escrita atômica
+        (arquivo temporário + fsync + renomeação)
         
         Returns:
-            bool: True se os dados foram salvos com sucesso, False caso contrário
+            bool: True se os dados foram salvos (ou agendados) com sucesso
+        """
+        return self._run_storage(self.storage.save_user_data, self.user_data)
+
+    def save_roadmap_data(self):
+        """
+        Salva o progresso de todas as fases do roadmap
+        
+        Returns:
+            bool: True se os dados foram salvos (ou agendados) com sucesso
+        """
+        return self._run_storage(self.storage.save_roadmap_data, self.roadmap_data)
+    
+    def save_user_fields(self, *fields: str):
+        """
+        Salva apenas alguns campos do usuário (ex: "xp", "level")
+        
+        Args:
+            *fields: Nomes dos campos alterados
+            
+        Returns:
+            bool: True se os dados foram salvos (ou agendados) com sucesso
+        """
+        return self._run_storage(self.storage.update_user, {field: getattr(self.user_data, field) for field in fields})
+    
+    def save_phase_progress(self, phase_id: int):
+        """
+        Salva o progresso de uma única fase
+        
+        Args:
+            phase_id: ID da fase alterada
+            
+        Returns:
+            bool: True se os dados foram salvos (ou agendados) com sucesso
+        """
+        phase = self.roadmap.get_phase(phase_id)
+        if phase is None:
+            return False
+        return self._run_storage(
+            self.storage.update_phase,
+            phase_id,
+            phase.status.value,
+            phase.quiz_completed,
+            self.roadmap.is_completed(phase_id)
+        )
+    
+    def record_quiz_attempt(self, phase_id: int, selected_index: int, correct: bool):
+        """
+        Registra uma tentativa de resposta de quiz no histórico
+        
+        Args:
+            phase_id: ID da fase do quiz
+            selected_index: Índice da opção escolhida
+            correct: Se a resposta estava correta
+        """
+        self._run_storage(self.storage.record_quiz_attempt, phase_id, selected_index, correct)
+    
+    def _run_storage(self, operation: Callable[..., Any], *args) -> bool:
+        """
+        Executa uma operação de gravação tratando os erros de armazenamento
+        
+        Returns:
+            bool: True se a operação foi concluída sem erros, False caso contrário
         """
         try:
-            # Salva os dados no arquivo user_data.json
-            with open("user_data.json", "w", encoding="utf-8") as f:
-                json.dump(self.user_data, f, indent=2, ensure_ascii=False)
-            print("💾 Dados salvos com sucesso!")
+            operation(*args)
             return True
         except PermissionError as e:
             # Erro específico para problemas de permissão de arquivo
             print(f"❌ Erro de permissão ao salvar dados: {e}")
-            return False
-        except IOError as e:
-            # Erro específico para problemas de entrada/saída
+        except (IOError, sqlite3.Error) as e:
+            # Erro específico para problemas de entrada/saída ou do banco de dados
             print(f"❌ Erro de I/O ao salvar dados: {e}")
-            return False
         except Exception as e:
             # Captura outros erros inesperados
             print(f"❌ Erro inesperado ao salvar dados: {e}")
-            return False
-
-    def save_roadmap_data(self):
+        return False
+    
+    def flush_data(self) -> bool:
         """
-        Salva dados do roadmap no arquivo JSON
-        
-        Persiste os dados do roadmap para que possam ser
-        recuperados em sessões futuras
+        Grava imediatamente todos os dados com gravação pendente
         
         Returns:
             bool: True se os dados foram salvos com sucesso, False caso contrário
         """
-        try:
-            # Salva os dados no arquivo roadmap_data.json
-            with open(Config.DEFAULT_ROADMAP_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.roadmap_data, f, indent=2, ensure_ascii=False)
-            print("💾 Dados do roadmap salvos com sucesso!")
-            return True
-        except PermissionError as e:
-            # Erro específico para problemas de permissão de arquivo
-            print(f"❌ Erro de permissão ao salvar dados do roadmap: {e}")
-            return False
-        except IOError as e:
-            # Erro específico para problemas de entrada/saída
-            print(f"❌ Erro de I/O ao salvar dados do roadmap: {e}")
-            return False
-        except Exception as e:
-            # Captura outros erros inesperados
-            print(f"❌ Erro inesperado ao salvar dados do roadmap: {e}")
-            return False
+        success = self.storage.flush()
+        if success:
+            print("💾 Dados salvos com sucesso!")
+        return success
+    
+    def shutdown(self):
+        """
+        Encerra o controlador ao fechar o aplicativo
+        
+        Grava os dados pendentes do perfil e do cache da IA. O pool de IA é
+        compartilhado pelo processo e continua disponível para as outras sessões
+        """
+        if self._closed:
+            return
+        self._closed = True
+        
+        # Cancelar as requisições antecipadas que ainda não começaram
+        self.prefetcher.cancel_all()
+        
+        # Gravar as respostas da IA ainda pendentes (o cache é compartilhado pelo processo)
+        self.ai_cache.flush()
+        
+        if self._shared_profile:
+            # Grava os dados do perfil, que continua disponível para outras sessões
+            profile_registry.release(self.profile)
+        else:
+            self.storage.close()
+        print("👋 Controlador encerrado")
 
     # Métodos relacionados à integração com IA
 
+    def get_ai_response(self, prompt: str, max_tokens: int) -> str:
+        """
+        Obtém uma resposta da IA, consultando antes o cache persistente
+        
+        A chave do cache é o hash do prompt, do modelo (Config.AI_MODEL) e do
+        limite de tokens. Mensagens de erro nunca são armazenadas.
+        
+        Args:
+            prompt: O texto enviado ao modelo
+            max_tokens: Limite máximo de tokens na resposta
+            
+        Returns:
+            A resposta do modelo (do cache ou da API)
+        """
+        cache_key = make_cache_key(prompt, cache_namespace(), max_tokens)
+        
+        # Verificar se já existe no cache
+        cached = self.ai_cache.get(cache_key)
+        if cached is not None:
+            print("✅ Usando resposta da IA em cache")
+            return cached
+        
+        # Chamadas simultâneas para o mesmo prompt compartilham uma única requisição
+        response, shared = self.ai_inflight.do(cache_key, self._fetch_ai_response, cache_key, prompt, max_tokens)
+        if shared:
+            print("🔗 Resposta da IA compartilhada com uma requisição em andamento")
+        return response
+
+    def _fetch_ai_response(self, cache_key: str, prompt: str, max_tokens: int) -> str:
+        """
+        Envia o prompt à API e armazena a resposta (executado uma vez por chave)
+        
+        Args:
+            cache_key: Chave do prompt no cache
+            prompt: O texto enviado ao modelo
+            max_tokens: Limite máximo de tokens na resposta
+            
+        Returns:
+            A resposta do modelo
+        """
+        # Outra requisição pode ter preenchido o cache logo antes desta começar
+        # (a consulta anterior já foi contada nas estatísticas do cache)
+        cached = self.ai_cache.get(cache_key, count=False)
+        if cached is not None:
+            return cached
+        
+        # Envia o prompt para a API do Gemini
+        response = get_gemini_response(prompt, max_tokens=max_tokens)
+        
+        # Armazenar no cache apenas respostas válidas
+        if not is_error_response(response):
+            self.ai_cache.set(cache_key, response)
+        
+        return response
+
+    def stream_ai_response(self, prompt: str, max_tokens: int, on_chunk: Callable[[str], None]) -> str:
+        """
+        Obtém uma resposta da IA em partes, consultando antes o cache persistente
+        
+        Cada trecho recebido é entregue imediatamente a on_chunk. Se a resposta
+        já estiver no cache, ela é entregue de uma só vez.
+        
+        Args:
+            prompt: O texto enviado ao modelo
+            max_tokens: Limite máximo de tokens na resposta
+            on_chunk: Callback chamado com cada trecho da resposta
+            
+        Returns:
+            A resposta completa
+        """
+        cache_key = make_cache_key(prompt, cache_namespace(), max_tokens)
+        
+        # Verificar se já existe no cache
+        cached = self.ai_cache.get(cache_key)
+        if cached is not None:
+            print("✅ Usando resposta da IA em cache")
+            on_chunk(cached)
+            return cached
+        
+        # Chamadas simultâneas para o mesmo prompt compartilham uma única requisição;
+        # quem aguarda recebe a resposta completa de uma só vez
+        response, shared = self.ai_inflight.do(
+            cache_key, self._fetch_ai_stream, cache_key, prompt, max_tokens, on_chunk
+        )
+        if shared:
+            on_chunk(response)
+        return response
+
+    def _fetch_ai_stream(self, cache_key: str, prompt: str, max_tokens: int,
+                         on_chunk: Callable[[str], None]) -> str:
+        """
+        Recebe a resposta da API em partes e a armazena (executado uma vez por chave)
+        
+        Args:
+            cache_key: Chave do prompt no cache
+            prompt: O texto enviado ao modelo
+            max_tokens: Limite máximo de tokens na resposta
+            on_chunk: Callback chamado com cada trecho da resposta
+            
+        Returns:
+            A resposta completa, ou uma mensagem de erro se o modelo não retornou texto
+            
+        Raises:
+            Exception: Se o stream falhar depois de algum trecho já ter sido
+            entregue (a resposta incompleta não é repassada nem guardada)
+        """
+        # Outra requisição pode ter preenchido o cache logo antes desta começar
+        # (a consulta anterior já foi contada nas estatísticas do cache)
+        cached = self.ai_cache.get(cache_key, count=False)
+        if cached is not None:
+            on_chunk(cached)
+            return cached
+        
+        # Receber a resposta da API do Gemini em partes; uma falha no meio do
+        # stream é repassada ao chamador (e a quem aguarda a mesma requisição)
+        chunks: List[str] = []
+        for chunk in stream_gemini_response(prompt, max_tokens=max_tokens):
+            chunks.append(chunk)
+            on_chunk(chunk)
+        response = "".join(chunks)
+        
+        # Stream sem nenhum texto: tratar como erro para que a tela use o conteúdo estático
+        if not response.strip():
+            return EMPTY_RESPONSE_MESSAGE
+        
+        # Armazenar no cache apenas respostas válidas
+        if not is_error_response(response):
+            self.ai_cache.set(cache_key, response)
+        
+        return response
+
     def get_personalized_explanation(self, question: str, correct_answer: str) -> str:
         """
         Obtém uma explicação personalizada para uma resposta de quiz usando IA
@@ -386,31 +752,11 @@ class AppController:
         Returns:
             Uma explicação didática gerada pela IA
         """
-        # Criar chave de cache
-        cache_key = f"{question}:{correct_answer}"
-        
-        # Verificar se já existe no cache
-        if cache_key in self.explanations_cache:
-            print(f"✅ Usando explicação em cache para '{question}'")
-            return self.explanations_cache[cache_key]
-            
         # Constrói o prompt para a IA com instruções específicas
-        prompt = f"""
-        Explique a seguinte pergunta e resposta de forma didática para um estudante:
+        prompt = build_explanation_prompt(question, correct_answer)
         
-        Pergunta: {question}
-        Resposta correta: {correct_answer}
-        
-        Explicação (máximo 3 parágrafos, linguagem acessível):
-        """
-        
-        # Envia o prompt para a API do Gemini e retorna a resposta
-        explanation = get_gemini_response(prompt, max_tokens=300)
-        
-        # Armazenar no cache
-        self.explanations_cache[cache_key] = explanation
-        
-        return explanation
+        # Envia o prompt para a API do Gemini (ou usa o cache) e retorna a resposta
+        return self.get_ai_response(prompt, max_tokens=EXPLANATION_MAX_TOKENS)
 
     # Método de alias para manter compatibilidade
     def generate_explanation(self, question: str, correct_answer: str) -> str:
@@ -442,30 +788,77 @@ class AppController:
         Returns:
             Uma dica de estudo curta e prática gerada pela IA
         """
-        # Criar chave de cache
-        cache_key = f"{phase_title}:{topic}"
-        
-        # Verificar se já existe no cache
-        if cache_key in self.study_tips_cache:
-            print(f"✅ Usando dica em cache para '{cache_key}'")
-            return self.study_tips_cache[cache_key]
-        
         # Constrói o prompt para a IA com instruções específicas
-        prompt = f"""
-        Por favor, forneça uma dica de estudo prática e curta para alguém 
-        estudando '{phase_title}', especificamente sobre '{topic}'.
+        prompt = build_study_tip_prompt(phase_title, topic)
         
-        A dica deve ter no máximo 2 frases e fornecer uma sugestão 
-        concreta e útil para melhorar o aprendizado.
+        # Envia o prompt para a API do Gemini (ou usa o cache) e retorna a resposta
+        return self.get_ai_response(prompt, max_tokens=STUDY_TIP_MAX_TOKENS)
+
+    def generate_study_tip_async(self, phase_title: str, topic: str,
+                                 on_done: Callable[[str], None],
+                                 on_error: Optional[Callable[[BaseException], None]] = None) -> Future:
         """
+        Versão assíncrona de generate_study_tip
         
-        # Envia o prompt para a API do Gemini e retorna a resposta
-        tip = get_gemini_response(prompt, max_tokens=150)
+        A dica é gerada em uma thread do pool de IA e entregue ao callback
+        quando estiver pronta, sem bloquear o manipulador de eventos da interface.
         
-        # Armazenar no cache
-        self.study_tips_cache[cache_key] = tip
+        Args:
+            phase_title: Título da fase atual
+            topic: Tópico específico dentro da fase
+            on_done: Callback chamado com a dica gerada
+            on_error: Callback chamado caso a requisição falhe
+            
+        Returns:
+            Future que representa a requisição em andamento
+        """
+        return self.ai_executor.submit(
+            self.generate_study_tip, phase_title, topic,
+            on_done=on_done, on_error=on_error
+        )
+    
+    def generate_explanation_async(self, question: str, correct_answer: str,
+                                   on_done: Callable[[str], None],
+                                   on_error: Optional[Callable[[BaseException], None]] = None) -> Future:
+        """
+        Versão assíncrona de generate_explanation
         
-        return tip
+        Args:
+            question: A pergunta do quiz
+            correct_answer: A resposta correta do quiz
+            on_done: Callback chamado com a explicação gerada
+            on_error: Callback chamado caso a requisição falhe
+            
+        Returns:
+            Future que representa a requisição em andamento
+        """
+        return self.ai_executor.submit(
+            self.generate_explanation, question, correct_answer,
+            on_done=on_done, on_error=on_error
+        )
+
+    def stream_explanation_async(self, question: str, correct_answer: str,
+                                 on_chunk: Callable[[str], None],
+                                 on_done: Callable[[str], None],
+                                 on_error: Optional[Callable[[BaseException], None]] = None) -> Future:
+        """
+        Gera a explicação de uma resposta de quiz em partes, em segundo plano
+        
+        Args:
+            question: A pergunta do quiz
+            correct_answer: A resposta correta do quiz
+            on_chunk: Callback chamado com cada trecho da explicação
+            on_done: Callback chamado com a explicação completa
+            on_error: Callback chamado caso a requisição falhe
+            
+        Returns:
+            Future que representa a requisição em andamento
+        """
+        prompt = build_explanation_prompt(question, correct_answer)
+        return self.ai_executor.submit(
+            self.stream_ai_response, prompt, EXPLANATION_MAX_TOKENS, on_chunk,
+            on_done=on_done, on_error=on_error
+        )
 
     def suggest_next_steps(self) -> str:
         """
@@ -477,15 +870,14 @@ class AppController:
         Returns:
             Uma sugestão de próximos passos gerada pela IA
         """
-        # Identificar fases completas e atuais
-        completed_phases = [p for p in self.roadmap_data["phases"] 
-                            if p["id"] in self.user_data["completed_phases"]]
-        current_phases = [p for p in self.roadmap_data["phases"] 
-                        if p["status"] == "unlocked" and p["id"] not in self.user_data["completed_phases"]]
+        # Identificar fases completas e atuais usando os índices do roadmap
+        completed_phases = self.roadmap.completed_phases()
+        current_phases = [p for p in self.roadmap.phases_with_status(PhaseStatus.UNLOCKED)
+                          if not self.roadmap.is_completed(p.id)]
         
         # Obter títulos das fases para incluir no prompt
-        completed_titles = [p["title"] for p in completed_phases]
-        current_titles = [p["title"] for p in current_phases]
+        completed_titles = [p.title for p in completed_phases]
+        current_titles = [p.title for p in current_phases]
         
         # Construir prompt com o contexto do progresso do usuário
         prompt = f"""
@@ -498,8 +890,8 @@ class AppController:
         pode consultar para melhorar seu aprendizado nos tópicos atuais.
         """
         
-        # Envia o prompt para a API do Gemini e retorna a resposta
-        return get_gemini_response(prompt, max_tokens=200)
+        # Envia o prompt para a API do Gemini (ou usa o cache) e retorna a resposta
+        return self.get_ai_response(prompt, max_tokens=200)
 
     def update_streak(self):
         """
@@ -521,7 +913,7 @@ class AppController:
         today = datetime.now().date()
         
         # Obter data da última atividade
-        last_activity = self.user_data["last_activity"]
+        last_activity = self.user_data.last_activity
         
         # Converter para objeto date se não for None
         if last_activity:
@@ -532,12 +924,12 @@ class AppController:
                 last_activity = None
         
         # Atualizar data da última atividade
-        self.user_data["last_activity"] = today.isoformat()
+        self.user_data.last_activity = today.isoformat()
         
         # Caso seja o primeiro acesso
         if last_activity is None:
-            self.user_data["streak"] = 1
-            self.save_user_data()
+            self.user_data.streak = 1
+            self.save_user_fields("streak", "last_activity")
             return True
             
         # Calcular diferença de dias
@@ -549,12 +941,12 @@ class AppController:
             
         # Dia seguinte: aumentar streak
         elif days_diff == 1:
-            self.user_data["streak"] += 1
-            self.save_user_data()
+            self.user_data.streak += 1
+            self.save_user_fields("streak", "last_activity")
             return True
             
         # Mais de um dia: resetar streak
         else:
-            self.user_data["streak"] = 1
-            self.save_user_data()
+            self.user_data.streak = 1
+            self.save_user_fields("streak", "last_activity")
             return False
@@ -3,9 +3,56 @@ STUTTZ - ARQUIVO PRINCIPAL
 Este arquivo inicia o aplicativo e configura a interface
 """
 
+from utils.startup_trace import startup_tracer, PROCESS_START  # Medição da abertura (importado primeiro)
+import atexit  # Permite executar código ao encerrar o processo
+import os  # Permite ler variáveis de ambiente
+import sys  # Permite ler os argumentos da linha de comando
+import uuid  # Gera identificadores para novos perfis
 import flet as ft  # Importa a biblioteca Flet para criação da interface gráfica
 from controllers.app_controller import AppController  # Importa o controlador principal do aplicativo
 from config import Config  # Importa as configurações globais do aplicativo
+from utils.profiles import profile_registry  # Registro de perfis compartilhado pelo processo
+from utils.storage import DEFAULT_PROFILE  # Perfil usado no aplicativo de desktop
+from utils.ai_helper import start_warm_up  # Inicialização da IA em segundo plano
+from utils.fonts import app_font_families, resolve_fonts  # Fontes locais em assets/fonts
+from utils.metrics import instrument_page  # Medição dos bytes enviados ao cliente
+
+# Tempo gasto importando os módulos do aplicativo (inclui o Flet)
+startup_tracer.mark("imports", since=PROCESS_START)
+
+# Chave usada para guardar o ID do perfil no navegador
+PROFILE_STORAGE_KEY = "stuttz.profile_id"
+
+def resolve_profile_id(page: ft.Page) -> str:
+    """
+    Determina o perfil do usuário desta sessão
+    
+    Ordem de prioridade:
+    1. Variável de ambiente STUTTZ_PROFILE
+    2. No modo web, o ID guardado no navegador (um novo é criado na primeira visita)
+    3. O perfil padrão
+    
+    Args:
+        page: Objeto Page do Flet da sessão
+        
+    Returns:
+        Identificador do perfil
+    """
+    profile_id = os.getenv("STUTTZ_PROFILE")
+    if profile_id:
+        return profile_id
+    
+    if getattr(page, "web", False):
+        try:
+            profile_id = page.client_storage.get(PROFILE_STORAGE_KEY)
+            if not profile_id:
+                profile_id = uuid.uuid4().hex
+                page.client_storage.set(PROFILE_STORAGE_KEY, profile_id)
+            return profile_id
+        except Exception as e:
+            print(f"⚠️ Não foi possível acessar o armazenamento do navegador: {e}")
+    
+    return DEFAULT_PROFILE
 
 def main(page: ft.Page):
     """
@@ -15,41 +62,69 @@ def main(page: ft.Page):
         page: Objeto Page do Flet que representa a janela principal do aplicativo
     """
     
-    # === CONFIGURAÇÕES DA PÁGINA ===
-    page.title = Config.APP_NAME  # Define o título da janela do aplicativo
-    page.theme_mode = ft.ThemeMode.LIGHT  # Define o tema claro para o aplicativo
-    page.bgcolor = Config.COLORS['background_dark']  # Define a cor de fundo da página
-    page.vertical_alignment = ft.MainAxisAlignment.START  # Alinha os elementos no topo
-    page.horizontal_alignment = ft.CrossAxisAlignment.CENTER  # Centraliza os elementos horizontalmente
-    page.padding = 10  # Adiciona um espaçamento interno de 10 pixels
-    
-    # Configurar as fontes
-    print("🔍 Configurando as fontes...")
-    try:
-        page.fonts = {
-            "Workbench": "https://fonts.googleapis.com/css2?family=Workbench&display=swap",
-            "Roboto": "https://fonts.googleapis.com/css2?family=Roboto:wght@400;700&display=swap"
-        }
-        page.theme = ft.Theme(font_family="Roboto")
-        print("✅ Fontes configuradas. Serão carregadas quando o aplicativo iniciar.")
-    except Exception as e:
-        print(f"⚠️ Erro ao configurar fontes: {e}")
-    
-    # Configurar tamanho da janela
-    page.window.width = 480  # Define a largura da janela aumentada
-    page.window.height = 800  # Define a altura da janela aumentada
-    page.window.resizable = False  # Impede que o usuário redimensione a janela
+    with startup_tracer.phase("page_setup"):
+        # === CONFIGURAÇÕES DA PÁGINA ===
+        page.title = Config.APP_NAME  # Define o título da janela do aplicativo
+        page.theme_mode = ft.ThemeMode.LIGHT  # Define o tema claro para o aplicativo
+        page.bgcolor = Config.COLORS['background_dark']  # Define a cor de fundo da página
+        page.vertical_alignment = ft.MainAxisAlignment.START  # Alinha os elementos no topo
+        page.horizontal_alignment = ft.CrossAxisAlignment.CENTER  # Centraliza os elementos horizontalmente
+        page.padding = 10  # Adiciona um espaçamento interno de 10 pixels
+        
+        # Configurar as fontes locais (assets/fonts): a primeira renderização não depende da internet
+        print("🔍 Configurando as fontes...")
+        try:
+            page.fonts = resolve_fonts(app_font_families())
+            if Config.TEXT_FONT in page.fonts:
+                page.theme = ft.Theme(font_family=Config.TEXT_FONT)
+            print(f"✅ Fontes locais configuradas: {', '.join(page.fonts) or 'nenhuma (usando a fonte padrão)'}")
+        except Exception as e:
+            print(f"⚠️ Erro ao configurar fontes: {e}")
+        
+        # Configurar tamanho da janela
+        page.window.width = 480  # Define a largura da janela aumentada
+        page.window.height = 800  # Define a altura da janela aumentada
+        page.window.resizable = False  # Impede que o usuário redimensione a janela
     
     # === CRIAR O CONTROLADOR ===
     # O controlador é o "cérebro" que gerencia tudo
-    controller = AppController(page)  # Instancia o controlador principal, passando a página
+    # Cada sessão carrega apenas o perfil do seu usuário
+    with startup_tracer.phase("controller_init"):
+        controller = AppController(page, profile_id=resolve_profile_id(page))
+    
+    # Gravar os dados pendentes quando a sessão terminar
+    if page.web or profile_registry.server_mode:
+        # No navegador, on_disconnect também dispara em quedas breves da conexão, e a
+        # sessão pode se reconectar: encerrar apenas quando a sessão expira
+        page.on_close = lambda e: controller.shutdown()
+    else:
+        # Na janela do aplicativo, a desconexão significa que a janela foi fechada
+        page.on_disconnect = lambda e: controller.shutdown()
+    
+    # === PAINEL DE DIAGNÓSTICO ===
+    # Ctrl+Shift+D abre o painel com as métricas de desempenho (nunca no modo servidor)
+    if controller.debug_panel_enabled():
+        def handle_keyboard(e: ft.KeyboardEvent):
+            if e.ctrl and e.shift and e.key.upper() == "D":
+                controller.handle_show_debug_panel()
+        page.on_keyboard_event = handle_keyboard
+    
+    # Medir os bytes enviados ao cliente (serializa cada envio, por isso é opcional)
+    if Config.METRICS_TRACK_BYTES or os.getenv("STUTTZ_METRICS_BYTES") == "1":
+        if instrument_page(page):
+            print("📊 Medindo os bytes enviados ao cliente")
     
     # === ATUALIZAR STREAK DO USUÁRIO ===
     # Atualiza o streak (dias consecutivos) do usuário
-    streak_increased = controller.update_streak()
-    if streak_increased and controller.user_data["streak"] > 1:
+    with startup_tracer.phase("update_streak"):
+        streak_increased = controller.update_streak()
+    if streak_increased and controller.user_data.streak > 1:
         # Mostrar mensagem de streak apenas se aumentou e não é o primeiro dia
-        controller.show_message(f"🔥 Sequência de {controller.user_data['streak']} dias!")
+        controller.show_message(f"🔥 Sequência de {controller.user_data.streak} dias!")
+    
+    # === CONSTRUIR A TELA INICIAL ===
+    with startup_tracer.phase("view_build"):
+        view_host = controller.get_view_host()  # Container com as views mantidas pelo controlador
     
     # === CONTAINER PRINCIPAL ===
     # Este é o "livro" que contém toda a interface
@@ -57,7 +132,7 @@ def main(page: ft.Page):
     height = page.height * 0.95 if page.height else 760  # Calcula a altura responsiva
     
     main_container = ft.Container(
-        content=controller.get_current_view(),  # Obtém a view atual do controlador
+        content=view_host,  # Container com as views mantidas pelo controlador
         width=width,  # Define a largura calculada
         height=height,  # Define a altura calculada
         bgcolor=Config.COLORS['parchment'],  # Define a cor de fundo como papel antigo
@@ -73,10 +148,29 @@ def main(page: ft.Page):
     )
     
     # === ADICIONAR À PÁGINA ===
-    page.add(main_container)  # Adiciona o container principal à página
-    page.update()  # Atualiza a interface para exibir o conteúdo
+    with startup_tracer.phase("first_page_update"):
+        page.add(main_container)  # Adiciona o container principal à página
+        page.update()  # Atualiza a interface para exibir o conteúdo
+    
+    # Gravar o relatório da abertura (apenas com STUTTZ_TRACE_STARTUP definida)
+    startup_tracer.finish()
+    
+    # === INICIALIZAR A IA ===
+    # O SDK do Gemini só é carregado depois da primeira renderização, em segundo
+    # plano, para não atrasar a abertura do aplicativo
+    if Config.AI_WARM_UP_ON_START:
+        start_warm_up()
 
 # === EXECUTAR O APP ===
 if __name__ == "__main__":
     print("🚀 Iniciando o Stuttz...")  # Mensagem de inicialização no console
-    ft.app(target=main)  # Inicia o aplicativo Flet, chamando a função main
+    atexit.register(profile_registry.close_all)  # Gravar os dados de todos os perfis ao encerrar
+    
+    # Modo servidor: várias sessões no navegador compartilhando o conteúdo do curso
+    if "--web" in sys.argv or os.getenv("STUTTZ_SERVER_MODE") == "1":
+        profile_registry.enable_server_mode()
+        print(f"🌐 Modo servidor na porta {Config.SERVER_PORT}")
+        ft.app(target=main, view=ft.AppView.WEB_BROWSER, port=Config.SERVER_PORT,
+               assets_dir=Config.ASSETS_DIR)
+    else:
+        ft.app(target=main, assets_dir=Config.ASSETS_DIR)  # Inicia o aplicativo Flet, chamando a função main
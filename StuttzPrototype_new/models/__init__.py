@@ -3,6 +3,7 @@ Pacote Models do Stuttz
 Contém as estruturas de dados do aplicativo
 """
 
-from .data_models import UserData, RoadmapData, QuizData
+from .data_models import PhaseStatus, UserData, PhaseData, RoadmapData, QuizData
+from .roadmap_store import RoadmapStore
 
-__all__ = ['UserData', 'RoadmapData', 'QuizData']
+__all__ = ['PhaseStatus', 'UserData', 'PhaseData', 'RoadmapData', 'QuizData', 'RoadmapStore']
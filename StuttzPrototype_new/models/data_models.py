@@ -3,11 +3,31 @@ MODELOS DE DADOS DO STUTTZ
 Define como os dados são organizados e validados
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Dict, Any, Optional, Tuple
 
-@dataclass
+class PhaseStatus(str, Enum):
+    """
+    Status de uma fase
+    
+    Cada status é um objeto único (comparável com "is"), e por herdar de
+    str continua sendo igual ao texto gravado nos arquivos ("locked", etc.)
+    """
+    LOCKED = "locked"
+    UNLOCKED = "unlocked"
+    CURRENT = "current"
+    COMPLETED = "completed"
+    
+    # Mesmo hash do texto: permite usar o status em dicionários indexados
+    # pelo texto (ex: Config.COLORS) e vice-versa
+    def __hash__(self) -> int:
+        return str.__hash__(self)
+    
+    def __str__(self) -> str:
+        return self.value
+
+@dataclass(slots=True)
 class UserData:
     """
     Dados do usuário
@@ -18,21 +38,47 @@ class UserData:
     xp_to_next: int = 500
     streak: int = 0
     last_activity: Optional[str] = None
-    completed_phases: List[int] = []
+    completed_phases: List[int] = field(default_factory=list)
     
-    def __post_init__(self):
-        if self.completed_phases is None:
-            self.completed_phases = []
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UserData":
+        """Cria os dados do usuário a partir do formato de user_data.json"""
+        return cls(
+            name=data.get("name", "Estudante"),
+            level=data.get("level", 1),
+            xp=data.get("xp", 0),
+            xp_to_next=data.get("xp_to_next", 500),
+            streak=data.get("streak", 0),
+            last_activity=data.get("last_activity"),
+            completed_phases=list(data.get("completed_phases") or ())
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para o formato de user_data.json"""
+        return {
+            "name": self.name,
+            "level": self.level,
+            "xp": self.xp,
+            "xp_to_next": self.xp_to_next,
+            "streak": self.streak,
+            "last_activity": self.last_activity,
+            "completed_phases": list(self.completed_phases)
+        }
 
-@dataclass  
+@dataclass(slots=True, frozen=True)
 class QuizData:
     """
-    Dados de um quiz
+    Dados de um quiz (somente leitura: compartilhado entre as sessões)
     """
     question: str
-    options: List[str]
+    options: Tuple[str, ...]
     correct_answer_index: int
-    explanation: str
+    explanation: str = ""
+    
+    @property
+    def correct_answer(self) -> str:
+        """Texto da opção correta"""
+        return self.options[self.correct_answer_index]
     
     def is_valid(self) -> bool:
         """Verifica se o quiz é válido"""
@@ -41,42 +87,115 @@ class QuizData:
             0 <= self.correct_answer_index < 4 and
             len(self.question) > 0
         )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuizData":
+        """Cria o quiz a partir do formato do arquivo de roadmap"""
+        return cls(
+            question=data["question"],
+            options=tuple(data["options"]),
+            correct_answer_index=data.get("correct_answer_index", 0),
+            explanation=data.get("explanation", "")
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para o formato do arquivo de roadmap"""
+        return {
+            "question": self.question,
+            "options": list(self.options),
+            "correct_answer_index": self.correct_answer_index,
+            "explanation": self.explanation
+        }
 
-@dataclass
+@dataclass(slots=True)
 class PhaseData:
     """
     Dados de uma fase
+    
+    O conteúdo (título, tarefas, quiz) é compartilhado entre as sessões e não
+    deve ser alterado; status e quiz_completed pertencem a cada sessão.
     """
     id: int
     title: str
     description: str
-    status: str  # "locked", "unlocked", "current", "completed"
-    tasks: List[str]
-    quiz: QuizData
+    status: PhaseStatus
+    tasks: Tuple[str, ...] = ()
+    quiz: Optional[QuizData] = None
+    quiz_completed: bool = False
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PhaseData":
+        """Cria a fase a partir do formato do arquivo de roadmap"""
+        quiz = data.get("quiz")
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            description=data.get("description", ""),
+            status=PhaseStatus(data.get("status", "locked")),
+            tasks=tuple(data.get("tasks") or ()),
+            quiz=QuizData.from_dict(quiz) if quiz else None,
+            quiz_completed=bool(data.get("quiz_completed", False))
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para o formato do arquivo de roadmap"""
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status.value,
+            "tasks": list(self.tasks),
+            "quiz_completed": self.quiz_completed
+        }
+        if self.quiz is not None:
+            data["quiz"] = self.quiz.to_dict()
+        return data
+    
+    def with_progress(self, status: PhaseStatus, quiz_completed: bool) -> "PhaseData":
+        """
+        Cria uma cópia da fase com outro progresso
+        
+        A cópia reaproveita o conteúdo (título, tarefas e quiz) desta fase
+        """
+        return PhaseData(self.id, self.title, self.description, status,
+                         self.tasks, self.quiz, quiz_completed)
 
-@dataclass
+@dataclass(slots=True)
 class RoadmapData:
     """
     Dados do roadmap completo
+    
+    Consultas por ID ou status são feitas pelos índices de RoadmapStore
     """
     course_name: str
     total_phases: int
     phases: List[PhaseData]
     
-    def get_phase_by_id(self, phase_id: int) -> Optional[PhaseData]:
-        """Encontra uma fase pelo ID"""
-        for phase in self.phases:
-            if phase.id == phase_id:
-                return phase
-        return None
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RoadmapData":
+        """Cria o roadmap a partir do formato de roadmap_data.json"""
+        phases = [PhaseData.from_dict(phase) for phase in data["phases"]]
+        return cls(
+            course_name=data["course_name"],
+            total_phases=data.get("total_phases", len(phases)),
+            phases=phases
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para o formato de roadmap_data.json"""
+        return {
+            "course_name": self.course_name,
+            "total_phases": self.total_phases,
+            "phases": [phase.to_dict() for phase in self.phases]
+        }
     
     def get_unlocked_phases(self) -> List[PhaseData]:
         """Retorna apenas fases desbloqueadas"""
-        return [p for p in self.phases if p.status != "locked"]
+        return [p for p in self.phases if p.status is not PhaseStatus.LOCKED]
     
     def calculate_progress(self) -> float:
         """Calcula progresso em percentual"""
-        completed = sum(1 for p in self.phases if p.status == "completed")
+        completed = sum(1 for p in self.phases if p.status is PhaseStatus.COMPLETED)
         return (completed / self.total_phases) * 100 if self.total_phases > 0 else 0
 
 # === FUNÇÕES AUXILIARES ===
@@ -84,6 +203,8 @@ class RoadmapData:
 def create_default_roadmap() -> Dict[str, Any]:
     """
     Cria um roadmap padrão para o protótipo
+    
+    Usado quando o arquivo de roadmap não existe ou é inválido
     """
     return {
         "course_name": "Python para Iniciantes",
@@ -92,35 +213,35 @@ def create_default_roadmap() -> Dict[str, Any]:
             {
                 "id": 1,
                 "title": "Fundamentos",
-                "description": "Conceitos básicos do Python",
+                "description": "Aprenda os conceitos básicos do Python",
                 "status": "unlocked",
                 "tasks": [
-                    "Instalar Python",
-                    "Entender variáveis", 
-                    "Primeiro programa"
+                    "Instalar Python e configurar ambiente",
+                    "Entender variáveis e tipos de dados",
+                    "Criar seu primeiro programa"
                 ],
                 "quiz": {
-                    "question": "Qual comando exibe texto em Python?",
+                    "question": "Qual comando exibe texto na tela em Python?",
                     "options": ["show()", "print()", "display()", "output()"],
                     "correct_answer_index": 1,
-                    "explanation": "print() é a função padrão."
+                    "explanation": "print() é a função padrão para exibir texto na tela."
                 }
             },
             {
                 "id": 2,
                 "title": "Estruturas de Dados",
-                "description": "Listas, tuplas e dicionários",
+                "description": "Trabalhe com listas, tuplas e dicionários",
                 "status": "locked",
                 "tasks": [
-                    "Criar listas",
-                    "Usar tuplas",
+                    "Criar e manipular listas",
+                    "Entender tuplas e suas características",
                     "Trabalhar com dicionários"
                 ],
                 "quiz": {
-                    "question": "Como criar uma lista vazia?",
+                    "question": "Como criar uma lista vazia em Python?",
                     "options": ["list()", "[]", "new list()", "empty()"],
                     "correct_answer_index": 1,
-                    "explanation": "[] é a sintaxe mais comum."
+                    "explanation": "[] é a sintaxe mais comum e simples."
                 }
             }
             # Adicione mais fases conforme necessário
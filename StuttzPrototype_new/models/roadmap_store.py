@@ -0,0 +1,148 @@
+"""
+ÍNDICE DO ROADMAP
+Mantém índices sobre as fases do roadmap para consultas em tempo constante
+"""
+
+from typing import Dict, List, Optional, Set, Union
+from models.data_models import PhaseData, PhaseStatus, RoadmapData
+
+class RoadmapStore:
+    """
+    Índices das fases do roadmap e das fases completadas pelo usuário
+    
+    Mantém:
+    - id → fase e id → posição na lista de fases
+    - status → conjunto de ids com aquele status
+    - conjunto de ids das fases completadas (sincronizado com a lista do usuário)
+    
+    Todas as alterações de status devem passar por esta classe para que os
+    índices permaneçam consistentes com os dados.
+    """
+    
+    def __init__(self, roadmap_data: RoadmapData, completed_phases: List[int]):
+        """
+        Cria os índices a partir dos dados do roadmap
+        
+        Args:
+            roadmap_data: Dados do roadmap
+            completed_phases: Lista de IDs completados do usuário (atualizada no lugar)
+        """
+        self.roadmap_data = roadmap_data
+        self.completed_list = completed_phases
+        
+        self._by_id: Dict[int, PhaseData] = {}  # id → fase
+        self._index_by_id: Dict[int, int] = {}  # id → posição na lista de fases
+        self._by_status: Dict[PhaseStatus, Set[int]] = {}  # status → ids das fases
+        self._completed_ids: Set[int] = set()  # ids das fases completadas
+        
+        self.reindex()
+    
+    def reindex(self):
+        """
+        Reconstrói todos os índices a partir dos dados
+        
+        Necessário apenas se a lista de fases for substituída por fora da classe
+        """
+        self._by_id.clear()
+        self._index_by_id.clear()
+        self._by_status.clear()
+        
+        for index, phase in enumerate(self.roadmap_data.phases):
+            self._by_id[phase.id] = phase
+            self._index_by_id[phase.id] = index
+            self._by_status.setdefault(phase.status, set()).add(phase.id)
+        
+        self._completed_ids = set(self.completed_list)
+    
+    @property
+    def phases(self) -> List[PhaseData]:
+        """Lista de fases na ordem do curso"""
+        return self.roadmap_data.phases
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
+    
+    def get_phase(self, phase_id: int) -> Optional[PhaseData]:
+        """Encontra uma fase pelo ID"""
+        return self._by_id.get(phase_id)
+    
+    def index_of(self, phase_id: int) -> Optional[int]:
+        """Retorna a posição da fase na lista de fases"""
+        return self._index_by_id.get(phase_id)
+    
+    def next_phase(self, phase_id: int) -> Optional[PhaseData]:
+        """
+        Retorna a fase seguinte no curso
+        
+        Args:
+            phase_id: ID da fase atual
+            
+        Returns:
+            A próxima fase ou None se a fase for a última (ou não existir)
+        """
+        index = self._index_by_id.get(phase_id)
+        if index is None or index >= len(self.phases) - 1:
+            return None
+        return self.phases[index + 1]
+    
+    def phases_with_status(self, status: Union[PhaseStatus, str]) -> List[PhaseData]:
+        """
+        Retorna as fases com um determinado status, na ordem do curso
+        
+        Args:
+            status: Status procurado (PhaseStatus ou o texto equivalente, ex: "unlocked")
+        """
+        ids = self._by_status.get(status, ())
+        return [self._by_id[i] for i in sorted(ids, key=self._index_by_id.__getitem__)]
+    
+    def set_status(self, phase_id: int, status: Union[PhaseStatus, str]) -> bool:
+        """
+        Altera o status de uma fase, mantendo os índices atualizados
+        
+        Args:
+            phase_id: ID da fase
+            status: Novo status (PhaseStatus ou o texto equivalente)
+            
+        Returns:
+            bool: True se o status mudou, False caso contrário
+        """
+        status = PhaseStatus(status)
+        phase = self._by_id.get(phase_id)
+        if phase is None or phase.status is status:
+            return False
+        
+        self._by_status.get(phase.status, set()).discard(phase_id)
+        self._by_status.setdefault(status, set()).add(phase_id)
+        phase.status = status
+        return True
+    
+    def is_completed(self, phase_id: int) -> bool:
+        """Verifica se o usuário completou a fase"""
+        return phase_id in self._completed_ids
+    
+    def mark_completed(self, phase_id: int) -> bool:
+        """
+        Marca uma fase como completada pelo usuário
+        
+        Atualiza o status da fase e a lista de fases completadas do usuário
+        
+        Args:
+            phase_id: ID da fase
+            
+        Returns:
+            bool: True se a fase ainda não estava completada, False caso contrário
+        """
+        if phase_id not in self._by_id:
+            return False
+        
+        changed = self.set_status(phase_id, PhaseStatus.COMPLETED)
+        if phase_id not in self._completed_ids:
+            self._completed_ids.add(phase_id)
+            self.completed_list.append(phase_id)
+            changed = True
+        return changed
+    
+    def completed_phases(self) -> List[PhaseData]:
+        """Retorna as fases completadas pelo usuário, na ordem do curso"""
+        ids = (i for i in self._completed_ids if i in self._index_by_id)
+        return [self._by_id[i] for i in sorted(ids, key=self._index_by_id.__getitem__)]
@@ -0,0 +1,291 @@
+"""
+Cache persistente de respostas da IA
+Este módulo guarda em disco as respostas do Gemini para evitar chamadas
+repetidas (e seu custo de latência e tokens) entre execuções do aplicativo
+"""
+
+import atexit  # Permite gravar o cache pendente ao encerrar o processo
+import hashlib  # Módulo para gerar o hash das chaves do cache
+import json  # Módulo para manipulação de dados JSON
+import os  # Módulo para interagir com o sistema operacional
+import threading  # Módulo para sincronização entre threads
+import time  # Módulo para obter o horário atual (TTL)
+from collections import OrderedDict  # Dicionário ordenado usado na política LRU
+from typing import Any, Dict, Optional  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+from utils.persistence import PersistenceWorker, atomic_write_json  # Gravação atômica e em segundo plano
+
+def make_cache_key(prompt: str, model: str = Config.AI_MODEL, max_tokens: int = 1000) -> str:
+    """
+    Gera a chave do cache a partir do prompt, do modelo e do limite de tokens
+    
+    Args:
+        prompt: Texto enviado ao modelo
+        model: Nome do modelo usado (padrão: Config.AI_MODEL)
+        max_tokens: Limite de tokens da resposta
+        
+    Returns:
+        Hash SHA-256 em hexadecimal que identifica a requisição
+    """
+    raw = f"{model}\n{max_tokens}\n{prompt}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class AICache:
+    """
+    Cache LRU com TTL persistido em um arquivo JSON
+    
+    Cada entrada guarda a resposta e o momento em que foi criada. Entradas
+    expiradas são descartadas na leitura e, quando o limite de tamanho é
+    atingido, as menos usadas recentemente são removidas primeiro.
+    
+    As inclusões não gravam o arquivo na hora: o cache é marcado como
+    alterado e gravado pela thread de persistência (com debounce), de modo
+    que várias respostas seguidas resultam em uma única gravação.
+    """
+    
+    def __init__(self, path: Optional[str] = Config.AI_CACHE_FILE,
+                 max_entries: int = Config.AI_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = Config.AI_CACHE_TTL_SECONDS):
+        """
+        Inicializa o cache e carrega as entradas salvas em disco
+        
+        Args:
+            path: Caminho do arquivo do cache (None mantém o cache só em memória)
+            max_entries: Número máximo de entradas mantidas
+            ttl_seconds: Tempo de vida de cada entrada, em segundos
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        
+        # Entradas no formato {chave: {"value": str, "created_at": float}}
+        # A ordem do dicionário representa o uso: o fim é o mais recente
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()  # O cache é usado pelas threads de IA
+        self._persistence: Optional[PersistenceWorker] = None  # Criada na primeira alteração a gravar
+        
+        # === CONTADORES ===
+        self.hits = 0  # Respostas servidas pelo cache
+        self.misses = 0  # Consultas que precisaram chamar a API
+        self.evictions = 0  # Entradas removidas por limite de tamanho ou TTL
+        
+        # O arquivo só é lido no primeiro uso, para não atrasar a abertura do aplicativo
+        self._loaded = False
+    
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        """Verifica se uma entrada ultrapassou o TTL"""
+        return self.ttl_seconds > 0 and now - entry["created_at"] > self.ttl_seconds
+    
+    def _ensure_loaded(self):
+        """Carrega o arquivo do cache na primeira consulta"""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+    
+    def preload(self):
+        """Lê o arquivo do cache agora (ex: em segundo plano, após a abertura do aplicativo)"""
+        self._ensure_loaded()
+    
+    def _load(self):
+        """
+        Carrega as entradas do arquivo, descartando as expiradas
+        """
+        if not self.path or not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"❌ Erro ao carregar cache da IA: {e}")
+            return
+        
+        now = time.time()
+        # As entradas são salvas da menos para a mais usada
+        for key, entry in data.get("entries", []):
+            if not self._is_expired(entry, now):
+                self._entries[key] = entry
+        
+        self._evict_overflow()
+        print(f"✅ Cache da IA carregado ({len(self._entries)} entradas)")
+    
+    def _evict_overflow(self):
+        """Remove as entradas menos usadas até respeitar o limite de tamanho"""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def save(self) -> bool:
+        """
+        Salva o cache no disco de forma atômica
+        
+        Returns:
+            bool: True se o cache foi salvo com sucesso, False caso contrário
+        """
+        self._ensure_loaded()
+        if not self.path:
+            return True
+        
+        payload = self._snapshot()
+        
+        try:
+            # Escreve em um arquivo temporário e substitui o original de uma vez
+            atomic_write_json(self.path, payload, indent=None)
+            return True
+        except OSError as e:
+            print(f"❌ Erro ao salvar cache da IA: {e}")
+            return False
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Dados gravados no arquivo (da entrada menos para a mais usada)"""
+        with self._lock:
+            return {"entries": list(self._entries.items())}
+    
+    def schedule_save(self):
+        """
+        Marca o cache como alterado para ser gravado em segundo plano
+        
+        A gravação acontece após Config.SAVE_DEBOUNCE_SECONDS sem novas
+        alterações (ou no máximo após Config.SAVE_MAX_DELAY_SECONDS), fora da
+        thread que fez a alteração. Use flush() para gravar imediatamente.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            if self._persistence is None:
+                self._persistence = PersistenceWorker()
+            persistence = self._persistence
+        persistence.schedule(self.path, self._snapshot)
+    
+    def flush(self) -> bool:
+        """
+        Grava agora as alterações pendentes (ex: ao encerrar o aplicativo)
+        
+        Returns:
+            bool: True se não havia nada pendente ou a gravação foi bem-sucedida
+        """
+        persistence = self._persistence
+        if persistence is None:
+            return True
+        return persistence.flush()
+    
+    def get(self, key: str, count: bool = True) -> Optional[str]:
+        """
+        Obtém uma resposta do cache
+        
+        Args:
+            key: Chave gerada por make_cache_key
+            count: Se False, a consulta não entra nos contadores de acertos e
+                   falhas (ex: uma nova verificação da mesma requisição)
+            
+        Returns:
+            A resposta armazenada ou None se não existir ou estiver expirada
+        """
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._entries.get(key)
+            
+            if entry is not None and self._is_expired(entry, time.time()):
+                # Entrada expirada: remover e tratar como ausente
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+            
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+            
+            # Marcar como usada recentemente
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry["value"]
+    
+    def contains(self, key: str) -> bool:
+        """
+        Verifica se existe uma resposta válida para a chave
+        
+        Diferente de get, não altera os contadores nem a ordem de uso.
+        
+        Args:
+            key: Chave gerada por make_cache_key
+            
+        Returns:
+            True se a chave existir e não estiver expirada
+        """
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry, time.time())
+    
+    def set(self, key: str, value: str, persist: bool = True):
+        """
+        Armazena uma resposta no cache
+        
+        Args:
+            key: Chave gerada por make_cache_key
+            value: Resposta a ser armazenada
+            persist: Se True, agenda a gravação do cache no disco (ver schedule_save)
+        """
+        self._ensure_loaded()
+        with self._lock:
+            self._entries[key] = {"value": value, "created_at": time.time()}
+            self._entries.move_to_end(key)
+            self._evict_overflow()
+        
+        if persist:
+            self.schedule_save()
+    
+    def clear(self):
+        """Remove todas as entradas do cache"""
+        self._ensure_loaded()
+        with self._lock:
+            self._entries.clear()
+        self.save()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas de uso do cache
+        
+        Returns:
+            Dicionário com tamanho, acertos, falhas, remoções e taxa de acerto
+        """
+        self._ensure_loaded()
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total > 0 else 0.0,
+            }
+    
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        with self._lock:
+            return len(self._entries)
+
+# Cache compartilhado por todas as sessões do processo (criado no primeiro uso)
+_shared_cache: Optional[AICache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_shared_ai_cache() -> AICache:
+    """
+    Retorna o cache de respostas da IA compartilhado pelo processo
+    
+    Returns:
+        Instância única de AICache
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = AICache()
+            # Gravar as respostas ainda pendentes ao encerrar o processo
+            atexit.register(_shared_cache.flush)
+        return _shared_cache
@@ -0,0 +1,114 @@
+"""
+Executor de requisições de IA
+Este módulo executa as chamadas à API do Gemini fora da thread da interface,
+permitindo várias requisições simultâneas sem congelar o aplicativo
+"""
+
+import threading  # Módulo para sincronização entre threads
+from concurrent.futures import Future, ThreadPoolExecutor  # Pool de threads e objetos Future
+from typing import Any, Callable, Optional, Set  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+
+class AIRequestExecutor:
+    """
+    Pool limitado de threads para requisições de IA
+    
+    Cada requisição submetida retorna um Future. Quando a resposta chega,
+    o callback informado é executado na thread de trabalho, permitindo que
+    a view atualize apenas os controles afetados.
+    """
+    
+    def __init__(self, max_workers: int = Config.AI_MAX_WORKERS):
+        """
+        Cria o pool de threads
+        
+        Args:
+            max_workers: Número máximo de requisições executando ao mesmo tempo
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,  # Limita a concorrência das chamadas à API
+            thread_name_prefix="stuttz-ai"  # Facilita a identificação das threads no debug
+        )
+        self._pending: Set[Future] = set()  # Requisições ainda não concluídas
+        self._lock = threading.Lock()  # Protege o conjunto de requisições pendentes
+    
+    def submit(self, fn: Callable[..., Any], *args,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               **kwargs) -> Future:
+        """
+        Agenda uma função para execução em segundo plano
+        
+        Args:
+            fn: Função a ser executada (ex: controller.generate_study_tip)
+            *args: Argumentos posicionais repassados para a função
+            on_done: Callback chamado com o resultado quando a função termina
+            on_error: Callback chamado com a exceção caso a função falhe
+            **kwargs: Argumentos nomeados repassados para a função
+            
+        Returns:
+            Future que representa a requisição em andamento
+        """
+        future = self._executor.submit(fn, *args, **kwargs)
+        
+        with self._lock:
+            self._pending.add(future)
+        
+        def _finish(done: Future):
+            # Remove a requisição da lista de pendentes
+            with self._lock:
+                self._pending.discard(done)
+            
+            # Requisições canceladas não disparam callbacks
+            if done.cancelled():
+                return
+            
+            error = done.exception()
+            try:
+                if error is not None:
+                    print(f"❌ Erro na requisição de IA: {error}")
+                    if on_error:
+                        on_error(error)
+                elif on_done:
+                    on_done(done.result())
+            except Exception as e:
+                # Um erro no callback não deve derrubar a thread de trabalho
+                print(f"❌ Erro ao processar resposta da IA: {e}")
+        
+        future.add_done_callback(_finish)
+        return future
+    
+    @property
+    def pending_count(self) -> int:
+        """Número de requisições ainda em andamento"""
+        with self._lock:
+            return len(self._pending)
+    
+    def shutdown(self, wait: bool = False):
+        """
+        Encerra o pool, cancelando as requisições que ainda não começaram
+        
+        Args:
+            wait: Se True, aguarda as requisições em execução terminarem
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+# Pool compartilhado por todas as sessões do processo (criado no primeiro uso)
+_shared_executor: Optional[AIRequestExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+def get_shared_executor() -> AIRequestExecutor:
+    """
+    Retorna o pool de requisições de IA compartilhado pelo processo
+    
+    Assim o limite de requisições simultâneas vale para o processo inteiro,
+    e não para cada sessão
+    
+    Returns:
+        Instância única de AIRequestExecutor
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = AIRequestExecutor()
+        return _shared_executor
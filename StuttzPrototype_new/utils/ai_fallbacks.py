@@ -0,0 +1,38 @@
+"""
+Conteúdo estático usado quando a IA não está disponível
+Este módulo fornece dicas e explicações fixas exibidas no lugar das respostas
+do Gemini (chave não configurada, erro na API ou disjuntor aberto)
+"""
+
+# Dicas de estudo por título de fase
+STATIC_STUDY_TIPS = {
+    "Fundamentos": "Pratique escrevendo pequenos programas Python todos os dias. Comece com scripts simples que usam print() e variáveis básicas.",
+    "Estruturas de Dados": "Experimente criar diferentes tipos de listas e dicionários. Tente converter entre eles para entender suas diferenças e semelhanças.",
+}
+
+# Dica usada para as fases sem uma dica específica
+DEFAULT_STUDY_TIP = "Divida seu aprendizado em pequenas sessões diárias. Consistência é mais importante que sessões longas e esporádicas."
+
+def fallback_study_tip(phase_title: str) -> str:
+    """
+    Retorna uma dica de estudo estática para uma fase
+    
+    Args:
+        phase_title: Título da fase
+        
+    Returns:
+        A dica específica da fase ou a dica padrão
+    """
+    return STATIC_STUDY_TIPS.get(phase_title, DEFAULT_STUDY_TIP)
+
+def fallback_explanation(correct_answer: str) -> str:
+    """
+    Retorna uma explicação estática para a resposta de um quiz
+    
+    Args:
+        correct_answer: A resposta correta do quiz
+        
+    Returns:
+        Texto que destaca a resposta correta
+    """
+    return f"A resposta correta é '{correct_answer}'. Esta é a opção que melhor responde à pergunta, considerando os conceitos abordados nesta fase do curso."
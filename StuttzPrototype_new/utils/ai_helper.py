@@ -1,31 +1,314 @@
 """
 Utilitários para integração com IA
-Este módulo gerencia a comunicação com a API do Google Gemini
+Este módulo gerencia a comunicação com o provedor de IA (por padrão, a API do
+Google Gemini), com novas tentativas, disjuntor e mensagens de erro amigáveis
 """
 
-from google import genai  # Importa a biblioteca do Google Generative AI
-import os  # Importa o módulo para interagir com o sistema operacional
-from dotenv import load_dotenv  # Importa o módulo para carregar variáveis de ambiente de arquivos .env
+import random  # Usado para variar (jitter) a espera entre novas tentativas
+import threading  # Módulo para sincronização entre threads (disjuntor)
+import time  # Módulo para controlar prazos e esperas
+from typing import Callable, Iterator, Optional, TypeVar  # Tipos para anotações de tipo
 from config import Config  # Importa as configurações globais do aplicativo
+from utils.ai_cache import get_shared_ai_cache  # Cache de respostas (lido do disco no primeiro uso)
+from utils.ai_providers import AIProvider, create_provider  # Provedores de IA
+from utils.metrics import metrics  # Latência e resultado das requisições (painel de diagnóstico)
 
-# Carregar variáveis de ambiente do arquivo .env (se existir)
-load_dotenv()  # Carrega as variáveis de ambiente do arquivo .env na raiz do projeto
+# Provedor de IA ativo (criado no primeiro uso, ver Config.AI_PROVIDER)
+# Nada pesado é importado aqui: o SDK do Gemini e o arquivo .env só são
+# carregados quando a IA é usada pela primeira vez (ou por warm_up)
+_provider: Optional[AIProvider] = None
+_provider_lock = threading.Lock()
 
-# Configurar a API do Gemini obtendo a chave da API das variáveis de ambiente
-API_KEY = os.getenv("GEMINI_API_KEY")  # Obtém a chave da API das variáveis de ambiente
+def _load_environment():
+    """Carrega as variáveis de ambiente do arquivo .env (se existir)"""
+    try:
+        from dotenv import load_dotenv  # Importado apenas no primeiro uso da IA
+    except ImportError:
+        return
+    load_dotenv()  # Carrega as variáveis de ambiente do arquivo .env na raiz do projeto
+
+def get_provider() -> AIProvider:
+    """
+    Retorna o provedor de IA ativo, criando-o na primeira chamada
+    
+    Returns:
+        Instância de AIProvider compartilhada pelo processo
+    """
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _load_environment()
+            _provider = create_provider()
+        return _provider
+
+def warm_up() -> float:
+    """
+    Inicializa o provedor de IA (importa o SDK e cria o cliente) e lê o
+    cache de respostas do disco
+    
+    Chamado em segundo plano após a primeira renderização, para que o
+    primeiro clique nos botões de IA não pague o custo da inicialização.
+    
+    Returns:
+        Tempo gasto na inicialização, em segundos
+    """
+    start = time.perf_counter()
+    try:
+        get_provider().connect()
+        get_shared_ai_cache().preload()
+    except Exception as e:
+        print(f"⚠️ Não foi possível inicializar a IA: {e}")
+    return time.perf_counter() - start
+
+def start_warm_up() -> threading.Thread:
+    """
+    Executa warm_up em uma thread de segundo plano
+    
+    Returns:
+        A thread iniciada
+    """
+    def run():
+        elapsed = warm_up()
+        print(f"✅ IA inicializada em segundo plano ({elapsed * 1000:.0f} ms)")
+    
+    thread = threading.Thread(target=run, name="stuttz-ai-warmup", daemon=True)
+    thread.start()
+    return thread
+
+def set_provider(provider: Optional[AIProvider]):
+    """
+    Substitui o provedor de IA ativo (ex: provedor simulado em benchmarks)
+    
+    Args:
+        provider: Novo provedor (None recria o provedor configurado no próximo uso)
+    """
+    global _provider
+    with _provider_lock:
+        _provider = provider
+
+def cache_namespace() -> str:
+    """
+    Retorna o identificador do provedor ativo usado nas chaves do cache
+    
+    Returns:
+        Nome do modelo (Gemini) ou do provedor (simulado, gravações)
+    """
+    return get_provider().cache_namespace
+
+# Prefixos das mensagens de erro retornadas por get_gemini_response
+ERROR_RESPONSE_PREFIXES = (
+    "Não foi possível gerar uma resposta",
+    "Desculpe, não consegui gerar uma resposta",
+)
+
+# Mensagens de erro retornadas no lugar da resposta do modelo
+MISSING_KEY_MESSAGE = "Não foi possível gerar uma resposta. A chave de API do Gemini não está configurada."
+UNAVAILABLE_MESSAGE = "Não foi possível gerar uma resposta. O serviço de IA está temporariamente indisponível."
+EMPTY_RESPONSE_MESSAGE = "Não foi possível gerar uma resposta. O modelo não retornou nenhum texto."
+
+# Códigos HTTP de erros temporários, que justificam uma nova tentativa
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+T = TypeVar("T")
+
+def is_error_response(response: str) -> bool:
+    """
+    Verifica se uma resposta é, na verdade, uma mensagem de erro
+    
+    Usado para evitar que mensagens de erro sejam guardadas no cache
+    
+    Args:
+        response: Texto retornado por get_gemini_response
+        
+    Returns:
+        True se o texto for uma mensagem de erro, False caso contrário
+    """
+    return response.startswith(ERROR_RESPONSE_PREFIXES)
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Verifica se um erro da API é temporário (vale tentar novamente)
+    
+    São temporários: limite de requisições (429), erros do servidor (5xx),
+    tempo esgotado e falhas de conexão
+    
+    Args:
+        error: Exceção lançada pela chamada à API
+        
+    Returns:
+        True se o erro for temporário, False caso contrário
+    """
+    # Erros da API do Gemini (google.genai.errors.APIError) trazem o código HTTP
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in TRANSIENT_STATUS_CODES
+    
+    # Tempo esgotado e falhas de rede (inclui os erros do cliente HTTP, pelo nome)
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    name = type(error).__name__
+    return "Timeout" in name or "Connect" in name
+
+def retry_delay(attempt: int) -> float:
+    """
+    Calcula a espera antes de uma nova tentativa (recuo exponencial com jitter)
+    
+    Args:
+        attempt: Número da tentativa que falhou (0 para a primeira)
+        
+    Returns:
+        Espera em segundos, sorteada entre 0 e o limite exponencial
+    """
+    limit = min(Config.AI_RETRY_MAX_DELAY, Config.AI_RETRY_BASE_DELAY * (2 ** attempt))
+    return random.uniform(0, limit)
+
+class CircuitBreaker:
+    """
+    Disjuntor das chamadas à API
+    
+    Depois de várias falhas temporárias seguidas, o disjuntor "abre" e as
+    requisições falham imediatamente (exibindo conteúdo estático) em vez de
+    esperar por um serviço fora do ar. Após o tempo de espera, uma única
+    requisição de teste é liberada: se funcionar, o disjuntor fecha.
+    """
+    
+    CLOSED = "closed"  # Funcionamento normal
+    OPEN = "open"  # Falhando imediatamente
+    HALF_OPEN = "half_open"  # Aguardando o resultado da requisição de teste
+    
+    def __init__(self, failure_threshold: int = Config.AI_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = Config.AI_BREAKER_RESET_SECONDS):
+        """
+        Args:
+            failure_threshold: Falhas seguidas necessárias para abrir o disjuntor
+            reset_timeout: Segundos com o disjuntor aberto antes da requisição de teste
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0  # Falhas seguidas
+        self.opened_at = 0.0  # Momento em que o disjuntor abriu
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """
+        Verifica se uma requisição pode ser feita agora
+        
+        Returns:
+            True se a requisição pode ir à API, False se deve falhar imediatamente
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Liberar uma única requisição de teste
+                self.state = self.HALF_OPEN
+                return True
+            
+            return False
+    
+    @property
+    def is_open(self) -> bool:
+        """Indica se o disjuntor está aberto (requisições falhando imediatamente)"""
+        with self._lock:
+            return self.state == self.OPEN
+    
+    def record_success(self):
+        """Registra uma chamada bem-sucedida (fecha o disjuntor)"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                print("✅ Serviço de IA disponível novamente")
+            self.state = self.CLOSED
+            self.failures = 0
+    
+    def record_failure(self):
+        """Registra uma falha temporária (pode abrir o disjuntor)"""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    print(f"⚠️ Serviço de IA indisponível; usando conteúdo estático por {self.reset_timeout:.0f}s")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+    
+    def record_ignored(self):
+        """Libera a requisição de teste quando ela falha por um erro não temporário"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+# Disjuntor compartilhado por todas as requisições do processo
+circuit_breaker = CircuitBreaker()
+
+def call_with_retry(operation: Callable[[], T], deadline: Optional[float] = None) -> T:
+    """
+    Executa uma chamada à API com novas tentativas em erros temporários
+    
+    Cada nova tentativa espera um recuo exponencial com jitter. Nenhuma
+    tentativa é iniciada se a espera ultrapassar o prazo da requisição ou se
+    o disjuntor abrir. Cada falha temporária é registrada no disjuntor.
+    
+    Args:
+        operation: Função que faz a chamada à API
+        deadline: Prazo final (time.monotonic); padrão: Config.AI_DEADLINE_SECONDS
+        
+    Returns:
+        O resultado da operação
+        
+    Raises:
+        A exceção da última tentativa, se todas falharem
+    """
+    if deadline is None:
+        deadline = time.monotonic() + Config.AI_DEADLINE_SECONDS
+    
+    attempt = 0
+    while True:
+        try:
+            result = operation()
+        except Exception as e:
+            if not is_transient_error(e):
+                # Erro da requisição (ex: prompt inválido): não indica que a API está fora do ar
+                circuit_breaker.record_ignored()
+                raise
+            
+            # Cada tentativa com erro temporário conta para o disjuntor
+            circuit_breaker.record_failure()
+            
+            delay = retry_delay(attempt)
+            attempt += 1
+            if (attempt > Config.AI_MAX_RETRIES or circuit_breaker.is_open
+                    or time.monotonic() + delay >= deadline):
+                raise
+            
+            print(f"🔁 Erro temporário da IA ({e}); nova tentativa em {delay:.1f}s")
+            time.sleep(delay)
+            continue
+        
+        circuit_breaker.record_success()
+        return result
 
-# Verificar se a API_KEY foi definida e inicializar o cliente
-if API_KEY:
-    # Cria um cliente da API Gemini usando a chave fornecida
-    client = genai.Client(api_key=API_KEY)
-else:
-    # Se a chave não estiver definida, exibe um erro e define o cliente como None
-    print("❌ ERRO: GEMINI_API_KEY não encontrada no ambiente ou arquivo .env")
-    client = None
+def _record_request(provider: AIProvider, result: str, seconds: Optional[float] = None):
+    """
+    Registra o resultado (e a latência) de uma requisição à IA nas métricas
+    
+    Args:
+        provider: Provedor que atendeu a requisição
+        result: "ok", "error", "unavailable" ou "missing_key"
+        seconds: Duração total, incluindo novas tentativas (None se não houve chamada)
+    """
+    metrics.increment("stuttz_ai_requests_total", provider=provider.name, result=result)
+    if seconds is not None:
+        metrics.observe("stuttz_ai_request_seconds", seconds, provider=provider.name)
 
 def get_gemini_response(prompt: str, max_tokens: int = 1000) -> str:
     """
-    Obtém uma resposta do modelo Gemini para um prompt específico
+    Obtém uma resposta do provedor de IA ativo para um prompt específico
+    
+    Erros temporários são repetidos com recuo exponencial dentro do prazo
+    Config.AI_DEADLINE_SECONDS. Com o disjuntor aberto, retorna imediatamente
+    a mensagem de indisponibilidade.
     
     Args:
         prompt: O texto de pergunta/prompt a ser enviado ao modelo
@@ -34,26 +317,91 @@ def get_gemini_response(prompt: str, max_tokens: int = 1000) -> str:
     Returns:
         Uma string com a resposta do modelo ou uma mensagem de erro
     """
-    # Verificar se o cliente foi inicializado corretamente
-    if client is None:
-        # Retorna uma mensagem de erro se o cliente não foi inicializado
-        return "Não foi possível gerar uma resposta. A chave de API do Gemini não está configurada."
+    provider = get_provider()
+    
+    # Verificar se o provedor foi configurado corretamente
+    if not provider.available:
+        # Retorna uma mensagem de erro se a chave da API não foi definida
+        _record_request(provider, "missing_key")
+        return MISSING_KEY_MESSAGE
     
+    # Falhar imediatamente enquanto o serviço estiver fora do ar
+    if not circuit_breaker.allow():
+        _record_request(provider, "unavailable")
+        return UNAVAILABLE_MESSAGE
+    
+    start = time.perf_counter()
     try:
-        # Tenta gerar uma resposta usando o modelo definido na configuração
-        response = client.models.generate_content(
-            model=Config.AI_MODEL,  # Usa o modelo definido nas configurações
-            contents=prompt,  # Envia o prompt para o modelo
-            config={
-                'max_output_tokens': max_tokens,  # Limita o tamanho da resposta
-                'temperature': 0.7,  # Define a temperatura (criatividade) da resposta
-            }
-        )
-        
-        # Retorna o texto da resposta, garantindo que seja uma string válida
-        return response.text if response.text is not None else ""
+        response = call_with_retry(lambda: provider.generate(prompt, max_tokens))
+        _record_request(provider, "ok", time.perf_counter() - start)
+        return response
     except Exception as e:
         # Captura e registra qualquer erro que ocorra durante a geração da resposta
         print(f"❌ Erro ao gerar resposta: {e}")
+        _record_request(provider, "error", time.perf_counter() - start)
         # Retorna uma mensagem de erro amigável incluindo detalhes do erro
-        return f"Desculpe, não consegui gerar uma resposta. Erro: {str(e)}"
\ No newline at end of file
+        return f"Desculpe, não consegui gerar uma resposta. Erro: {str(e)}"
+
+def stream_gemini_response(prompt: str, max_tokens: int = 1000) -> Iterator[str]:
+    """
+    Obtém uma resposta do provedor de IA ativo em partes, à medida que é gerada
+    
+    Permite exibir o início da resposta antes que ela esteja completa. Erros
+    temporários antes do primeiro trecho são repetidos como em get_gemini_response.
+    
+    Args:
+        prompt: O texto de pergunta/prompt a ser enviado ao modelo
+        max_tokens: Limite máximo de tokens na resposta (padrão: 1000)
+        
+    Yields:
+        Trechos de texto da resposta, na ordem em que chegam (ou uma única
+        mensagem de erro, no mesmo formato de get_gemini_response)
+        
+    Raises:
+        Exception: Se o stream falhar depois de algum trecho já ter sido entregue
+    """
+    provider = get_provider()
+    
+    # Verificar se o provedor foi configurado corretamente
+    if not provider.available:
+        _record_request(provider, "missing_key")
+        yield MISSING_KEY_MESSAGE
+        return
+    
+    # Falhar imediatamente enquanto o serviço estiver fora do ar
+    if not circuit_breaker.allow():
+        _record_request(provider, "unavailable")
+        yield UNAVAILABLE_MESSAGE
+        return
+    
+    def open_stream():
+        # Inicia o stream e aguarda o primeiro trecho com texto, para que
+        # falhas na abertura do stream possam ser repetidas
+        stream = iter(provider.stream(prompt, max_tokens))
+        for chunk in stream:
+            if chunk:
+                return chunk, stream
+        return "", stream
+    
+    received_any = False
+    start = time.perf_counter()
+    try:
+        first, stream = call_with_retry(open_stream)
+        if first:
+            received_any = True
+            yield first
+        
+        for chunk in stream:
+            if chunk:
+                received_any = True
+                yield chunk
+        _record_request(provider, "ok", time.perf_counter() - start)
+    except Exception as e:
+        # Captura e registra qualquer erro que ocorra durante a geração da resposta
+        print(f"❌ Erro ao gerar resposta: {e}")
+        _record_request(provider, "error", time.perf_counter() - start)
+        if received_any:
+            # A resposta ficou incompleta: repassar o erro para que ela não seja guardada
+            raise
+        # Sem nenhum trecho recebido: retornar a mensagem de erro amigável
+        yield f"Desculpe, não consegui gerar uma resposta. Erro: {str(e)}"
@@ -0,0 +1,143 @@
+"""
+Pré-carregamento do conteúdo de IA
+Este módulo gera, em segundo plano, a dica de estudo e a explicação do quiz
+das fases que o usuário provavelmente vai abrir, para que os botões de IA
+respondam direto do cache
+"""
+
+import threading  # Módulo para sincronização entre threads
+from concurrent.futures import Future  # Representa uma requisição em andamento
+from typing import Callable, Dict, List, Optional  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+from models.data_models import PhaseData  # Dados das fases
+from utils.ai_cache import AICache, make_cache_key  # Cache das respostas da IA
+from utils.ai_helper import cache_namespace  # Identificador do provedor nas chaves do cache
+from utils.ai_executor import AIRequestExecutor  # Pool de threads das requisições de IA
+from utils.ai_prompts import phase_prompts  # Prompts enviados a partir de uma fase
+
+class AIPrefetcher:
+    """
+    Gera antecipadamente o conteúdo de IA de uma fase
+    
+    Cada sessão tem seu próprio pré-carregador, com um orçamento máximo de
+    requisições. As requisições são agrupadas por fase para que possam ser
+    canceladas quando o usuário sai dela.
+    """
+    
+    def __init__(self, executor: AIRequestExecutor, cache: AICache,
+                 generate: Callable[[str, int], str],
+                 budget: int = Config.PREFETCH_BUDGET,
+                 enabled: bool = Config.PREFETCH_ENABLED):
+        """
+        Args:
+            executor: Pool de threads onde as requisições são executadas
+            cache: Cache consultado para evitar requisições desnecessárias
+            generate: Função que obtém (e armazena no cache) a resposta de um prompt
+            budget: Número máximo de requisições antecipadas
+            enabled: Se False, nenhuma requisição é feita
+        """
+        self.executor = executor
+        self.cache = cache
+        self.generate = generate
+        self.budget = budget
+        self.enabled = enabled
+        
+        self.used = 0  # Requisições antecipadas já enviadas
+        self.cancelled = 0  # Requisições canceladas antes de chegar à API
+        self._pending: Dict[int, List[Future]] = {}  # Requisições por ID de fase
+        self._lock = threading.Lock()
+    
+    @property
+    def remaining(self) -> int:
+        """Número de requisições antecipadas ainda disponíveis"""
+        return max(0, self.budget - self.used)
+    
+    def prefetch_phase(self, phase: Optional[PhaseData]) -> int:
+        """
+        Agenda a geração da dica de estudo e da explicação do quiz de uma fase
+        
+        Prompts que já estão no cache ou em andamento não são enviados novamente.
+        
+        Args:
+            phase: Dados da fase (None é ignorado)
+            
+        Returns:
+            Número de requisições agendadas
+        """
+        if not self.enabled or not phase:
+            return 0
+        
+        phase_id = phase.id
+        scheduled = 0
+        
+        with self._lock:
+            # Descartar requisições já concluídas desta fase
+            futures = [f for f in self._pending.get(phase_id, []) if not f.done()]
+            if futures:
+                # A fase já está sendo pré-carregada
+                self._pending[phase_id] = futures
+                return 0
+            
+            for prompt, max_tokens in phase_prompts(phase):
+                if self.cache.contains(make_cache_key(prompt, cache_namespace(), max_tokens)):
+                    continue
+                if self.used >= self.budget:
+                    print("⚠️ Orçamento de pré-carregamento da IA esgotado")
+                    break
+                
+                self.used += 1
+                scheduled += 1
+                futures.append(self.executor.submit(self._run, phase_id, prompt, max_tokens))
+            
+            if futures:
+                self._pending[phase_id] = futures
+        
+        if scheduled:
+            print(f"🔮 Pré-carregando {scheduled} resposta(s) de IA da fase {phase_id}")
+        return scheduled
+    
+    def _run(self, phase_id: int, prompt: str, max_tokens: int):
+        """Executa uma requisição antecipada (na thread do pool de IA)"""
+        with self._lock:
+            # A fase foi cancelada enquanto a requisição aguardava na fila
+            if phase_id not in self._pending:
+                return None
+        return self.generate(prompt, max_tokens)
+    
+    def cancel(self, phase_id: int) -> int:
+        """
+        Cancela as requisições pendentes de uma fase
+        
+        Requisições que já chegaram à API não podem ser interrompidas; a
+        resposta delas continua sendo armazenada no cache. As requisições
+        canceladas são devolvidas ao orçamento.
+        
+        Args:
+            phase_id: ID da fase
+            
+        Returns:
+            Número de requisições canceladas antes de começar
+        """
+        with self._lock:
+            futures = self._pending.pop(phase_id, [])
+        
+        count = sum(1 for f in futures if f.cancel())
+        with self._lock:
+            # Requisições que não chegaram à API não consomem o orçamento
+            self.used -= count
+            self.cancelled += count
+        return count
+    
+    def cancel_all(self, keep: Optional[int] = None) -> int:
+        """
+        Cancela as requisições pendentes de todas as fases
+        
+        Args:
+            keep: ID de uma fase cujas requisições devem ser mantidas
+            
+        Returns:
+            Número de requisições canceladas antes de começar
+        """
+        with self._lock:
+            phase_ids = [pid for pid in self._pending if pid != keep]
+        return sum(self.cancel(pid) for pid in phase_ids)
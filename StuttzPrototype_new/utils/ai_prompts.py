@@ -0,0 +1,86 @@
+"""
+Prompts enviados à IA
+Este módulo centraliza a construção dos prompts, garantindo que o aplicativo
+e o pré-aquecimento do cache gerem exatamente o mesmo texto (e a mesma chave)
+"""
+
+from typing import List, Tuple  # Tipos para anotações de tipo
+from models.data_models import PhaseData  # Dados das fases
+
+# === LIMITES DE TOKENS ===
+STUDY_TIP_MAX_TOKENS = 150  # Limite de tokens das dicas de estudo
+EXPLANATION_MAX_TOKENS = 300  # Limite de tokens das explicações de quiz
+
+def build_study_tip_prompt(phase_title: str, topic: str) -> str:
+    """
+    Constrói o prompt usado para gerar uma dica de estudo
+    
+    Args:
+        phase_title: Título da fase (ex: "Fundamentos")
+        topic: Tópico específico dentro da fase (ex: "Instalar Python")
+        
+    Returns:
+        O prompt a ser enviado ao modelo
+    """
+    return f"""
+        Por favor, forneça uma dica de estudo prática e curta para alguém 
+        estudando '{phase_title}', especificamente sobre '{topic}'.
+        
+        A dica deve ter no máximo 2 frases e fornecer uma sugestão 
+        concreta e útil para melhorar o aprendizado.
+        """
+
+def build_explanation_prompt(question: str, correct_answer: str) -> str:
+    """
+    Constrói o prompt usado para explicar uma resposta de quiz
+    
+    Args:
+        question: A pergunta do quiz
+        correct_answer: A resposta correta do quiz
+        
+    Returns:
+        O prompt a ser enviado ao modelo
+    """
+    return f"""
+        Explique a seguinte pergunta e resposta de forma didática para um estudante:
+        
+        Pergunta: {question}
+        Resposta correta: {correct_answer}
+        
+        Explicação (máximo 3 parágrafos, linguagem acessível):
+        """
+
+def study_tip_topic(phase: PhaseData) -> str:
+    """
+    Retorna o tópico usado pelo botão de dica de estudo de uma fase
+    
+    Args:
+        phase: Dados da fase
+        
+    Returns:
+        A primeira tarefa da fase ou "Python" se ela não tiver tarefas
+    """
+    return phase.tasks[0] if phase.tasks else "Python"
+
+def phase_prompts(phase: PhaseData, all_tasks: bool = False) -> List[Tuple[str, int]]:
+    """
+    Lista os prompts que o aplicativo pode enviar a partir de uma fase
+    
+    Args:
+        phase: Dados da fase
+        all_tasks: Se True, inclui uma dica para cada tarefa; caso contrário,
+                   apenas a dica exibida pelo botão (primeira tarefa)
+        
+    Returns:
+        Lista de pares (prompt, limite de tokens): dicas de estudo seguidas da
+        explicação do quiz
+    """
+    topics = list(phase.tasks) if all_tasks else []
+    prompts = [(build_study_tip_prompt(phase.title, topic), STUDY_TIP_MAX_TOKENS)
+               for topic in (topics or [study_tip_topic(phase)])]
+    
+    quiz = phase.quiz
+    if quiz is not None and quiz.options:
+        prompts.append((build_explanation_prompt(quiz.question, quiz.correct_answer), EXPLANATION_MAX_TOKENS))
+    
+    return prompts
@@ -0,0 +1,333 @@
+"""
+Provedores de IA
+Este módulo define a interface usada para gerar texto e suas implementações:
+a API do Gemini, um provedor local simulado (sem rede) e um provedor que
+grava e reproduz respostas a partir de um arquivo
+"""
+
+import hashlib  # Módulo para gerar respostas e chaves determinísticas
+import json  # Módulo para manipulação de dados JSON
+import os  # Módulo para interagir com o sistema operacional
+import random  # Usado na injeção de falhas do provedor simulado
+import threading  # Módulo para sincronização entre threads
+import time  # Módulo para simular a latência
+from abc import ABC, abstractmethod  # Classes base abstratas
+from typing import Dict, Iterator, Optional  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+from utils.metrics import metrics  # Contagem de tokens consumidos
+from utils.persistence import atomic_write_json  # Gravação atômica de arquivos JSON
+
+class AIProvider(ABC):
+    """
+    Interface comum dos provedores de IA
+    
+    Os métodos lançam exceções em caso de falha; as novas tentativas, o
+    disjuntor e as mensagens de erro ficam em utils.ai_helper.
+    """
+    
+    name = "base"  # Nome usado na configuração (Config.AI_PROVIDER)
+    
+    @property
+    def available(self) -> bool:
+        """Indica se o provedor está configurado e pode receber requisições"""
+        return True
+    
+    @property
+    def cache_namespace(self) -> str:
+        """
+        Identificador usado nas chaves do cache de respostas
+        
+        Evita que respostas de provedores diferentes (ex: simuladas) sejam
+        servidas como se fossem do Gemini
+        """
+        return self.name
+    
+    def connect(self):
+        """Prepara o provedor para a primeira requisição (padrão: nada a fazer)"""
+    
+    @abstractmethod
+    def generate(self, prompt: str, max_tokens: int) -> str:
+        """
+        Gera a resposta completa para um prompt
+        
+        Args:
+            prompt: O texto enviado ao modelo
+            max_tokens: Limite máximo de tokens na resposta
+            
+        Returns:
+            O texto gerado
+        """
+    
+    def record_usage(self, prompt_tokens: Optional[int], completion_tokens: Optional[int]):
+        """
+        Registra os tokens consumidos por uma requisição (painel de diagnóstico)
+        
+        Args:
+            prompt_tokens: Tokens do prompt (None se desconhecido)
+            completion_tokens: Tokens da resposta (None se desconhecido)
+        """
+        if prompt_tokens:
+            metrics.increment("stuttz_ai_tokens_total", prompt_tokens, provider=self.name, kind="prompt")
+        if completion_tokens:
+            metrics.increment("stuttz_ai_tokens_total", completion_tokens, provider=self.name, kind="completion")
+    
+    def stream(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        """
+        Gera a resposta em partes (padrão: a resposta completa de uma vez)
+        
+        Args:
+            prompt: O texto enviado ao modelo
+            max_tokens: Limite máximo de tokens na resposta
+            
+        Yields:
+            Trechos de texto da resposta
+        """
+        yield self.generate(prompt, max_tokens)
+
+class GeminiProvider(AIProvider):
+    """Provedor que usa a API do Google Gemini"""
+    
+    name = "gemini"
+    
+    def __init__(self, api_key: Optional[str] = None, model: str = Config.AI_MODEL):
+        """
+        Args:
+            api_key: Chave da API (padrão: variável de ambiente GEMINI_API_KEY)
+            model: Modelo do Gemini a ser usado
+        """
+        self.model = model
+        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        self._client = None  # Criado no primeiro uso (ver connect)
+        self._client_lock = threading.Lock()
+        
+        if not self.api_key:
+            # Se a chave não estiver definida, exibe um erro (o cliente nunca será criado)
+            print("❌ ERRO: GEMINI_API_KEY não encontrada no ambiente ou arquivo .env")
+    
+    @property
+    def available(self) -> bool:
+        return bool(self.api_key)
+    
+    @property
+    def cache_namespace(self) -> str:
+        # Mantém as chaves já existentes no cache (apenas o nome do modelo)
+        return self.model
+    
+    def connect(self):
+        """Importa o SDK do Gemini e cria o cliente (apenas uma vez)"""
+        with self._client_lock:
+            if self._client is None and self.api_key:
+                # Importado aqui: o SDK é pesado e só é necessário quando a IA é usada
+                from google import genai
+                
+                # Cria um cliente da API Gemini com tempo máximo por tentativa (em milissegundos)
+                self._client = genai.Client(
+                    api_key=self.api_key,
+                    http_options={'timeout': int(Config.AI_TIMEOUT_SECONDS * 1000)}
+                )
+    
+    @property
+    def client(self):
+        """Cliente da API, criado na primeira requisição se warm_up não tiver sido chamado"""
+        if self._client is None:
+            self.connect()
+        return self._client
+    
+    def _config(self, max_tokens: int) -> Dict[str, float]:
+        """Parâmetros de geração enviados à API"""
+        return {
+            'max_output_tokens': max_tokens,  # Limita o tamanho da resposta
+            'temperature': 0.7,  # Define a temperatura (criatividade) da resposta
+        }
+    
+    def generate(self, prompt: str, max_tokens: int) -> str:
+        response = self.client.models.generate_content(
+            model=self.model,  # Usa o modelo definido nas configurações
+            contents=prompt,  # Envia o prompt para o modelo
+            config=self._config(max_tokens)
+        )
+        self._record_response_usage(response)
+        # Retorna o texto da resposta, garantindo que seja uma string válida
+        return response.text if response.text is not None else ""
+    
+    def stream(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        stream = self.client.models.generate_content_stream(
+            model=self.model,
+            contents=prompt,
+            config=self._config(max_tokens)
+        )
+        last = None
+        for chunk in stream:
+            last = chunk
+            # Alguns trechos (ex: metadados finais) não possuem texto
+            if chunk.text:
+                yield chunk.text
+        # O último trecho traz o total de tokens da requisição
+        if last is not None:
+            self._record_response_usage(last)
+    
+    def _record_response_usage(self, response):
+        """Registra os tokens informados em usage_metadata (se presentes)"""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            self.record_usage(getattr(usage, "prompt_token_count", None),
+                              getattr(usage, "candidates_token_count", None))
+
+class FakeProviderError(Exception):
+    """Falha injetada pelo provedor simulado (tratada como erro temporário)"""
+    
+    def __init__(self, code: int = 503):
+        self.code = code  # Código HTTP simulado, usado por is_transient_error
+        super().__init__(f"Falha simulada da IA ({code})")
+
+class FakeProvider(AIProvider):
+    """
+    Provedor local e determinístico, sem acesso à rede
+    
+    A resposta depende apenas do prompt. A latência e a taxa de falhas são
+    configuráveis, permitindo medir e testar os caminhos de IA offline.
+    """
+    
+    name = "fake"
+    
+    def __init__(self, latency: float = Config.AI_FAKE_LATENCY_SECONDS,
+                 failure_rate: float = Config.AI_FAKE_FAILURE_RATE,
+                 failure_code: int = 503, seed: Optional[int] = None,
+                 chunk_words: int = 5):
+        """
+        Args:
+            latency: Tempo (s) de cada resposta completa
+            failure_rate: Probabilidade (0 a 1) de cada chamada falhar
+            failure_code: Código HTTP das falhas injetadas
+            seed: Semente do sorteio das falhas (para execuções reproduzíveis)
+            chunk_words: Palavras por trecho no modo streaming
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.failure_code = failure_code
+        self.chunk_words = max(1, chunk_words)
+        self.calls = 0  # Chamadas recebidas
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def _maybe_fail(self):
+        """Conta a chamada e lança uma falha simulada conforme a taxa configurada"""
+        with self._lock:
+            self.calls += 1
+            fail = self._random.random() < self.failure_rate
+        if fail:
+            raise FakeProviderError(self.failure_code)
+    
+    def respond(self, prompt: str, max_tokens: int) -> str:
+        """Resposta determinística para o prompt (sem latência nem falhas)"""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+        words = " ".join(prompt.split()[:max(1, max_tokens // 10)])
+        return f"[resposta simulada {digest}] {words}"
+    
+    def generate(self, prompt: str, max_tokens: int) -> str:
+        self._maybe_fail()
+        time.sleep(self.latency)
+        response = self.respond(prompt, max_tokens)
+        # Sem tokenizador: uma palavra equivale a um token
+        self.record_usage(len(prompt.split()), len(response.split()))
+        return response
+    
+    def stream(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        self._maybe_fail()
+        words = self.respond(prompt, max_tokens).split(" ")
+        self.record_usage(len(prompt.split()), len(words))
+        chunks = [" ".join(words[i:i + self.chunk_words]) for i in range(0, len(words), self.chunk_words)]
+        
+        # Distribuir a latência entre os trechos
+        delay = self.latency / len(chunks)
+        for i, chunk in enumerate(chunks):
+            time.sleep(delay)
+            yield chunk if i == 0 else " " + chunk
+
+class RecordingMissError(LookupError):
+    """O prompt não existe no arquivo de gravações (modo reprodução)"""
+
+class RecordReplayProvider(AIProvider):
+    """
+    Provedor que grava respostas em disco e as reproduz depois
+    
+    No modo "record", repassa as chamadas a outro provedor e grava cada
+    resposta. No modo "replay", responde apenas com o que foi gravado,
+    sem acessar a rede.
+    """
+    
+    name = "replay"
+    
+    def __init__(self, path: str = Config.AI_RECORDINGS_FILE, mode: str = "replay",
+                 inner: Optional[AIProvider] = None):
+        """
+        Args:
+            path: Arquivo JSON das gravações
+            mode: "record" ou "replay"
+            inner: Provedor usado no modo "record" (padrão: GeminiProvider)
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Modo de gravação inválido: {mode}")
+        
+        self.path = path
+        self.mode = mode
+        self.inner = inner if inner is not None or mode == "replay" else GeminiProvider()
+        self._recordings: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._recordings = json.load(f).get("responses", {})
+    
+    @property
+    def available(self) -> bool:
+        return self.mode == "replay" or self.inner.available
+    
+    @staticmethod
+    def key(prompt: str, max_tokens: int) -> str:
+        """Chave de uma gravação (hash do prompt e do limite de tokens)"""
+        return hashlib.sha256(f"{max_tokens}\n{prompt}".encode("utf-8")).hexdigest()
+    
+    def connect(self):
+        if self.inner is not None:
+            self.inner.connect()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._recordings)
+    
+    def generate(self, prompt: str, max_tokens: int) -> str:
+        key = self.key(prompt, max_tokens)
+        
+        if self.mode == "replay":
+            with self._lock:
+                if key not in self._recordings:
+                    raise RecordingMissError(f"Resposta não gravada para o prompt {key[:12]}")
+                return self._recordings[key]
+        
+        response = self.inner.generate(prompt, max_tokens)
+        with self._lock:
+            self._recordings[key] = response
+            payload = {"responses": dict(self._recordings)}
+        atomic_write_json(self.path, payload)
+        return response
+
+def create_provider(name: Optional[str] = None) -> AIProvider:
+    """
+    Cria o provedor de IA configurado
+    
+    Args:
+        name: "gemini", "fake", "record" ou "replay" (padrão: variável de
+              ambiente STUTTZ_AI_PROVIDER ou Config.AI_PROVIDER)
+        
+    Returns:
+        Instância do provedor
+    """
+    name = (name or os.getenv("STUTTZ_AI_PROVIDER") or Config.AI_PROVIDER).lower()
+    if name == "fake":
+        return FakeProvider()
+    if name in ("record", "replay"):
+        return RecordReplayProvider(mode=name)
+    if name != "gemini":
+        print(f"⚠️ Provedor de IA '{name}' desconhecido, usando Gemini")
+    return GeminiProvider()
@@ -0,0 +1,122 @@
+"""
+Catálogo de cursos
+Este módulo carrega o conteúdo dos cursos (fases, tarefas e quizzes) uma
+única vez por processo e o compartilha entre todas as sessões. Cada sessão
+recebe apenas uma camada leve com o seu próprio progresso.
+"""
+
+import json  # Módulo para manipulação de dados JSON
+import os  # Módulo para interagir com o sistema operacional
+import threading  # Módulo para sincronização entre threads
+from typing import Any, Dict, List, Optional  # Tipos para anotações de tipo
+from config import Config, Messages  # Importa as configurações e mensagens do aplicativo
+from models.data_models import PhaseData, PhaseStatus, RoadmapData, create_default_roadmap  # Modelos e roadmap padrão
+from utils.roadmap_loader import load_roadmap, RoadmapValidationError  # Leitura do roadmap
+
+def load_course(path: str = Config.DEFAULT_ROADMAP_FILE) -> RoadmapData:
+    """
+    Carrega o conteúdo de um curso, usando o roadmap padrão em caso de erro
+    
+    Args:
+        path: Caminho do arquivo de roadmap
+        
+    Returns:
+        Dados do curso (nome, fases, etc.). Tarefas e opções dos quizzes são
+        tuplas, pois o conteúdo é compartilhado entre sessões e nunca deve ser alterado
+    """
+    course = None
+    if os.path.exists(path):
+        try:
+            course = load_roadmap(path)
+        except json.JSONDecodeError as e:
+            # Erro específico para problemas de formatação JSON
+            print(f"❌ Erro ao decodificar JSON do roadmap: {e}")
+        except RoadmapValidationError as e:
+            # Erro específico para dados inválidos no roadmap
+            print(f"❌ Roadmap inválido: {e}")
+        except Exception as e:
+            # Captura outros erros inesperados
+            print(f"❌ Erro inesperado ao carregar o roadmap: {e}")
+        if course is None:
+            print(f"💬 {Messages.DATA_LOAD_ERROR}")
+    
+    if course is None:
+        # Criar roadmap padrão se o arquivo não existir ou ocorrer erro na leitura
+        print("ℹ️ Usando roadmap padrão")
+        course = create_default_roadmap()
+    
+    return RoadmapData.from_dict(course)
+
+class CourseCatalog:
+    """
+    Cache dos cursos carregados pelo processo
+    
+    Cada arquivo de curso é lido uma única vez; todas as sessões recebem o
+    mesmo objeto, que deve ser tratado como somente leitura.
+    """
+    
+    def __init__(self):
+        self._courses: Dict[str, RoadmapData] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, path: str = Config.DEFAULT_ROADMAP_FILE) -> RoadmapData:
+        """
+        Obtém o conteúdo de um curso, carregando-o na primeira chamada
+        
+        Args:
+            path: Caminho do arquivo de roadmap
+            
+        Returns:
+            Dados do curso compartilhados entre as sessões (somente leitura)
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            course = self._courses.get(key)
+            if course is None:
+                course = self._courses[key] = load_course(path)
+        return course
+    
+    def clear(self):
+        """Descarta os cursos carregados (a próxima chamada relê os arquivos)"""
+        with self._lock:
+            self._courses.clear()
+
+def build_session_roadmap(course: RoadmapData,
+                          phase_states: Optional[Dict[int, Dict[str, Any]]] = None) -> RoadmapData:
+    """
+    Cria o roadmap de uma sessão sobre o conteúdo compartilhado de um curso
+    
+    Cada fase da sessão é uma cópia da fase do curso (PhaseData.with_progress):
+    título, tarefas e quiz continuam sendo os objetos compartilhados, e apenas
+    o status e o quiz_completed pertencem à sessão.
+    
+    Args:
+        course: Conteúdo do curso obtido do catálogo
+        phase_states: Progresso salvo {phase_id: {"status", "quiz_completed"}}.
+                      Se None, mantém o progresso gravado no próprio arquivo do curso
+        
+    Returns:
+        Roadmap da sessão
+    """
+    phases: List[PhaseData] = []
+    for index, phase in enumerate(course.phases):
+        if phase_states is None:
+            phases.append(phase.with_progress(phase.status, phase.quiz_completed))
+            continue
+        
+        # Partir do estado inicial (apenas a primeira fase desbloqueada)
+        status = PhaseStatus.UNLOCKED if index == 0 else PhaseStatus.LOCKED
+        quiz_completed = False
+        state = phase_states.get(phase.id)
+        if state:
+            try:
+                status = PhaseStatus(state.get("status", status))
+            except ValueError:
+                print(f"⚠️ Status salvo inválido para a fase {phase.id}: {state.get('status')}")
+            quiz_completed = bool(state.get("quiz_completed", False))
+        phases.append(phase.with_progress(status, quiz_completed))
+    
+    return RoadmapData(course.course_name, course.total_phases, phases)
+
+# Catálogo compartilhado por todas as sessões do processo
+course_catalog = CourseCatalog()
@@ -0,0 +1,211 @@
+"""
+Pré-aquecimento do cache da IA
+Este módulo gera antecipadamente as dicas de estudo e explicações de um curso
+inteiro, para que os botões do aplicativo respondam direto do cache
+
+Uso pela linha de comando:
+    python -m utils.course_warmer [--course roadmap_data.json] [--concurrency 4] [--rate 2.0] [--provider gemini]
+"""
+
+import argparse  # Módulo para ler os argumentos da linha de comando
+import threading  # Módulo para sincronização entre threads
+import time  # Módulo para controlar a taxa de requisições
+from concurrent.futures import ThreadPoolExecutor  # Pool de threads das requisições
+from dataclasses import dataclass, field  # Decorador para classes de dados
+from typing import Callable, List, Optional, Tuple  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+from models.data_models import RoadmapData  # Dados do roadmap
+from utils.ai_cache import AICache, get_shared_ai_cache, make_cache_key  # Cache das respostas da IA
+from utils.ai_helper import (  # Comunicação com o provedor de IA
+    cache_namespace, get_gemini_response, is_error_response, set_provider
+)
+from utils.ai_prompts import phase_prompts  # Mesmos prompts usados pelo aplicativo
+
+class RateLimiter:
+    """
+    Limitador de taxa no formato "token bucket"
+    
+    Permite rajadas de até `burst` requisições e, depois disso, no máximo
+    `rate` requisições por segundo, compartilhadas entre todas as threads.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Requisições por segundo (0 ou negativo desativa o limite)
+            burst: Número máximo de requisições liberadas de uma vez
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Bloqueia até que uma requisição possa ser feita"""
+        if self.rate <= 0:
+            return
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # Repor as fichas proporcionalmente ao tempo decorrido
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+@dataclass
+class WarmReport:
+    """Resultado de um pré-aquecimento"""
+    total: int = 0  # Prompts encontrados no curso
+    cached: int = 0  # Prompts que já estavam no cache
+    generated: int = 0  # Respostas geradas e armazenadas
+    failed: int = 0  # Requisições que falharam (não são armazenadas)
+    elapsed: float = 0.0  # Duração total, em segundos
+    errors: List[str] = field(default_factory=list)  # Mensagens de erro recebidas
+
+def collect_prompts(roadmap_data: RoadmapData) -> List[Tuple[str, int]]:
+    """
+    Lista todos os prompts que o aplicativo pode enviar para um curso
+    
+    Inclui uma dica de estudo para cada tarefa de cada fase (ou para o tópico
+    padrão, se ela não tiver tarefas) e a explicação do quiz de cada fase.
+    
+    Args:
+        roadmap_data: Dados do roadmap (ver utils.course_catalog.load_course)
+        
+    Returns:
+        Lista de pares (prompt, limite de tokens), sem repetições
+    """
+    prompts: List[Tuple[str, int]] = []
+    seen = set()
+    
+    for phase in roadmap_data.phases:
+        # Dicas de estudo: o botão usa a primeira tarefa, mas todas são geradas
+        for prompt, max_tokens in phase_prompts(phase, all_tasks=True):
+            if prompt not in seen:
+                seen.add(prompt)
+                prompts.append((prompt, max_tokens))
+    
+    return prompts
+
+def warm_course(roadmap_data: RoadmapData,
+                cache: Optional[AICache] = None,
+                concurrency: int = Config.WARM_CONCURRENCY,
+                rate_per_second: float = Config.WARM_RATE_PER_SECOND,
+                generate: Callable[..., str] = get_gemini_response,
+                on_progress: Optional[Callable[[int, int], None]] = None) -> WarmReport:
+    """
+    Gera e armazena no cache todas as respostas de IA de um curso
+    
+    Prompts que já estão no cache são ignorados. As requisições são feitas em
+    paralelo (até `concurrency` ao mesmo tempo) respeitando `rate_per_second`.
+    O cache é gravado no disco uma única vez, ao final.
+    
+    Args:
+        roadmap_data: Dados do roadmap (ver utils.course_catalog.load_course)
+        cache: Cache de destino (padrão: cache compartilhado do aplicativo)
+        concurrency: Número máximo de requisições simultâneas
+        rate_per_second: Máximo de requisições iniciadas por segundo
+        generate: Função que envia o prompt à IA (padrão: get_gemini_response)
+        on_progress: Callback chamado com (concluídos, total) após cada prompt
+        
+    Returns:
+        WarmReport com o resumo do pré-aquecimento
+    """
+    cache = cache if cache is not None else get_shared_ai_cache()
+    start = time.perf_counter()
+    
+    prompts = collect_prompts(roadmap_data)
+    report = WarmReport(total=len(prompts))
+    
+    # Separar os prompts que ainda não estão no cache
+    pending = []
+    for prompt, max_tokens in prompts:
+        key = make_cache_key(prompt, cache_namespace(), max_tokens)
+        if cache.contains(key):
+            report.cached += 1
+        else:
+            pending.append((key, prompt, max_tokens))
+    
+    limiter = RateLimiter(rate_per_second, burst=concurrency)
+    lock = threading.Lock()  # Protege o relatório
+    done = [report.cached]
+    
+    def run(key: str, prompt: str, max_tokens: int):
+        limiter.acquire()
+        try:
+            response = generate(prompt, max_tokens=max_tokens)
+            ok = bool(response) and not is_error_response(response)
+        except Exception as e:
+            response, ok = str(e), False
+        
+        if ok:
+            # Gravar no disco apenas ao final do lote
+            cache.set(key, response, persist=False)
+        
+        with lock:
+            if ok:
+                report.generated += 1
+            else:
+                report.failed += 1
+                report.errors.append(response)
+            done[0] += 1
+            completed = done[0]
+        
+        if on_progress:
+            on_progress(completed, report.total)
+    
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency),
+                                thread_name_prefix="stuttz-warm") as pool:
+            for item in pending:
+                pool.submit(run, *item)
+        
+        cache.save()
+    
+    report.elapsed = time.perf_counter() - start
+    return report
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando"""
+    # Importado aqui para não carregar o catálogo ao usar apenas warm_course
+    from utils.course_catalog import load_course
+    
+    parser = argparse.ArgumentParser(description="Pré-gera as respostas de IA de um curso")
+    parser.add_argument("--course", default=Config.DEFAULT_ROADMAP_FILE,
+                        help="arquivo do roadmap (padrão: %(default)s)")
+    parser.add_argument("--concurrency", type=int, default=Config.WARM_CONCURRENCY,
+                        help="requisições simultâneas (padrão: %(default)s)")
+    parser.add_argument("--rate", type=float, default=Config.WARM_RATE_PER_SECOND,
+                        help="requisições por segundo, 0 = sem limite (padrão: %(default)s)")
+    parser.add_argument("--provider", choices=("gemini", "fake", "record", "replay"),
+                        help="provedor de IA (padrão: Config.AI_PROVIDER)")
+    args = parser.parse_args(argv)
+    
+    if args.provider:
+        # Importado aqui pelo mesmo motivo de load_course
+        from utils.ai_providers import create_provider
+        set_provider(create_provider(args.provider))
+    
+    def show_progress(completed: int, total: int):
+        print(f"  {completed}/{total}", end="\r", flush=True)
+    
+    report = warm_course(load_course(args.course), concurrency=args.concurrency,
+                         rate_per_second=args.rate, on_progress=show_progress)
+    
+    print(f"✅ {report.total} prompts: {report.cached} já em cache, "
+          f"{report.generated} gerados, {report.failed} falhas ({report.elapsed:.1f}s)")
+    for error in report.errors[:5]:
+        print(f"❌ {error}")
+    
+    return 1 if report.failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
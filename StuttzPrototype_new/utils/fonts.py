@@ -0,0 +1,261 @@
+"""
+Fontes locais do aplicativo
+Este módulo registra as fontes guardadas em assets/fonts, para que a primeira
+renderização não dependa de download, e gera versões reduzidas (subsets)
+apenas com os caracteres usados pelo aplicativo
+
+Gerar os subsets (requer o pacote opcional fonttools):
+    python -m utils.fonts --subset
+"""
+
+import argparse  # Módulo para ler os argumentos da linha de comando
+import glob  # Módulo para localizar os arquivos de fonte
+import hashlib  # Módulo para identificar a versão de cada subset
+import json  # Módulo para ler o conteúdo do curso
+import os  # Módulo para interagir com o sistema operacional
+from typing import Dict, Iterable, List, Optional  # Tipos para anotações de tipo
+from config import Config, Messages  # Configurações e textos exibidos pelo aplicativo
+from utils.persistence import atomic_write_json  # Gravação atômica de arquivos JSON
+
+# Extensões aceitas pelo Flutter para registrar fontes
+FONT_EXTENSIONS = (".ttf", ".otf")
+
+# Pasta (dentro da pasta de fontes) com os subsets gerados
+SUBSET_DIR = "subset"
+
+# Arquivo (dentro de SUBSET_DIR) que associa cada fonte ao seu subset atual
+MANIFEST_FILE = "manifest.json"
+
+# Intervalos Unicode sempre incluídos nos subsets: ASCII, Latin-1 (acentos do
+# português), Latin Extended-A e pontuação geral (aspas, travessões, reticências)
+BASE_RANGES = ((0x20, 0x7E), (0xA0, 0xFF), (0x100, 0x17F), (0x2010, 0x206F))
+
+def fonts_path(assets_dir: str = Config.ASSETS_DIR) -> str:
+    """Retorna o caminho da pasta de fontes"""
+    return os.path.join(assets_dir, Config.FONTS_DIR)
+
+def find_font_file(family: str, assets_dir: str = Config.ASSETS_DIR) -> Optional[str]:
+    """
+    Localiza o arquivo de uma família de fontes em assets/fonts
+    
+    Aceita os nomes usados nos downloads do Google Fonts (ex:
+    "Roboto-VariableFont_wdth,wght.ttf" ou "Roboto-Regular.ttf"), dando
+    preferência às fontes variáveis, que incluem todos os pesos.
+    
+    Args:
+        family: Nome da família (ex: "Roboto")
+        assets_dir: Pasta de arquivos estáticos
+        
+    Returns:
+        Caminho do arquivo ou None se nenhum for encontrado
+    """
+    candidates = [
+        path for path in glob.glob(os.path.join(fonts_path(assets_dir), f"{family}*"))
+        if path.lower().endswith(FONT_EXTENSIONS)
+    ]
+    if not candidates:
+        return None
+    
+    def priority(path: str):
+        name = os.path.basename(path)
+        return (0 if "VariableFont" in name else 1 if "Regular" in name else 2, name)
+    
+    return sorted(candidates, key=priority)[0]
+
+def app_text(course_file: str = Config.DEFAULT_ROADMAP_FILE) -> str:
+    """
+    Reúne os textos fixos do aplicativo (mensagens e conteúdo do curso)
+    
+    Args:
+        course_file: Arquivo do roadmap
+        
+    Returns:
+        Texto com todos os caracteres que o aplicativo exibe
+    """
+    parts: List[str] = [Config.APP_NAME]
+    parts += [value for name, value in vars(Messages).items() if name.isupper() and isinstance(value, str)]
+    
+    if os.path.exists(course_file):
+        with open(course_file, "r", encoding="utf-8") as f:
+            # O JSON sem escape de caracteres contém exatamente o texto exibido
+            parts.append(json.dumps(json.load(f), ensure_ascii=False))
+    
+    return "".join(parts)
+
+def glyph_set(text: str) -> str:
+    """
+    Retorna os caracteres incluídos nos subsets
+    
+    Args:
+        text: Texto específico do aplicativo
+        
+    Returns:
+        Caracteres únicos, ordenados (intervalos básicos + texto)
+    """
+    chars = set(text)
+    for start, end in BASE_RANGES:
+        chars.update(chr(code) for code in range(start, end + 1))
+    return "".join(sorted(chars))
+
+def file_fingerprint(path: str) -> List[int]:
+    """Tamanho e data de modificação de um arquivo (para detectar alterações)"""
+    if not os.path.exists(path):
+        return [0, 0]
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def manifest_path(assets_dir: str = Config.ASSETS_DIR) -> str:
+    """Retorna o caminho do manifesto dos subsets"""
+    return os.path.join(fonts_path(assets_dir), SUBSET_DIR, MANIFEST_FILE)
+
+def load_manifest(assets_dir: str = Config.ASSETS_DIR) -> Dict[str, Dict]:
+    """Lê o manifesto dos subsets (vazio se ainda não existir)"""
+    try:
+        with open(manifest_path(assets_dir), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def subset_path(source: str, glyphs: str) -> str:
+    """
+    Caminho do subset de uma fonte para um conjunto de caracteres
+    
+    O nome inclui um hash da fonte original e dos caracteres: se qualquer um
+    mudar, um novo subset é gerado (e o antigo deixa de ser usado).
+    
+    Args:
+        source: Caminho da fonte original
+        glyphs: Caracteres incluídos
+        
+    Returns:
+        Caminho do arquivo do subset
+    """
+    stat = os.stat(source)
+    key = f"{os.path.basename(source)}\n{stat.st_size}\n{stat.st_mtime_ns}\n{glyphs}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+    name, ext = os.path.splitext(os.path.basename(source))
+    return os.path.join(os.path.dirname(source), SUBSET_DIR, f"{name}-{digest}{ext}")
+
+def build_subset(source: str, glyphs: str) -> Optional[str]:
+    """
+    Gera (ou reaproveita) o subset de uma fonte
+    
+    Args:
+        source: Caminho da fonte original
+        glyphs: Caracteres incluídos
+        
+    Returns:
+        Caminho do subset, ou None se o fonttools não estiver instalado
+    """
+    target = subset_path(source, glyphs)
+    if os.path.exists(target):
+        return target  # Subset já gerado para esta fonte e estes caracteres
+    
+    try:
+        from fontTools import subset  # Dependência opcional, usada só nesta ferramenta
+    except ImportError:
+        print("⚠️ Instale o pacote 'fonttools' para gerar os subsets das fontes")
+        return None
+    
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    options = subset.Options()
+    options.layout_features = ["*"]  # Mantém ligaduras e kerning
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    
+    font = subset.load_font(source, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=glyphs)
+    subsetter.subset(font)
+    
+    # Gravar em um arquivo temporário e renomear, para nunca deixar um subset incompleto
+    temp_path = target + ".tmp"
+    subset.save_font(font, temp_path, options)
+    os.replace(temp_path, target)
+    return target
+
+def resolve_fonts(families: Iterable[str], assets_dir: str = Config.ASSETS_DIR,
+                  use_subset: bool = Config.FONT_SUBSET,
+                  course_file: str = Config.DEFAULT_ROADMAP_FILE) -> Dict[str, str]:
+    """
+    Determina os arquivos locais de cada família de fontes
+    
+    Na abertura do aplicativo nenhum subset é gerado nem conferido caractere a
+    caractere: o manifesto gerado por --subset indica o subset de cada fonte,
+    que só é usado se a fonte original e o arquivo do curso não tiverem mudado
+    desde então. Caso contrário, a fonte completa é usada.
+    
+    Args:
+        families: Famílias usadas pelo aplicativo
+        assets_dir: Pasta de arquivos estáticos
+        use_subset: Se True, prefere os subsets já gerados
+        course_file: Arquivo do roadmap (os textos do curso entram nos subsets)
+        
+    Returns:
+        Dicionário {família: caminho relativo a assets_dir}, apenas das
+        famílias encontradas
+    """
+    manifest = load_manifest(assets_dir) if use_subset else {}
+    course = file_fingerprint(course_file)
+    
+    fonts: Dict[str, str] = {}
+    for family in dict.fromkeys(families):
+        source = find_font_file(family, assets_dir)
+        if source is None:
+            print(f"⚠️ Fonte '{family}' não encontrada em {fonts_path(assets_dir)}; usando a fonte padrão")
+            continue
+        
+        path = source
+        entry = manifest.get(family)
+        if (entry and entry.get("source") == os.path.basename(source)
+                and entry.get("source_fingerprint") == file_fingerprint(source)
+                and entry.get("course_fingerprint") == course):
+            candidate = os.path.join(os.path.dirname(manifest_path(assets_dir)), entry["subset"])
+            if os.path.exists(candidate):
+                path = candidate
+        
+        # O Flet espera caminhos relativos à pasta de assets, com "/"
+        fonts[family] = "/" + os.path.relpath(path, assets_dir).replace(os.sep, "/")
+    return fonts
+
+def app_font_families() -> List[str]:
+    """Famílias de fontes usadas pelas telas"""
+    return [Config.TITLE_FONT, Config.INTERFACE_FONT, Config.TEXT_FONT]
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Fontes locais do aplicativo")
+    parser.add_argument("--subset", action="store_true", help="gera os subsets das fontes")
+    parser.add_argument("--assets", default=Config.ASSETS_DIR, help="pasta de assets (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+    
+    glyphs = glyph_set(app_text())
+    manifest = load_manifest(args.assets)
+    for family in dict.fromkeys(app_font_families()):
+        source = find_font_file(family, args.assets)
+        if source is None:
+            print(f"❌ {family}: nenhum arquivo {'/'.join(FONT_EXTENSIONS)} em {fonts_path(args.assets)}")
+            continue
+        
+        if not args.subset:
+            print(f"✅ {family}: {source}")
+            continue
+        
+        target = build_subset(source, glyphs)
+        if target is None:
+            return 1
+        manifest[family] = {
+            "source": os.path.basename(source),
+            "source_fingerprint": file_fingerprint(source),
+            "course_fingerprint": file_fingerprint(Config.DEFAULT_ROADMAP_FILE),
+            "subset": os.path.basename(target),
+        }
+        print(f"✅ {family}: {source} ({os.path.getsize(source) // 1024} KiB) -> "
+              f"{target} ({os.path.getsize(target) // 1024} KiB, {len(glyphs)} caracteres)")
+    
+    if args.subset and manifest:
+        atomic_write_json(manifest_path(args.assets), manifest)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
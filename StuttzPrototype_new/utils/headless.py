@@ -0,0 +1,99 @@
+"""
+Páginas sem interface (modo headless)
+Este módulo define adaptadores que substituem o ft.Page do Flet, permitindo
+executar o AppController e as views sem um cliente conectado: em testes de
+carga, benchmarks e scripts que simulam muitos estudantes em um só processo
+"""
+
+import threading  # Módulo para sincronização entre threads
+import time  # Módulo para registrar o momento de cada envio
+from collections import deque  # Fila limitada com as atualizações mais recentes
+from typing import Any, Deque, List, Optional, Tuple  # Tipos para anotações de tipo
+
+class NullPage:
+    """
+    Página que aceita todas as operações usadas pelo aplicativo e não envia nada
+    
+    O AppController reconhece o atributo headless e passa a enviar as
+    atualizações para a página mesmo sem os controles estarem montados em
+    um cliente Flet
+    """
+    
+    headless = True  # Indica ao AppController que não há cliente conectado
+    
+    def __init__(self, web: bool = False, width: Optional[float] = None, height: Optional[float] = None):
+        """
+        Args:
+            web: Simula uma sessão do modo servidor (navegador)
+            width: Largura simulada da janela (None como antes da primeira renderização)
+            height: Altura simulada da janela
+        """
+        self.web = web
+        self.width = width
+        self.height = height
+        self.controls: List[Any] = []  # Controles adicionados com add()
+        self.title = ""
+        self.fonts = {}
+    
+    def add(self, *controls):
+        """Adiciona controles à página (apenas os guarda)"""
+        self.controls.extend(controls)
+        self.update()
+    
+    def update(self, *controls):
+        """Envia controles alterados ao cliente (nenhum, nesta página)"""
+
+class RecordingPage(NullPage):
+    """
+    Página sem interface que registra as atualizações enviadas
+    
+    Permite medir quantas atualizações cada ação produz e quantos controles
+    cada uma envia, sem precisar de um cliente Flet
+    """
+    
+    def __init__(self, web: bool = False, width: Optional[float] = None, height: Optional[float] = None,
+                 keep: int = 0):
+        """
+        Args:
+            web: Simula uma sessão do modo servidor (navegador)
+            width: Largura simulada da janela
+            height: Altura simulada da janela
+            keep: Número de atualizações mais recentes guardadas em updates (0 não guarda nenhuma)
+        """
+        super().__init__(web, width, height)
+        self.update_calls = 0  # Chamadas a update()
+        self.full_updates = 0  # Chamadas sem controles (a página inteira é verificada)
+        self.controls_sent = 0  # Controles enviados em atualizações parciais
+        self.updates: Deque[Tuple[float, Tuple[Any, ...]]] = deque(maxlen=keep)  # (momento, controles) das últimas atualizações
+        self._lock = threading.Lock()  # As views atualizam a página a partir de várias threads
+    
+    def update(self, *controls):
+        with self._lock:
+            self.update_calls += 1
+            if controls:
+                self.controls_sent += len(controls)
+            else:
+                self.full_updates += 1
+            self.updates.append((time.monotonic(), controls))
+    
+    def reset(self):
+        """Zera os contadores e descarta as atualizações guardadas"""
+        with self._lock:
+            self.update_calls = 0
+            self.full_updates = 0
+            self.controls_sent = 0
+            self.updates.clear()
+    
+    def stats(self) -> dict:
+        """
+        Resumo das atualizações registradas
+        
+        Returns:
+            Dicionário com chamadas, atualizações completas e controles enviados
+        """
+        with self._lock:
+            return {
+                "update_calls": self.update_calls,
+                "full_updates": self.full_updates,
+                "controls_sent": self.controls_sent,
+            }
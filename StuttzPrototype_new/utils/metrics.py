@@ -0,0 +1,325 @@
+"""
+Métricas de desempenho
+Este módulo registra a latência dos manipuladores de eventos, o tempo de
+construção das views, os bytes enviados ao cliente e as chamadas de IA, e
+exporta os valores em JSON ou no formato de texto do Prometheus
+"""
+
+import bisect  # Busca binária para localizar o intervalo de cada medida
+import functools  # Utilitários para criar decoradores
+import json  # Módulo para manipulação de dados JSON
+import math  # Usado para representar o limite +Inf do Prometheus
+import threading  # Módulo para sincronização entre threads
+import time  # Módulo para medir o tempo
+from collections import deque  # Fila limitada com as medidas mais recentes
+from contextlib import contextmanager  # Decorador para gerenciadores de contexto
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+
+# Limites (em segundos) dos intervalos dos histogramas de latência
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Limites (em bytes) dos intervalos do histograma de bytes enviados
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Identificador de uma série: nome da métrica + rótulos ordenados
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+class Histogram:
+    """
+    Distribuição de valores em intervalos fixos
+    
+    Além das contagens por intervalo (exportadas para o Prometheus), guarda as
+    medidas mais recentes para calcular percentis no painel de diagnóstico.
+    """
+    
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+                 window: int = Config.METRICS_WINDOW):
+        """
+        Args:
+            buckets: Limites superiores dos intervalos, em ordem crescente
+            window: Número de medidas recentes guardadas para os percentis
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # O último intervalo é o +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+    
+    def observe(self, value: float):
+        """Registra uma medida"""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.recent.append(value)
+    
+    def percentile(self, fraction: float) -> float:
+        """
+        Percentil das medidas recentes
+        
+        Args:
+            fraction: Fração entre 0 e 1 (ex: 0.95)
+            
+        Returns:
+            O valor do percentil, ou 0 se não houver medidas
+        """
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+    
+    def summary(self) -> Dict[str, Any]:
+        """Resumo da distribuição (usado no JSON e no painel)"""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": {str(le): n for le, n in zip(self.buckets + (math.inf,), self.counts)},
+        }
+
+class MetricsRegistry:
+    """
+    Registro de contadores e histogramas do processo
+    
+    Cada métrica pode ter rótulos (ex: handler="option_click"). Quando
+    desativado, os métodos de registro não fazem nada.
+    """
+    
+    def __init__(self, enabled: bool = Config.METRICS_ENABLED):
+        """
+        Args:
+            enabled: Se False, nenhuma medida é registrada
+        """
+        self.enabled = enabled
+        self._counters: Dict[SeriesKey, float] = {}
+        self._histograms: Dict[SeriesKey, Histogram] = {}
+        self._help: Dict[str, str] = {}  # Descrição de cada métrica (exportada no Prometheus)
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(name: str, labels: Dict[str, Any]) -> SeriesKey:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+    
+    def describe(self, name: str, text: str):
+        """Define a descrição de uma métrica"""
+        self._help[name] = text
+    
+    def increment(self, name: str, value: float = 1, **labels):
+        """
+        Soma um valor a um contador
+        
+        Args:
+            name: Nome da métrica (ex: "stuttz_ai_tokens_total")
+            value: Valor a ser somado
+            **labels: Rótulos da série
+        """
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+    
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS, **labels):
+        """
+        Registra uma medida em um histograma
+        
+        Args:
+            name: Nome da métrica (ex: "stuttz_handler_seconds")
+            value: Valor medido
+            buckets: Intervalos do histograma (usados ao criá-lo)
+            **labels: Rótulos da série
+        """
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+    
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """
+        Mede a duração de um bloco em um histograma de latência
+        
+        Uso:
+            with metrics.timer("stuttz_view_build_seconds", view="roadmap"):
+                ...
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+    
+    def timed(self, name: str, **labels) -> Callable:
+        """
+        Decorador que mede a duração de cada chamada da função
+        
+        Uso:
+            @metrics.timed("stuttz_handler_seconds", handler="quiz_submit")
+            def handle_quiz_submit(self, e): ...
+        """
+        def decorator(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start, **labels)
+            return wrapper
+        return decorator
+    
+    def reset(self):
+        """Remove todas as medidas"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna uma cópia dos valores atuais
+        
+        Returns:
+            Dicionário com "counters" e "histograms", cada um como uma lista de
+            séries {"name", "labels", ...}
+        """
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {"name": name, "labels": dict(labels), **histogram.summary()}
+                for (name, labels), histogram in sorted(self._histograms.items())
+            ]
+        return {"timestamp": time.time(), "counters": counters, "histograms": histograms}
+    
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Exporta os valores atuais em JSON"""
+        return json.dumps(self.snapshot(), indent=indent, ensure_ascii=False)
+    
+    def to_prometheus(self) -> str:
+        """
+        Exporta os valores atuais no formato de texto do Prometheus
+        
+        Returns:
+            Texto com as linhas HELP/TYPE e as amostras de cada série
+        """
+        def fmt_labels(labels: Dict[str, str], extra: Optional[Dict[str, str]] = None) -> str:
+            items = {**labels, **(extra or {})}
+            if not items:
+                return ""
+            escaped = []
+            for k, v in items.items():
+                value = str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                escaped.append(f'{k}="{value}"')
+            return "{" + ",".join(escaped) + "}"
+        
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        declared = set()
+        
+        def declare(name: str, kind: str):
+            if name not in declared:
+                declared.add(name)
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+        
+        for series in snapshot["counters"]:
+            declare(series["name"], "counter")
+            lines.append(f"{series['name']}{fmt_labels(series['labels'])} {series['value']}")
+        
+        for series in snapshot["histograms"]:
+            name, labels = series["name"], series["labels"]
+            declare(name, "histogram")
+            cumulative = 0
+            for le, count in series["buckets"].items():
+                cumulative += count
+                le_text = "+Inf" if le == "inf" else le
+                lines.append(f"{name}_bucket{fmt_labels(labels, {'le': le_text})} {cumulative}")
+            lines.append(f"{name}_sum{fmt_labels(labels)} {series['sum']}")
+            lines.append(f"{name}_count{fmt_labels(labels)} {series['count']}")
+        
+        return "\n".join(lines) + "\n"
+
+def instrument_page(page, registry: Optional["MetricsRegistry"] = None) -> bool:
+    """
+    Passa a medir os bytes enviados ao cliente pela página (melhor esforço)
+    
+    Envolve os métodos de envio da conexão interna do Flet, estimando o
+    tamanho de cada lote de comandos pela sua serialização em JSON. Se a
+    versão do Flet não expuser a conexão, nada é alterado.
+    
+    Args:
+        page: Objeto Page do Flet
+        registry: Registro de métricas (padrão: metrics)
+        
+    Returns:
+        True se a medição foi ativada, False caso contrário
+    """
+    registry = registry or metrics
+    if not registry.enabled:
+        return False
+    
+    conn = getattr(page, "_Page__conn", None) or getattr(page, "conn", None)
+    if conn is None or getattr(conn, "_stuttz_instrumented", False):
+        return False
+    
+    def payload_size(commands: Any) -> int:
+        try:
+            return len(json.dumps(commands, default=lambda o: getattr(o, "__dict__", str(o))).encode("utf-8"))
+        except (TypeError, ValueError):
+            return 0
+    
+    def wrap(original: Callable, method_name: str) -> Callable:
+        def wrapper(*args, **kwargs):
+            # O último argumento posicional é o comando (ou a lista de comandos)
+            size = payload_size(args[-1] if args else kwargs)
+            registry.increment("stuttz_page_bytes_sent_total", size)
+            registry.observe("stuttz_page_update_bytes", size, buckets=SIZE_BUCKETS, method=method_name)
+            return original(*args, **kwargs)
+        return wrapper
+    
+    instrumented = False
+    for method_name in ("send_commands", "send_command"):
+        original = getattr(conn, method_name, None)
+        if original is None:
+            continue
+        try:
+            setattr(conn, method_name, wrap(original, method_name))
+            instrumented = True
+        except (AttributeError, TypeError):
+            continue
+    
+    if instrumented:
+        conn._stuttz_instrumented = True
+    return instrumented
+
+# Registro de métricas compartilhado pelo processo
+metrics = MetricsRegistry()
+metrics.describe("stuttz_handler_seconds", "Latência dos manipuladores de eventos da interface")
+metrics.describe("stuttz_view_build_seconds", "Tempo de construção das views")
+metrics.describe("stuttz_update_view_seconds", "Tempo de AppController.update_view")
+metrics.describe("stuttz_page_bytes_sent_total", "Bytes enviados ao cliente (estimativa)")
+metrics.describe("stuttz_page_update_bytes", "Tamanho de cada envio ao cliente (estimativa)")
+metrics.describe("stuttz_ai_request_seconds", "Latência das requisições à IA, incluindo novas tentativas")
+metrics.describe("stuttz_ai_requests_total", "Requisições à IA por resultado")
+metrics.describe("stuttz_ai_tokens_total", "Tokens consumidos nas requisições à IA")
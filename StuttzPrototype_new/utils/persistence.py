@@ -0,0 +1,284 @@
+"""
+Persistência em segundo plano
+Este módulo grava os arquivos de dados do aplicativo fora da thread da
+interface, agrupando alterações próximas em uma única escrita atômica
+"""
+
+import json  # Módulo para manipulação de dados JSON
+import os  # Módulo para interagir com o sistema operacional
+import tempfile  # Módulo para criar arquivos temporários
+import threading  # Módulo para a thread de gravação e sincronização
+import time  # Módulo para controlar o atraso (debounce) das gravações
+from typing import Any, Callable, Dict, Optional, Tuple  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+
+def atomic_write_text(path: str, text: str):
+    """
+    Grava um arquivo de texto de forma atômica
+    
+    O conteúdo é escrito em um arquivo temporário na mesma pasta, enviado ao
+    disco (fsync) e só então renomeado sobre o arquivo original. Uma falha no
+    meio da gravação nunca deixa o arquivo original corrompido.
+    
+    Args:
+        path: Caminho do arquivo de destino
+        text: Conteúdo a ser gravado
+        
+    Raises:
+        OSError: Se a gravação falhar (o arquivo original permanece intacto)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())  # Garante que os dados chegaram ao disco
+        os.replace(temp_path, path)  # Troca atômica do arquivo
+    except BaseException:
+        # Remove o temporário se algo der errado
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    
+    # Sincroniza a pasta para que a renomeação também seja durável
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+def dumps_snapshot(data: Any, indent: Optional[int] = 2, retries: int = 3) -> str:
+    """
+    Serializa dados que podem estar sendo alterados por outra thread
+    
+    Se a estrutura mudar durante a serialização (RuntimeError), tenta novamente
+    
+    Args:
+        data: Dados a serializar
+        indent: Indentação do JSON
+        retries: Número de tentativas
+        
+    Returns:
+        Texto JSON dos dados
+    """
+    for attempt in range(retries):
+        try:
+            return json.dumps(data, indent=indent, ensure_ascii=False)
+        except RuntimeError:
+            if attempt == retries - 1:
+                raise
+    return ""
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 2):
+    """
+    Grava dados em JSON de forma atômica (ver atomic_write_text)
+    
+    Args:
+        path: Caminho do arquivo de destino
+        data: Dados a serem gravados
+        indent: Indentação do JSON (None para o formato compacto)
+    """
+    atomic_write_text(path, dumps_snapshot(data, indent=indent))
+
+class PersistenceWorker:
+    """
+    Thread de gravação com debounce e agrupamento de alterações
+    
+    Cada arquivo marcado como alterado é gravado uma única vez após um curto
+    intervalo sem novas alterações (Config.SAVE_DEBOUNCE_SECONDS), ou no
+    máximo após Config.SAVE_MAX_DELAY_SECONDS. Várias alterações seguidas
+    no mesmo arquivo resultam em uma só gravação com o estado mais recente.
+    """
+    
+    def __init__(self, debounce_seconds: float = Config.SAVE_DEBOUNCE_SECONDS,
+                 max_delay_seconds: float = Config.SAVE_MAX_DELAY_SECONDS):
+        """
+        Inicia a thread de gravação
+        
+        Args:
+            debounce_seconds: Tempo sem alterações antes de gravar
+            max_delay_seconds: Tempo máximo que uma alteração pode esperar
+        """
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        
+        # Arquivos pendentes: {caminho: (função que gera os dados, callback após gravar)}
+        self._pending: Dict[str, Tuple[Callable[[], Any], Optional[Callable[[Any], None]]]] = {}
+        self._first_dirty_at: Optional[float] = None  # Momento da alteração mais antiga pendente
+        self._due_at: Optional[float] = None  # Momento previsto para a próxima gravação
+        self._stopping = False
+        
+        self._condition = threading.Condition()  # Protege o estado e acorda a thread
+        self._write_lock = threading.Lock()  # Impede gravações simultâneas
+        
+        # === CONTADORES ===
+        self.writes = 0  # Arquivos efetivamente gravados
+        self.coalesced = 0  # Alterações absorvidas por uma gravação já pendente
+        self.failures = 0  # Gravações que falharam (o arquivo volta para a fila)
+        
+        self._thread = threading.Thread(target=self._run, name="stuttz-persistence", daemon=True)
+        self._thread.start()
+    
+    def schedule(self, path: str, snapshot: Callable[[], Any],
+                 on_written: Optional[Callable[[Any], None]] = None):
+        """
+        Marca um arquivo como alterado
+        
+        Args:
+            path: Caminho do arquivo a ser gravado
+            snapshot: Função que retorna os dados no momento da gravação
+            on_written: Callback chamado após a gravação bem-sucedida, com os
+                        mesmos dados que foram gravados no arquivo
+        """
+        with self._condition:
+            if path in self._pending:
+                self.coalesced += 1
+            self._pending[path] = (snapshot, on_written)
+            
+            now = time.monotonic()
+            if self._first_dirty_at is None:
+                self._first_dirty_at = now
+            # Adia a gravação a cada alteração, sem ultrapassar o atraso máximo
+            self._due_at = min(now + self.debounce_seconds,
+                               self._first_dirty_at + self.max_delay_seconds)
+            self._condition.notify()
+    
+    def _take_pending(self) -> Dict[str, Tuple[Callable[[], Any], Optional[Callable[[Any], None]]]]:
+        """Retira todos os arquivos pendentes (deve ser chamado com o lock)"""
+        pending = self._pending
+        self._pending = {}
+        self._first_dirty_at = None
+        self._due_at = None
+        return pending
+    
+    def _requeue(self, failed):
+        """
+        Devolve à fila os arquivos cuja gravação falhou
+        
+        Um arquivo que já foi marcado de novo durante a gravação não é
+        devolvido: a alteração mais recente já está na fila
+        """
+        with self._condition:
+            requeued = False
+            for path, entry in failed.items():
+                if path not in self._pending:
+                    self._pending[path] = entry
+                    requeued = True
+            if not requeued:
+                return
+            
+            now = time.monotonic()
+            if self._first_dirty_at is None:
+                self._first_dirty_at = now
+            # Nova tentativa após o atraso máximo, para não insistir em um erro persistente
+            if self._due_at is None:
+                self._due_at = now + self.max_delay_seconds
+            self._condition.notify()
+    
+    def _write(self, pending) -> bool:
+        """
+        Grava os arquivos pendentes
+        
+        Os arquivos que não puderam ser gravados por erros de disco voltam
+        para a fila e são tentados de novo na próxima gravação (ou em flush)
+        
+        Returns:
+            bool: True se todos foram gravados com sucesso, False caso contrário
+        """
+        failed = {}
+        success = True
+        with self._write_lock:
+            for path, (snapshot, on_written) in pending.items():
+                try:
+                    # Os mesmos dados são gravados e repassados ao callback
+                    data = snapshot()
+                    atomic_write_json(path, data)
+                    self.writes += 1
+                except PermissionError as e:
+                    # Erro específico para problemas de permissão de arquivo
+                    print(f"❌ Erro de permissão ao salvar {path}: {e}")
+                    failed[path] = (snapshot, on_written)
+                    continue
+                except OSError as e:
+                    # Erro específico para problemas de entrada/saída
+                    print(f"❌ Erro de I/O ao salvar {path}: {e}")
+                    failed[path] = (snapshot, on_written)
+                    continue
+                except Exception as e:
+                    # Captura outros erros inesperados (ex: dados inválidos, que não adianta repetir)
+                    print(f"❌ Erro inesperado ao salvar {path}: {e}")
+                    success = False
+                    continue
+                
+                # O arquivo já foi gravado: um erro no callback não deve gravá-lo de novo
+                if on_written:
+                    try:
+                        on_written(data)
+                    except Exception as e:
+                        print(f"⚠️ Erro após salvar {path}: {e}")
+        
+        if failed:
+            self.failures += len(failed)
+            self._requeue(failed)
+        return success and not failed
+    
+    def _run(self):
+        """Laço da thread de gravação"""
+        while True:
+            with self._condition:
+                # Esperar até existir algo pendente e o prazo de debounce vencer
+                while not self._stopping:
+                    if self._due_at is not None:
+                        remaining = self._due_at - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+                
+                if self._stopping:
+                    return
+                pending = self._take_pending()
+            
+            self._write(pending)
+    
+    @property
+    def pending_count(self) -> int:
+        """Número de arquivos aguardando gravação"""
+        with self._condition:
+            return len(self._pending)
+    
+    def flush(self) -> bool:
+        """
+        Grava imediatamente todos os arquivos pendentes
+        
+        Aguarda também uma gravação que já esteja em andamento na thread
+        
+        Returns:
+            bool: True se todos foram gravados com sucesso, False caso contrário
+        """
+        with self._condition:
+            pending = self._take_pending()
+        return self._write(pending)
+    
+    def stop(self) -> bool:
+        """
+        Grava o que estiver pendente e encerra a thread
+        
+        Returns:
+            bool: True se a gravação final foi bem-sucedida, False caso contrário
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join(timeout=5)
+        return self.flush()
@@ -0,0 +1,188 @@
+"""
+Perfis de usuário
+Este módulo mantém em memória os perfis em uso, permitindo que várias
+sessões (ex: em um servidor web) compartilhem o mesmo perfil sem que uma
+sobrescreva as gravações da outra
+"""
+
+import threading  # Módulo para sincronização entre threads
+from collections import OrderedDict  # Dicionário ordenado usado na política LRU
+from typing import Callable, Dict, List, Optional  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+from models.data_models import RoadmapData, UserData  # Dados do usuário e do roadmap
+from models.roadmap_store import RoadmapStore  # Índices das fases do roadmap
+from utils.storage import DEFAULT_PROFILE, StorageBackend, create_storage  # Armazenamento
+
+class Profile:
+    """
+    Dados em memória de um perfil
+    
+    Todas as sessões do mesmo perfil compartilham a mesma instância: os
+    mesmos objetos de dados e o mesmo mecanismo de armazenamento, de
+    forma que as gravações são sempre feitas a partir de um único estado.
+    """
+    
+    def __init__(self, profile_id: str, storage: StorageBackend):
+        """
+        Args:
+            profile_id: Identificador do perfil
+            storage: Mecanismo de armazenamento do perfil
+        """
+        self.profile_id = profile_id
+        self.storage = storage
+        self.lock = threading.RLock()  # Serializa alterações feitas por sessões diferentes
+        self.sessions = 0  # Número de sessões usando o perfil
+        
+        # Dados carregados sob demanda pela primeira sessão (ver load)
+        self.user_data: Optional[UserData] = None
+        self.roadmap_data: Optional[RoadmapData] = None
+        self.roadmap: Optional[RoadmapStore] = None
+        self.loaded = False
+    
+    def load(self, load_user: Callable[[], UserData], load_roadmap: Callable[[], RoadmapData]):
+        """
+        Carrega os dados do perfil, se ainda não foram carregados
+        
+        Args:
+            load_user: Função que carrega os dados do usuário
+            load_roadmap: Função que carrega os dados do roadmap
+        """
+        with self.lock:
+            if self.loaded:
+                return
+            
+            self.user_data = load_user()
+            self.roadmap_data = load_roadmap()
+            # Índices das fases (por ID, posição e status) e das fases completadas
+            self.roadmap = RoadmapStore(self.roadmap_data, self.user_data.completed_phases)
+            self.storage.attach(self.user_data, self.roadmap_data)
+            self.loaded = True
+
+class ProfileRegistry:
+    """
+    Cache LRU dos perfis em memória
+    
+    Perfis em uso por alguma sessão nunca são removidos. Quando o número de
+    perfis ultrapassa o limite, os ociosos menos usados recentemente têm seus
+    dados gravados e são descartados da memória.
+    """
+    
+    def __init__(self, max_profiles: int = Config.PROFILE_CACHE_SIZE,
+                 storage_factory: Callable[..., StorageBackend] = create_storage):
+        """
+        Args:
+            max_profiles: Número máximo de perfis mantidos em memória
+            storage_factory: Função que cria o armazenamento de um perfil
+        """
+        self.max_profiles = max_profiles
+        self.storage_factory = storage_factory
+        self.server_mode = False  # Ver enable_server_mode
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+        self._closing: Dict[str, threading.Event] = {}  # Perfis removidos que ainda estão gravando os dados
+        self._lock = threading.Lock()
+    
+    def acquire(self, profile_id: str = DEFAULT_PROFILE) -> Profile:
+        """
+        Obtém o perfil para uma nova sessão
+        
+        Args:
+            profile_id: Identificador do perfil
+            
+        Returns:
+            O perfil (compartilhado com outras sessões do mesmo perfil)
+        """
+        while True:
+            with self._lock:
+                closing = self._closing.get(profile_id)
+                if closing is None:
+                    profile = self._profiles.get(profile_id)
+                    if profile is None:
+                        storage = self.storage_factory(profile_id=profile_id, server_mode=self.server_mode)
+                        profile = Profile(profile_id, storage)
+                        self._profiles[profile_id] = profile
+                    self._profiles.move_to_end(profile_id)
+                    profile.sessions += 1
+                    evicted = self._evict_idle()
+                    break
+            # O perfil acabou de ser removido: esperar a gravação terminar antes de recarregá-lo
+            closing.wait()
+        
+        self._close_evicted(evicted)
+        return profile
+    
+    def enable_server_mode(self):
+        """
+        Ativa o modo servidor
+        
+        Todos os perfis, inclusive o padrão, passam a gravar o progresso fora
+        do arquivo do curso, que fica compartilhado e somente leitura
+        """
+        self.server_mode = True
+    
+    def release(self, profile: Profile):
+        """
+        Indica que uma sessão deixou de usar o perfil
+        
+        Os dados pendentes são gravados; o perfil continua em memória até ser
+        removido pela política LRU
+        
+        Args:
+            profile: Perfil obtido com acquire
+        """
+        with self._lock:
+            profile.sessions = max(0, profile.sessions - 1)
+        profile.storage.flush()
+        
+        with self._lock:
+            evicted = self._evict_idle()
+        self._close_evicted(evicted)
+    
+    def _evict_idle(self) -> List[Profile]:
+        """
+        Retira do cache perfis ociosos até respeitar o limite (deve ser chamado com o lock)
+        
+        Os perfis retirados não são fechados aqui: a gravação é feita por
+        _close_evicted, fora do lock, para não bloquear as outras sessões
+        
+        Returns:
+            Perfis retirados, que devem ser passados para _close_evicted
+        """
+        evicted: List[Profile] = []
+        if len(self._profiles) <= self.max_profiles:
+            return evicted
+        
+        for profile_id in list(self._profiles):
+            if len(self._profiles) <= self.max_profiles:
+                break
+            profile = self._profiles[profile_id]
+            if profile.sessions == 0:
+                del self._profiles[profile_id]
+                self._closing[profile_id] = threading.Event()
+                evicted.append(profile)
+        return evicted
+    
+    def _close_evicted(self, evicted: List[Profile]):
+        """Grava e fecha os perfis retirados por _evict_idle (sem o lock)"""
+        for profile in evicted:
+            try:
+                profile.storage.close()
+                print(f"ℹ️ Perfil '{profile.profile_id}' removido da memória")
+            finally:
+                with self._lock:
+                    closing = self._closing.pop(profile.profile_id)
+                closing.set()  # Libera as sessões que aguardam para recarregar o perfil
+    
+    def close_all(self):
+        """Grava e descarta todos os perfis (usado ao encerrar o processo)"""
+        with self._lock:
+            profiles = list(self._profiles.values())
+            self._profiles.clear()
+        for profile in profiles:
+            profile.storage.close()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._profiles)
+
+# Registro de perfis compartilhado por todas as sessões do processo
+profile_registry = ProfileRegistry()
@@ -0,0 +1,106 @@
+"""
+Geometria do mapa visual do roadmap
+Este módulo calcula a posição de cada fase ao longo de uma trilha sinuosa e
+os segmentos (curvas de Bézier) que ligam fases consecutivas. A geometria
+depende apenas do número de fases e das dimensões do mapa, então é calculada
+uma única vez e compartilhada por todas as sessões do mesmo curso
+"""
+
+import math  # Módulo para operações matemáticas
+from dataclasses import dataclass  # Decorador para classes de dados
+from functools import lru_cache  # Cache dos layouts já calculados
+from typing import Optional, Tuple  # Tipos para anotações de tipo
+from config import Config  # Importa configurações globais do aplicativo
+
+TRAIL_FREQUENCY = 0.9  # Variação do ângulo da trilha entre fases consecutivas (radianos)
+LABEL_GAP = 12  # Distância entre o círculo da fase e o seu título
+TAP_TOLERANCE = 1.3  # Área de toque ao redor do círculo (múltiplo do raio)
+
+@dataclass(slots=True, frozen=True)
+class TrailLayout:
+    """
+    Posições das fases e segmentos da trilha de um mapa
+    
+    Todas as coordenadas estão em pixels, relativas ao canto superior
+    esquerdo do mapa
+    """
+    width: float  # Largura do mapa
+    height: float  # Altura do mapa
+    spacing: float  # Distância vertical entre fases consecutivas
+    node_radius: float  # Raio do círculo de cada fase
+    nodes: Tuple[Tuple[float, float], ...]  # Centro (x, y) de cada fase
+    labels: Tuple[Tuple[float, float, float, bool], ...]  # (x, y, largura máxima, à esquerda do círculo) de cada título
+    segments: Tuple[Tuple[float, float, float, float, float, float], ...]  # Curvas (cp1x, cp1y, cp2x, cp2y, x, y) entre fases
+    
+    def node_at(self, x: float, y: float) -> Optional[int]:
+        """
+        Encontra a fase na posição informada (ex: posição de um toque)
+        
+        As fases estão em linhas de altura fixa, então basta verificar a
+        fase da linha correspondente, sem percorrer todas
+        
+        Args:
+            x: Coordenada horizontal
+            y: Coordenada vertical
+            
+        Returns:
+            Índice da fase tocada, ou None se o ponto estiver fora das fases
+        """
+        if not self.nodes:
+            return None
+        
+        index = round((y - self.nodes[0][1]) / self.spacing)
+        if not 0 <= index < len(self.nodes):
+            return None
+        
+        node_x, node_y = self.nodes[index]
+        if math.hypot(x - node_x, y - node_y) <= self.node_radius * TAP_TOLERANCE:
+            return index
+        return None
+
+@lru_cache(maxsize=Config.ROADMAP_LAYOUT_CACHE_SIZE)
+def trail_layout(phase_count: int, width: float = Config.ROADMAP_MAP_WIDTH,
+                 spacing: float = Config.ROADMAP_NODE_SPACING,
+                 node_radius: float = Config.ROADMAP_NODE_RADIUS) -> TrailLayout:
+    """
+    Calcula (ou obtém do cache) o layout da trilha
+    
+    As fases descem pelo mapa oscilando em torno do centro (senoide), e
+    cada segmento é uma curva suave que sai verticalmente de uma fase e
+    chega verticalmente à seguinte. O título fica do lado com mais espaço.
+    
+    Args:
+        phase_count: Número de fases do curso
+        width: Largura do mapa
+        spacing: Distância vertical entre fases consecutivas
+        node_radius: Raio do círculo de cada fase
+        
+    Returns:
+        Layout imutável, compartilhado por todas as views com os mesmos parâmetros
+    """
+    center = width / 2
+    swing = width * Config.ROADMAP_TRAIL_SWING
+    top = node_radius + LABEL_GAP
+    
+    nodes = []
+    labels = []
+    for index in range(phase_count):
+        x = center + swing * math.sin(index * TRAIL_FREQUENCY)
+        y = top + index * spacing
+        nodes.append((x, y))
+        
+        # Título do lado oposto ao deslocamento da trilha
+        if x > center:
+            label_x = x - node_radius - LABEL_GAP
+            labels.append((label_x, y, label_x - LABEL_GAP, True))
+        else:
+            label_x = x + node_radius + LABEL_GAP
+            labels.append((label_x, y, width - label_x - LABEL_GAP, False))
+    
+    segments = []
+    for (x0, y0), (x1, y1) in zip(nodes, nodes[1:]):
+        middle = (y0 + y1) / 2
+        segments.append((x0, middle, x1, middle, x1, y1))
+    
+    height = top * 2 + max(phase_count - 1, 0) * spacing
+    return TrailLayout(width, height, spacing, node_radius, tuple(nodes), tuple(labels), tuple(segments))
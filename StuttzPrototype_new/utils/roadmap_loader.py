@@ -0,0 +1,158 @@
+"""
+Carregamento do roadmap
+Este módulo lê o arquivo de roadmap, valida seu conteúdo e guarda um
+snapshot já processado para que as próximas inicializações não precisem
+interpretar e validar o JSON novamente
+"""
+
+import hashlib  # Módulo para gerar o nome do arquivo de snapshot
+import json  # Módulo para manipulação de dados JSON
+import os  # Módulo para interagir com o sistema operacional
+import pickle  # Módulo para serializar o snapshot do roadmap
+from typing import Any, Dict, Optional, Tuple  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+from models.data_models import PhaseStatus, validate_quiz_data  # Status das fases e validação dos quizzes
+
+# Versão do formato do snapshot (alterar invalida os snapshots existentes)
+SNAPSHOT_VERSION = 1
+
+# Status aceitos para uma fase
+VALID_STATUSES = tuple(status.value for status in PhaseStatus)
+
+class RoadmapValidationError(ValueError):
+    """Erro lançado quando o arquivo de roadmap possui dados inválidos"""
+
+def validate_roadmap(data: Any):
+    """
+    Valida a estrutura completa de um roadmap
+    
+    Args:
+        data: Dados lidos do arquivo de roadmap
+        
+    Raises:
+        RoadmapValidationError: Se algum campo obrigatório estiver ausente ou inválido
+    """
+    if not isinstance(data, dict):
+        raise RoadmapValidationError("o roadmap deve ser um objeto JSON")
+    if not isinstance(data.get("course_name"), str):
+        raise RoadmapValidationError("campo 'course_name' ausente ou inválido")
+    if not isinstance(data.get("phases"), list):
+        raise RoadmapValidationError("campo 'phases' ausente ou inválido")
+    
+    seen_ids = set()
+    for position, phase in enumerate(data["phases"], 1):
+        if not isinstance(phase, dict):
+            raise RoadmapValidationError(f"fase {position} não é um objeto")
+        
+        phase_id = phase.get("id")
+        if not isinstance(phase_id, int) or phase_id <= 0:
+            raise RoadmapValidationError(f"fase {position}: 'id' deve ser um inteiro positivo")
+        if phase_id in seen_ids:
+            raise RoadmapValidationError(f"fase {position}: id {phase_id} duplicado")
+        seen_ids.add(phase_id)
+        
+        for key in ("title", "description"):
+            if not isinstance(phase.get(key), str):
+                raise RoadmapValidationError(f"fase {phase_id}: campo '{key}' ausente ou inválido")
+        if phase.get("status") not in VALID_STATUSES:
+            raise RoadmapValidationError(f"fase {phase_id}: status '{phase.get('status')}' inválido")
+        if not isinstance(phase.get("tasks"), list):
+            raise RoadmapValidationError(f"fase {phase_id}: campo 'tasks' ausente ou inválido")
+        if phase.get("quiz") and not validate_quiz_data(phase["quiz"]):
+            raise RoadmapValidationError(f"fase {phase_id}: quiz inválido")
+
+def _snapshot_path(path: str, snapshot_dir: str) -> str:
+    """Retorna o caminho do snapshot correspondente a um arquivo de roadmap"""
+    name = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(snapshot_dir, f"{name}.pickle")
+
+def _file_signature(path: str) -> Tuple[int, str, int, int]:
+    """Assinatura do arquivo de origem: muda sempre que o arquivo é alterado"""
+    stat = os.stat(path)
+    return (SNAPSHOT_VERSION, os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+def _read_snapshot(path: str, snapshot_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Lê o snapshot do roadmap se ele corresponder à versão atual do arquivo
+    
+    Returns:
+        Os dados do roadmap ou None se o snapshot não existir ou estiver desatualizado
+    """
+    snapshot_path = _snapshot_path(path, snapshot_dir)
+    if not os.path.exists(snapshot_path):
+        return None
+    
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        # Snapshot corrompido: será recriado a partir do JSON
+        print(f"⚠️ Snapshot do roadmap inválido, ignorando: {e}")
+        return None
+    
+    if snapshot.get("signature") != _file_signature(path):
+        return None
+    return snapshot["data"]
+
+def write_snapshot(path: str, data: Dict[str, Any], snapshot_dir: str = Config.ROADMAP_SNAPSHOT_DIR) -> bool:
+    """
+    Grava o snapshot de um roadmap já validado
+    
+    Deve ser chamado sempre que o arquivo de roadmap for regravado pelo
+    aplicativo, para que a próxima inicialização continue aproveitando o snapshot
+    
+    Args:
+        path: Caminho do arquivo de roadmap (JSON) correspondente
+        data: Dados do roadmap, iguais ao conteúdo do arquivo
+        snapshot_dir: Pasta onde os snapshots são guardados
+        
+    Returns:
+        bool: True se o snapshot foi gravado com sucesso, False caso contrário
+    """
+    snapshot_path = _snapshot_path(path, snapshot_dir)
+    temp_path = f"{snapshot_path}.tmp"
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        snapshot = {"signature": _file_signature(path), "data": data}
+        with open(temp_path, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+        return True
+    except (OSError, pickle.PicklingError) as e:
+        print(f"⚠️ Não foi possível gravar o snapshot do roadmap: {e}")
+        return False
+
+def load_roadmap(path: str = Config.DEFAULT_ROADMAP_FILE,
+                 snapshot_dir: str = Config.ROADMAP_SNAPSHOT_DIR) -> Dict[str, Any]:
+    """
+    Carrega o roadmap de um arquivo JSON
+    
+    Na primeira leitura o JSON é interpretado e validado, e o resultado é
+    guardado em um snapshot indexado pela data de modificação e tamanho do
+    arquivo. Enquanto o arquivo não mudar, as próximas leituras usam o
+    snapshot diretamente, sem interpretar nem validar o JSON.
+    
+    Args:
+        path: Caminho do arquivo de roadmap
+        snapshot_dir: Pasta onde os snapshots são guardados
+        
+    Returns:
+        Dicionário com os dados do roadmap
+        
+    Raises:
+        OSError: Se o arquivo não puder ser lido
+        json.JSONDecodeError: Se o arquivo não for um JSON válido
+        RoadmapValidationError: Se o conteúdo do roadmap for inválido
+    """
+    data = _read_snapshot(path, snapshot_dir)
+    if data is not None:
+        print("✅ Roadmap carregado do snapshot")
+        return data
+    
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    validate_roadmap(data)
+    
+    write_snapshot(path, data, snapshot_dir)
+    print("✅ Roadmap carregado e validado")
+    return data
@@ -0,0 +1,103 @@
+"""
+Agrupamento de requisições duplicadas (single-flight)
+Este módulo garante que chamadas simultâneas com a mesma chave executem a
+operação uma única vez, compartilhando o resultado entre todas elas
+"""
+
+import threading  # Módulo para sincronização entre threads
+from typing import Any, Callable, Dict, Optional, Tuple  # Tipos para anotações de tipo
+
+class _Call:
+    """Uma execução em andamento e o resultado que será compartilhado"""
+    
+    def __init__(self):
+        self.done = threading.Event()  # Sinaliza o fim da execução
+        self.result: Any = None  # Valor retornado pela operação
+        self.error: Optional[BaseException] = None  # Exceção lançada pela operação
+        self.waiters = 0  # Chamadas que aguardam esta execução
+
+class SingleFlight:
+    """
+    Executa no máximo uma operação por chave ao mesmo tempo
+    
+    A primeira chamada para uma chave executa a operação; as chamadas que
+    chegam enquanto ela está em andamento aguardam e recebem o mesmo
+    resultado (ou a mesma exceção). Após o término, a chave é liberada.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}  # Execuções em andamento por chave
+        self._lock = threading.Lock()  # Protege o dicionário de execuções
+        
+        # === CONTADORES ===
+        self.executions = 0  # Operações realmente executadas
+        self.shared = 0  # Chamadas atendidas por uma execução já em andamento
+    
+    def do(self, key: str, fn: Callable[..., Any], *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        Executa fn para a chave ou aguarda a execução já em andamento
+        
+        Args:
+            key: Identificador da operação (ex: chave do cache da IA)
+            fn: Função executada pela primeira chamada
+            *args, **kwargs: Argumentos repassados para fn
+            
+        Returns:
+            Tupla (resultado, compartilhado), onde compartilhado é True se o
+            resultado veio da execução de outra chamada
+            
+        Raises:
+            A exceção lançada por fn, também repassada às chamadas que aguardavam
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                # Já existe uma execução em andamento: aguardar o resultado dela
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # Liberar a chave antes de acordar quem aguardava
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        
+        return call.result, False
+    
+    def in_flight(self) -> int:
+        """Número de chaves com execução em andamento"""
+        with self._lock:
+            return len(self._calls)
+
+# Requisições de IA em andamento, compartilhadas por todas as sessões do processo
+_shared_flight: Optional[SingleFlight] = None
+_shared_flight_lock = threading.Lock()
+
+def get_shared_single_flight() -> SingleFlight:
+    """
+    Retorna o agrupador de requisições de IA compartilhado pelo processo
+    
+    Returns:
+        Instância única de SingleFlight
+    """
+    global _shared_flight
+    with _shared_flight_lock:
+        if _shared_flight is None:
+            _shared_flight = SingleFlight()
+        return _shared_flight
@@ -0,0 +1,168 @@
+"""
+Rastreamento da abertura do aplicativo
+Este módulo mede o tempo de cada etapa da inicialização (imports, carga dos
+dados, streak, construção da tela, primeira atualização) e grava um
+relatório em JSON, para que regressões na abertura fiquem visíveis
+
+Ativação:
+    STUTTZ_TRACE_STARTUP=1 python main.py            (relatório em Config.STARTUP_TRACE_FILE)
+    STUTTZ_TRACE_STARTUP=caminho.json python main.py (relatório no arquivo informado)
+"""
+
+import os  # Módulo para ler variáveis de ambiente
+import platform  # Informações do interpretador, incluídas no relatório
+import threading  # Módulo para sincronização entre threads
+import time  # Módulo para medir o tempo das etapas
+from contextlib import contextmanager  # Decorador para gerenciadores de contexto
+from datetime import datetime  # Data e hora do relatório
+from typing import Any, Dict, Iterator, List, Optional  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+from utils.persistence import atomic_write_json  # Gravação atômica de arquivos JSON
+
+# Momento em que este módulo foi importado (o mais cedo possível em main.py)
+PROCESS_START = time.perf_counter()
+
+class StartupTracer:
+    """
+    Registra a duração das etapas da abertura do aplicativo
+    
+    As etapas podem ser aninhadas (ex: a carga dos dados dentro da criação do
+    controlador). Quando desativado, todos os métodos são operações vazias.
+    Apenas a primeira abertura do processo é registrada.
+    """
+    
+    def __init__(self, enabled: bool = False, path: str = Config.STARTUP_TRACE_FILE,
+                 origin: float = PROCESS_START):
+        """
+        Args:
+            enabled: Se False, nada é registrado
+            path: Arquivo onde o relatório é gravado
+            origin: Instante (time.perf_counter) considerado o início da abertura
+        """
+        self.enabled = enabled
+        self.path = path
+        self.origin = origin
+        self.phases: List[Dict[str, Any]] = []  # Etapas concluídas, na ordem de início
+        self.finished = False  # Indica se o relatório já foi gravado
+        self._depth = 0  # Nível de aninhamento da etapa atual
+        self._thread_id: Optional[int] = None  # Thread que executa a abertura
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls) -> "StartupTracer":
+        """
+        Cria o rastreador conforme a variável de ambiente STUTTZ_TRACE_STARTUP
+        
+        Returns:
+            Rastreador ativo se a variável estiver definida (e não for "0")
+        """
+        value = os.getenv("STUTTZ_TRACE_STARTUP", "")
+        if value in ("", "0"):
+            return cls(enabled=False)
+        if value.lower().endswith(".json"):
+            return cls(enabled=True, path=value)
+        return cls(enabled=True)
+    
+    def _active(self, claim: bool = True) -> bool:
+        """
+        Verifica se a etapa deve ser registrada (abertura em andamento, mesma thread)
+        
+        Args:
+            claim: Se True, a primeira thread que registra uma etapa passa a ser
+                   a única registrada (evita misturar sessões web simultâneas)
+        """
+        if not self.enabled or self.finished:
+            return False
+        with self._lock:
+            if self._thread_id is None:
+                if not claim:
+                    return True
+                self._thread_id = threading.get_ident()
+            return self._thread_id == threading.get_ident()
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Mede a duração de uma etapa
+        
+        Uso:
+            with startup_tracer.phase("load_user_data"):
+                ...
+        
+        Args:
+            name: Nome da etapa no relatório
+        """
+        if not self._active():
+            yield
+            return
+        
+        record = {"name": name, "depth": self._depth,
+                  "start_ms": (time.perf_counter() - self.origin) * 1000}
+        self.phases.append(record)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["duration_ms"] = (time.perf_counter() - start) * 1000
+            self._depth -= 1
+    
+    def mark(self, name: str, since: Optional[float] = None):
+        """
+        Registra uma etapa já concluída
+        
+        Args:
+            name: Nome da etapa no relatório
+            since: Início da etapa (time.perf_counter); padrão: início da abertura
+        """
+        # Não reserva a thread: os imports acontecem antes de main() ser chamada
+        if not self._active(claim=False):
+            return
+        
+        start = self.origin if since is None else since
+        self.phases.append({
+            "name": name, "depth": self._depth,
+            "start_ms": (start - self.origin) * 1000,
+            "duration_ms": (time.perf_counter() - start) * 1000,
+        })
+    
+    def report(self) -> Dict[str, Any]:
+        """
+        Monta o relatório da abertura
+        
+        Returns:
+            Dicionário com o tempo total e a lista de etapas
+        """
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pid": os.getpid(),
+            "total_ms": (time.perf_counter() - self.origin) * 1000,
+            "phases": self.phases,
+        }
+    
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """
+        Encerra o rastreamento, grava o relatório e exibe um resumo
+        
+        Returns:
+            O relatório gravado, ou None se o rastreador estiver desativado
+        """
+        if not self._active():
+            return None
+        self.finished = True
+        
+        report = self.report()
+        try:
+            atomic_write_json(self.path, report)
+        except OSError as e:
+            print(f"❌ Erro ao gravar relatório de abertura: {e}")
+        
+        print(f"⏱️ Abertura em {report['total_ms']:.1f} ms (relatório: {self.path})")
+        for record in self.phases:
+            indent = "  " * (record["depth"] + 1)
+            print(f"{indent}{record['name']}: {record['duration_ms']:.1f} ms")
+        return report
+
+# Rastreador da abertura compartilhado pelo processo
+startup_tracer = StartupTracer.from_env()
@@ -0,0 +1,439 @@
+"""
+Armazenamento do progresso do usuário
+Este módulo define a interface de armazenamento usada pelo AppController e
+suas implementações: arquivos JSON (formato original) e SQLite
+"""
+
+import hashlib  # Módulo para gerar nomes seguros de pasta para os perfis
+import json  # Módulo para manipulação de dados JSON
+import os  # Módulo para interagir com o sistema operacional
+import re  # Módulo de expressões regulares para validar IDs de perfil
+import sqlite3  # Banco de dados SQLite embutido no Python
+import threading  # Módulo para sincronização entre threads
+from abc import ABC, abstractmethod  # Classes base abstratas
+from datetime import datetime  # Classe para registrar o horário das alterações
+from typing import Any, Dict, Optional  # Tipos para anotações de tipo
+from config import Config  # Importa as configurações globais do aplicativo
+from models.data_models import RoadmapData, UserData  # Modelos convertidos de/para o formato gravado
+from utils.persistence import PersistenceWorker  # Gravação dos arquivos em segundo plano
+from utils.roadmap_loader import write_snapshot  # Atualização do snapshot do roadmap
+
+# Campos do usuário guardados diretamente (completed_phases é tratado à parte)
+USER_FIELDS = ("name", "level", "xp", "xp_to_next", "streak", "last_activity")
+
+# Perfil usado quando nenhum é informado (mantém os arquivos originais)
+DEFAULT_PROFILE = "default"
+
+def profile_dir_name(profile_id: str) -> str:
+    """
+    Converte o ID de um perfil em um nome de pasta seguro
+    
+    IDs simples (letras, números, "-" e "_") são usados diretamente;
+    os demais são substituídos pelo seu hash
+    """
+    if re.fullmatch(r"[A-Za-z0-9_-]{1,64}", profile_id):
+        return profile_id
+    return hashlib.sha256(profile_id.encode("utf-8")).hexdigest()[:32]
+
+class StorageBackend(ABC):
+    """
+    Interface dos mecanismos de armazenamento do progresso
+    
+    Além das gravações completas (save_user_data / save_roadmap_data), define
+    gravações pontuais (update_user / update_phase) que cada implementação
+    pode realizar de forma mais eficiente que reescrever todos os dados.
+    """
+    
+    # Indica se o progresso das fases é gravado no próprio arquivo do curso
+    progress_in_course_file = False
+    
+    def attach(self, user_data: UserData, roadmap_data: RoadmapData):
+        """
+        Informa os dados em memória do usuário e do roadmap
+        
+        Implementações que gravam documentos completos usam estas referências
+        para obter o estado mais recente no momento da gravação
+        """
+        self.user_data = user_data
+        self.roadmap_data = roadmap_data
+    
+    @abstractmethod
+    def load_user_data(self) -> Optional[UserData]:
+        """Carrega os dados do usuário (None se ainda não existirem)"""
+    
+    @abstractmethod
+    def load_phase_states(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Carrega o progresso salvo de cada fase
+        
+        Returns:
+            Dicionário {phase_id: {"status": ..., "quiz_completed": ...}} aplicado
+            sobre o conteúdo do roadmap
+        """
+    
+    @abstractmethod
+    def save_user_data(self, user_data: UserData):
+        """Grava todos os dados do usuário"""
+    
+    @abstractmethod
+    def save_roadmap_data(self, roadmap_data: RoadmapData):
+        """Grava o progresso de todas as fases do roadmap"""
+    
+    @abstractmethod
+    def update_user(self, fields: Dict[str, Any]):
+        """
+        Grava apenas alguns campos do usuário
+        
+        Args:
+            fields: Dicionário {campo: novo valor} (ex: {"xp": 50, "level": 2})
+        """
+    
+    @abstractmethod
+    def update_phase(self, phase_id: int, status: str, quiz_completed: bool, completed: bool):
+        """
+        Grava o progresso de uma única fase
+        
+        Args:
+            phase_id: ID da fase
+            status: Status atual da fase
+            quiz_completed: Se o quiz da fase já foi respondido corretamente
+            completed: Se a fase está na lista de fases completadas do usuário
+        """
+    
+    def record_quiz_attempt(self, phase_id: int, selected_index: int, correct: bool):
+        """
+        Registra uma tentativa de resposta de quiz
+        
+        Por padrão não faz nada; implementações com histórico sobrescrevem
+        """
+    
+    def flush(self) -> bool:
+        """Garante que todas as alterações foram gravadas"""
+        return True
+    
+    def close(self):
+        """Grava o que estiver pendente e libera os recursos"""
+        self.flush()
+
+class JSONStorage(StorageBackend):
+    """
+    Armazenamento em arquivos JSON
+    
+    No perfil padrão são usados os arquivos originais (user_data.json e
+    roadmap_data.json, onde fica o progresso das fases). Os demais perfis
+    gravam em Config.PROFILES_DIR/<perfil>/ um user_data.json e um
+    progress.json apenas com o progresso das fases. Toda gravação reescreve
+    o documento completo, em segundo plano e de forma atômica, através do
+    PersistenceWorker.
+    """
+    
+    def __init__(self, user_file: str = Config.USER_DATA_FILE,
+                 roadmap_file: str = Config.DEFAULT_ROADMAP_FILE,
+                 progress_file: Optional[str] = None):
+        """
+        Args:
+            user_file: Arquivo com os dados do usuário
+            roadmap_file: Arquivo do roadmap onde o progresso das fases é gravado
+            progress_file: Se informado, o progresso das fases é gravado neste
+                           arquivo em vez de no arquivo do roadmap
+        """
+        self.user_file = user_file
+        self.roadmap_file = roadmap_file
+        self.progress_file = progress_file
+        self.progress_in_course_file = progress_file is None
+        self.user_data: Optional[UserData] = None
+        self.roadmap_data: Optional[RoadmapData] = None
+        self.persistence = PersistenceWorker()  # Thread que grava os arquivos
+    
+    def load_user_data(self) -> Optional[UserData]:
+        if not os.path.exists(self.user_file):
+            return None
+        
+        try:
+            # Abre o arquivo e carrega os dados JSON
+            with open(self.user_file, "r", encoding="utf-8") as f:
+                return UserData.from_dict(json.load(f))
+        except json.JSONDecodeError as e:
+            # Erro específico para problemas de formatação JSON
+            print(f"❌ Erro ao decodificar JSON: {e}")
+        except PermissionError as e:
+            # Erro específico para problemas de permissão de arquivo
+            print(f"❌ Erro de permissão ao acessar o arquivo: {e}")
+        except Exception as e:
+            # Captura outros erros inesperados
+            print(f"❌ Erro inesperado ao carregar dados do usuário: {e}")
+        return None
+    
+    def load_phase_states(self) -> Dict[int, Dict[str, Any]]:
+        if not self.progress_file or not os.path.exists(self.progress_file):
+            # Perfil padrão: o progresso já faz parte do arquivo de roadmap carregado
+            return {}
+        
+        try:
+            with open(self.progress_file, "r", encoding="utf-8") as f:
+                phases = json.load(f).get("phases", {})
+            # As chaves do JSON são strings: converter de volta para IDs inteiros
+            return {int(phase_id): state for phase_id, state in phases.items()}
+        except (json.JSONDecodeError, OSError, ValueError, AttributeError) as e:
+            print(f"❌ Erro ao carregar o progresso das fases: {e}")
+            return {}
+    
+    def _progress_snapshot(self) -> Dict[str, Any]:
+        """Extrai do roadmap apenas o progresso de cada fase"""
+        return {
+            "phases": {
+                str(phase.id): {
+                    "status": phase.status.value,
+                    "quiz_completed": phase.quiz_completed
+                }
+                for phase in self.roadmap_data.phases
+            }
+        }
+    
+    def save_user_data(self, user_data: UserData):
+        self.user_data = user_data
+        self.persistence.schedule(self.user_file, lambda: self.user_data.to_dict())
+    
+    def save_roadmap_data(self, roadmap_data: RoadmapData):
+        self.roadmap_data = roadmap_data
+        if self.progress_file:
+            self.persistence.schedule(self.progress_file, self._progress_snapshot)
+            return
+        
+        self.persistence.schedule(
+            self.roadmap_file,
+            lambda: self.roadmap_data.to_dict(),
+            # Atualizar o snapshot para que a próxima inicialização não reprocesse o arquivo
+            # (com os mesmos dados gravados, que correspondem à assinatura do arquivo)
+            on_written=lambda data: write_snapshot(self.roadmap_file, data)
+        )
+    
+    def update_user(self, fields: Dict[str, Any]):
+        # O documento completo é regravado (as alterações são agrupadas pelo worker)
+        self.save_user_data(self.user_data)
+    
+    def update_phase(self, phase_id: int, status: str, quiz_completed: bool, completed: bool):
+        self.save_roadmap_data(self.roadmap_data)
+        if completed:
+            # A lista de fases completadas fica no arquivo do usuário
+            self.save_user_data(self.user_data)
+    
+    def flush(self) -> bool:
+        return self.persistence.flush()
+    
+    def close(self):
+        self.persistence.stop()
+
+class SQLiteStorage(StorageBackend):
+    """
+    Armazenamento em um banco SQLite
+    
+    Usa o modo WAL, consultas parametrizadas (reaproveitadas pelo cache de
+    comandos do sqlite3) e tabelas indexadas para o perfil, o progresso de
+    cada fase e o histórico de tentativas dos quizzes. Uma atualização como
+    "fase 3 completada, +25 XP" grava apenas as linhas afetadas.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS user_profile (
+            profile_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            xp INTEGER NOT NULL,
+            xp_to_next INTEGER NOT NULL,
+            streak INTEGER NOT NULL,
+            last_activity TEXT
+        );
+        CREATE TABLE IF NOT EXISTS phase_progress (
+            profile_id TEXT NOT NULL,
+            phase_id INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            quiz_completed INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (profile_id, phase_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_phase_progress_completed
+            ON phase_progress (profile_id, completed);
+        CREATE TABLE IF NOT EXISTS quiz_attempts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            profile_id TEXT NOT NULL,
+            phase_id INTEGER NOT NULL,
+            selected_index INTEGER NOT NULL,
+            correct INTEGER NOT NULL,
+            attempted_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_quiz_attempts_phase
+            ON quiz_attempts (profile_id, phase_id);
+    """
+    
+    # === CONSULTAS ===
+    UPSERT_USER = """
+        INSERT INTO user_profile (profile_id, name, level, xp, xp_to_next, streak, last_activity)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (profile_id) DO UPDATE SET
+            name = excluded.name, level = excluded.level, xp = excluded.xp,
+            xp_to_next = excluded.xp_to_next, streak = excluded.streak,
+            last_activity = excluded.last_activity
+    """
+    UPSERT_PHASE = """
+        INSERT INTO phase_progress (profile_id, phase_id, status, quiz_completed, completed, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (profile_id, phase_id) DO UPDATE SET
+            status = excluded.status, quiz_completed = excluded.quiz_completed,
+            completed = excluded.completed, updated_at = excluded.updated_at
+    """
+    INSERT_ATTEMPT = """
+        INSERT INTO quiz_attempts (profile_id, phase_id, selected_index, correct, attempted_at)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    
+    def __init__(self, db_file: str = Config.SQLITE_DB_FILE, profile_id: str = DEFAULT_PROFILE):
+        """
+        Abre (ou cria) o banco de dados
+        
+        Args:
+            db_file: Caminho do arquivo do banco SQLite
+            profile_id: Identificador do perfil cujos dados são lidos e gravados
+        """
+        self.db_file = db_file
+        self.profile_id = profile_id
+        self.user_data: Optional[UserData] = None
+        self.roadmap_data: Optional[RoadmapData] = None
+        
+        # Os manipuladores de eventos do Flet rodam em threads diferentes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")  # Leituras não bloqueiam gravações
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # Seguro com WAL e bem mais rápido
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+    
+    def _now(self) -> str:
+        return datetime.now().isoformat(timespec="seconds")
+    
+    def load_user_data(self) -> Optional[UserData]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, level, xp, xp_to_next, streak, last_activity "
+                "FROM user_profile WHERE profile_id = ?",
+                (self.profile_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            completed = self._conn.execute(
+                "SELECT phase_id FROM phase_progress "
+                "WHERE profile_id = ? AND completed = 1 ORDER BY updated_at, phase_id",
+                (self.profile_id,)
+            ).fetchall()
+        
+        return UserData(*row, completed_phases=[phase_id for (phase_id,) in completed])
+    
+    def load_phase_states(self) -> Dict[int, Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT phase_id, status, quiz_completed FROM phase_progress WHERE profile_id = ?",
+                (self.profile_id,)
+            ).fetchall()
+        return {
+            phase_id: {"status": status, "quiz_completed": bool(quiz_completed)}
+            for phase_id, status, quiz_completed in rows
+        }
+    
+    def save_user_data(self, user_data: UserData):
+        self.user_data = user_data
+        values = (self.profile_id,) + tuple(getattr(user_data, field) for field in USER_FIELDS)
+        completed = set(user_data.completed_phases)
+        
+        with self._lock, self._conn:
+            self._conn.execute(self.UPSERT_USER, values)
+            # Sincronizar a marcação de fases completadas
+            self._conn.execute(
+                "UPDATE phase_progress SET completed = 0 WHERE profile_id = ? AND completed = 1",
+                (self.profile_id,)
+            )
+            now = self._now()
+            for phase_id in completed:
+                self._conn.execute(
+                    "INSERT INTO phase_progress (profile_id, phase_id, status, completed, updated_at) "
+                    "VALUES (?, ?, 'completed', 1, ?) "
+                    "ON CONFLICT (profile_id, phase_id) DO UPDATE SET completed = 1",
+                    (self.profile_id, phase_id, now)
+                )
+    
+    def save_roadmap_data(self, roadmap_data: RoadmapData):
+        self.roadmap_data = roadmap_data
+        completed = set(self.user_data.completed_phases) if self.user_data is not None else set()
+        now = self._now()
+        rows = [
+            (self.profile_id, phase.id, phase.status.value,
+             int(phase.quiz_completed), int(phase.id in completed), now)
+            for phase in roadmap_data.phases
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(self.UPSERT_PHASE, rows)
+    
+    def update_user(self, fields: Dict[str, Any]):
+        columns = [field for field in fields if field in USER_FIELDS]
+        if not columns:
+            return
+        
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE user_profile SET {', '.join(f'{c} = ?' for c in columns)} WHERE profile_id = ?",
+                tuple(fields[c] for c in columns) + (self.profile_id,)
+            )
+        
+        if cursor.rowcount == 0:
+            # O perfil ainda não existe no banco: gravar todos os campos
+            self.save_user_data(self.user_data)
+    
+    def update_phase(self, phase_id: int, status: str, quiz_completed: bool, completed: bool):
+        with self._lock, self._conn:
+            self._conn.execute(
+                self.UPSERT_PHASE,
+                (self.profile_id, phase_id, status, int(quiz_completed), int(completed), self._now())
+            )
+    
+    def record_quiz_attempt(self, phase_id: int, selected_index: int, correct: bool):
+        with self._lock, self._conn:
+            self._conn.execute(
+                self.INSERT_ATTEMPT,
+                (self.profile_id, phase_id, selected_index, int(correct), self._now())
+            )
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def create_storage(backend: Optional[str] = None, profile_id: str = DEFAULT_PROFILE,
+                   server_mode: bool = False) -> StorageBackend:
+    """
+    Cria o mecanismo de armazenamento configurado para um perfil
+    
+    Args:
+        backend: "json" ou "sqlite" (padrão: variável de ambiente STUTTZ_STORAGE
+                 ou Config.STORAGE_BACKEND)
+        profile_id: Identificador do perfil
+        server_mode: Se True, nenhum perfil grava no arquivo do curso, que é
+                     compartilhado (somente leitura) entre as sessões
+        
+    Returns:
+        Instância do mecanismo de armazenamento
+    """
+    backend = (backend or os.getenv("STUTTZ_STORAGE") or Config.STORAGE_BACKEND).lower()
+    if backend == "sqlite":
+        return SQLiteStorage(profile_id=profile_id)
+    if backend != "json":
+        print(f"⚠️ Armazenamento '{backend}' desconhecido, usando JSON")
+    
+    if profile_id == DEFAULT_PROFILE and not server_mode:
+        # Perfil padrão: arquivos originais do aplicativo
+        return JSONStorage()
+    
+    profile_dir = os.path.join(Config.PROFILES_DIR, profile_dir_name(profile_id))
+    return JSONStorage(
+        user_file=os.path.join(profile_dir, "user_data.json"),
+        progress_file=os.path.join(profile_dir, "progress.json")
+    )
@@ -0,0 +1,91 @@
+"""
+Agrupamento de atualizações da interface
+Este módulo permite que os manipuladores de eventos marquem apenas os
+controles que alteraram e os enviem ao cliente de uma só vez, ao final do
+evento, em vez de pedir à página que compare a árvore inteira
+"""
+
+import threading  # Módulo para isolar os lotes de cada thread
+from contextlib import contextmanager  # Decorador para criar gerenciadores de contexto
+from typing import Any, Iterator, List  # Tipos para anotações de tipo
+
+class UpdateBatch:
+    """
+    Lote de controles alterados durante um evento
+    
+    Dentro de event(), mark() apenas registra os controles; ao sair do
+    evento mais externo, todos são enviados em uma única chamada a
+    page.update(*controles), que envia só as diferenças desses controles.
+    Fora de um evento (ex: respostas da IA em segundo plano), mark() envia
+    os controles imediatamente.
+    
+    Cada thread tem o seu próprio lote, de modo que uma resposta da IA que
+    chega durante um clique não é enviada junto com o lote do clique.
+    """
+    
+    def __init__(self, page):
+        """
+        Args:
+            page: Página que recebe as atualizações (ft.Page ou página sem interface)
+        """
+        self.page = page
+        self._local = threading.local()  # Controles pendentes e profundidade, por thread
+    
+    def _state(self):
+        """Estado do lote da thread atual (criado na primeira utilização)"""
+        state = self._local
+        if not hasattr(state, "pending"):
+            state.pending: List[Any] = []  # Controles marcados, na ordem em que foram marcados
+            state.depth = 0  # Eventos aninhados em andamento
+        return state
+    
+    @contextmanager
+    def event(self) -> Iterator["UpdateBatch"]:
+        """
+        Abre um lote para a duração de um evento
+        
+        Eventos aninhados (um manipulador que chama outro) compartilham o
+        mesmo lote, enviado apenas quando o mais externo termina. O lote é
+        enviado mesmo se o manipulador lançar uma exceção, para que a tela
+        reflita as alterações já feitas.
+        """
+        state = self._state()
+        state.depth += 1
+        try:
+            yield self
+        finally:
+            state.depth -= 1
+            if state.depth == 0:
+                self.flush()
+    
+    def mark(self, *controls):
+        """
+        Marca controles que precisam ser enviados ao cliente
+        
+        Args:
+            *controls: Controles alterados (None é ignorado)
+        """
+        state = self._state()
+        for control in controls:
+            # Cada controle é enviado uma única vez por lote
+            if control is not None and not any(control is pending for pending in state.pending):
+                state.pending.append(control)
+        
+        if state.depth == 0:
+            # Fora de um evento: enviar imediatamente
+            self.flush()
+    
+    def flush(self) -> int:
+        """
+        Envia os controles marcados na thread atual
+        
+        Returns:
+            Número de controles enviados
+        """
+        state = self._state()
+        if not state.pending:
+            return 0
+        
+        controls, state.pending = state.pending, []
+        self.page.update(*controls)
+        return len(controls)
@@ -5,5 +5,6 @@ Contém as interfaces do usuário
 
 from .roadmap_view import RoadmapView
 from .phase_detail_view import PhaseDetailView
+from .debug_view import DebugView
 
-__all__ = ['RoadmapView', 'PhaseDetailView']
+__all__ = ['RoadmapView', 'PhaseDetailView', 'DebugView']
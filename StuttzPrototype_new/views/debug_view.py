@@ -0,0 +1,176 @@
+"""
+PAINEL DE DIAGNÓSTICO
+Mostra as métricas de desempenho (latência dos eventos, construção das views,
+bytes enviados e chamadas de IA) e permite exportá-las
+"""
+
+import flet as ft
+import os
+from datetime import datetime
+from typing import List
+from config import Config
+from utils.metrics import metrics
+from utils.persistence import atomic_write_text
+
+class DebugView:
+    """
+    Classe que constrói o painel de diagnóstico
+    
+    Aberto com Ctrl+Shift+D. A tabela é recalculada a cada visita ao painel
+    e ao clicar em "Atualizar".
+    """
+    
+    def __init__(self, controller):
+        self.controller = controller
+        # Referências para atualização incremental
+        self.metrics_table = None
+        self.cache_text = None
+        self.status_text = None
+    
+    def build(self) -> ft.Control:
+        """
+        Constrói toda a interface do painel
+        """
+        self.metrics_table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text("Métrica", font_family=Config.INTERFACE_FONT)),
+                ft.DataColumn(ft.Text("n"), numeric=True),
+                ft.DataColumn(ft.Text("p50"), numeric=True),
+                ft.DataColumn(ft.Text("p95"), numeric=True),
+                ft.DataColumn(ft.Text("máx"), numeric=True),
+            ],
+            rows=self.build_rows(),
+            column_spacing=12,
+            data_row_min_height=28,
+            data_row_max_height=40,
+        )
+        self.cache_text = ft.Text(self.get_cache_summary(), size=Config.FONT_SIZE_CAPTION,
+                                  color=Config.COLORS['text_dark'], font_family=Config.TEXT_FONT)
+        self.status_text = ft.Text("", size=Config.FONT_SIZE_CAPTION,
+                                   color=Config.COLORS['primary_blue'], font_family=Config.TEXT_FONT)
+        
+        return ft.Column([
+            ft.Container(
+                content=ft.TextButton(
+                    content=ft.Row([
+                        ft.Text("◀️", size=16),
+                        ft.Text("Voltar ao Mapa", color=Config.COLORS['primary_blue'], size=14,
+                                font_family=Config.INTERFACE_FONT, weight=ft.FontWeight.BOLD)
+                    ], spacing=5),
+                    on_click=lambda e: self.controller.handle_back_to_roadmap()
+                ),
+                alignment=ft.alignment.center_left
+            ),
+            ft.Text(
+                "📊 Diagnóstico",
+                size=Config.FONT_SIZE_SUBTITLE,
+                weight=ft.FontWeight.BOLD,
+                color=Config.COLORS['text_dark'],
+                font_family=Config.TITLE_FONT
+            ),
+            self.cache_text,
+            ft.Row([self.metrics_table], scroll=ft.ScrollMode.AUTO),
+            ft.Row([
+                ft.TextButton("Atualizar", on_click=lambda e: self.handle_refresh_click()),
+                ft.TextButton("Exportar JSON", on_click=lambda e: self.handle_export("json")),
+                ft.TextButton("Exportar Prometheus", on_click=lambda e: self.handle_export("prom")),
+                ft.TextButton("Zerar", on_click=lambda e: self.handle_reset_click()),
+            ], wrap=True),
+            self.status_text
+        ], scroll=ft.ScrollMode.AUTO, spacing=10)
+    
+    def build_rows(self) -> List[ft.DataRow]:
+        """
+        Cria uma linha da tabela para cada série de métrica
+        """
+        rows = []
+        snapshot = metrics.snapshot()
+        
+        for series in snapshot["histograms"]:
+            # Histogramas de tamanho em bytes; os demais em segundos (exibidos em ms)
+            is_bytes = series["name"].endswith("_bytes")
+            fmt = (lambda v: f"{v:.0f} B") if is_bytes else (lambda v: f"{v * 1000:.1f} ms")
+            rows.append(ft.DataRow(cells=[
+                ft.DataCell(ft.Text(self.series_label(series), size=12)),
+                ft.DataCell(ft.Text(str(series["count"]), size=12)),
+                ft.DataCell(ft.Text(fmt(series["p50"]), size=12)),
+                ft.DataCell(ft.Text(fmt(series["p95"]), size=12)),
+                ft.DataCell(ft.Text(fmt(series["max"]), size=12)),
+            ]))
+        
+        for series in snapshot["counters"]:
+            rows.append(ft.DataRow(cells=[
+                ft.DataCell(ft.Text(self.series_label(series), size=12)),
+                ft.DataCell(ft.Text(f"{series['value']:.0f}", size=12)),
+                ft.DataCell(ft.Text("")),
+                ft.DataCell(ft.Text("")),
+                ft.DataCell(ft.Text("")),
+            ]))
+        
+        return rows
+    
+    def series_label(self, series) -> str:
+        """Nome curto de uma série: nome sem o prefixo + rótulos"""
+        name = series["name"]
+        if name.startswith("stuttz_"):
+            name = name[len("stuttz_"):]
+        labels = ",".join(f"{k}={v}" for k, v in series["labels"].items())
+        return f"{name}{{{labels}}}" if labels else name
+    
+    def get_cache_summary(self) -> str:
+        """Resumo do cache de respostas da IA"""
+        stats = self.controller.ai_cache.stats()
+        return (f"Cache da IA: {stats['size']}/{stats['max_entries']} entradas, "
+                f"{stats['hit_rate'] * 100:.0f}% de acertos ({stats['hits']} acertos, {stats['misses']} falhas)")
+    
+    def refresh(self) -> List[ft.Control]:
+        """
+        Recalcula a tabela ao voltar para o painel
+        
+        Returns:
+            Lista de controles alterados que precisam ser enviados à interface
+        """
+        if self.metrics_table is None:
+            return []
+        self.metrics_table.rows = self.build_rows()
+        self.cache_text.value = self.get_cache_summary()
+        self.status_text.value = ""
+        return [self.metrics_table, self.cache_text, self.status_text]
+    
+    def handle_refresh_click(self):
+        """
+        Atualiza a tabela com os valores atuais
+        """
+        self.controller.page.update(*self.refresh())
+    
+    def handle_reset_click(self):
+        """
+        Remove todas as medidas registradas
+        """
+        if not self.controller.debug_panel_enabled():
+            return  # As métricas são compartilhadas por todas as sessões
+        metrics.reset()
+        changed = self.refresh()
+        self.status_text.value = "Métricas zeradas"
+        self.controller.page.update(*changed)
+    
+    def handle_export(self, fmt: str):
+        """
+        Grava as métricas atuais em um arquivo
+        
+        Args:
+            fmt: "json" ou "prom" (formato de texto do Prometheus)
+        """
+        if not self.controller.debug_panel_enabled():
+            return  # Não gravar arquivos no servidor a pedido de uma sessão
+        content = metrics.to_json() if fmt == "json" else metrics.to_prometheus()
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(Config.METRICS_EXPORT_DIR, f"metrics-{stamp}.{fmt}")
+        
+        try:
+            os.makedirs(Config.METRICS_EXPORT_DIR, exist_ok=True)
+            atomic_write_text(path, content)
+            self.status_text.value = f"✅ Exportado para {path}"
+        except OSError as e:
+            self.status_text.value = f"❌ Erro ao exportar: {e}"
+        self.controller.page.update(self.status_text)
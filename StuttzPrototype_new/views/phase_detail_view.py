@@ -4,7 +4,15 @@ Mostra informações detalhadas e quiz de uma fase
 """
 
 import flet as ft
+import time
+from typing import List
 from config import Config, Messages
+from models.data_models import PhaseStatus
+from utils.ai_prompts import study_tip_topic
+from utils.ai_fallbacks import fallback_study_tip, fallback_explanation
+from utils.ai_helper import is_error_response
+from utils.metrics import metrics
+from utils.update_batch import UpdateBatch
 
 class PhaseDetailView:
     """
@@ -27,6 +35,15 @@ class PhaseDetailView:
         self.explanation_button = None
         # Adicionar lista para armazenar referências aos containers das opções
         self.option_containers = []
+        # Contadores das requisições de IA (apenas a mais recente atualiza a tela)
+        self._tip_request_id = 0
+        self._explanation_request_id = 0
+        # Referências para atualização incremental ao voltar para a fase
+        self.task_markers = []  # Marcadores (✓/○) de cada tarefa
+        self._tasks_completed = False  # Estado exibido nos marcadores
+        self._selected_option_index = None  # Opção destacada no momento
+        # Controles alterados em cada evento, enviados de uma só vez ao final
+        self.updates = UpdateBatch(controller.page)
     
     def build(self) -> ft.Control:
         """
@@ -65,6 +82,48 @@ class PhaseDetailView:
             alignment=ft.alignment.center_left
         )
     
+    def refresh(self) -> List[ft.Control]:
+        """
+        Prepara a view reaproveitada para uma nova visita à fase
+        
+        Reinicia o quiz (seleção, feedback e explicação) e atualiza os
+        marcadores das tarefas caso o status da fase tenha mudado.
+        
+        Returns:
+            Lista de controles alterados que precisam ser enviados à interface
+        """
+        changed: List[ft.Control] = []
+        if not self.phase_data:
+            return changed
+        
+        # Marcadores das tarefas
+        is_completed = self.phase_data.status is PhaseStatus.COMPLETED
+        if is_completed != self._tasks_completed:
+            for marker in self.task_markers:
+                marker.value = "✓" if is_completed else "○"
+                marker.color = Config.COLORS['success_green'] if is_completed else Config.COLORS['locked']
+                changed.append(marker)
+            self._tasks_completed = is_completed
+        
+        # Opção destacada do quiz
+        if self._selected_option_index is not None:
+            container = self.option_containers[self._selected_option_index]
+            container.border = ft.border.all(2, "#DDDDDD")
+            container.bgcolor = None
+            changed.append(container)
+            self._selected_option_index = None
+        
+        # Feedback e explicação da tentativa anterior
+        for container in (self.feedback_container, self.explanation_button, self.ai_explanation_container):
+            if container is not None and container.visible:
+                container.visible = False
+                changed.append(container)
+        
+        # Descartar explicações ainda em andamento da visita anterior
+        self._explanation_request_id += 1
+        
+        return changed
+    
     def build_phase_header(self) -> ft.Control:
         """
         Cabeçalho da fase com título e descrição
@@ -98,14 +157,14 @@ class PhaseDetailView:
         
         return ft.Column([
             ft.Text(
-                f"Fase {self.phase_id}: {self.phase_data['title']}",
+                f"Fase {self.phase_id}: {self.phase_data.title}",
                 size=Config.FONT_SIZE_TITLE,
                 weight=ft.FontWeight.BOLD,
                 color=Config.COLORS['text_dark'],
                 font_family=Config.TITLE_FONT
             ),
             ft.Text(
-                self.phase_data['description'],
+                self.phase_data.description,
                 size=Config.FONT_SIZE_BODY,
                 color=Config.COLORS['accent_gold'],
                 font_family=Config.TEXT_FONT
@@ -129,65 +188,89 @@ class PhaseDetailView:
             self.study_tip_container
         ], spacing=5)
 
+    @metrics.timed("stuttz_handler_seconds", handler="study_tip")
     def show_study_tip(self):
         """
         Exibe uma dica de estudo gerada por IA
+        
+        A dica é solicitada em segundo plano: o container mostra um estado de
+        carregamento imediatamente e o texto é substituído quando a resposta chega.
         """
+        with self.updates.event():
+            self._request_study_tip()
+    
+    def _request_study_tip(self):
+        """Exibe o carregamento da dica e a solicita à IA (dentro do lote do evento)"""
         # Mostrar loading
-        self.controller.show_message("⏳ Gerando dica de estudo...")
+        self.controller.show_message(Messages.AI_LOADING_TIP)
         
         # Gerar dica
-        topic = self.phase_data['title']
+        topic = self.phase_data.title
         
-        if 'tasks' in self.phase_data and len(self.phase_data['tasks']) > 0:
-            # Usar a primeira tarefa como tópico específico
-            specific_topic = self.phase_data['tasks'][0]
-        else:
-            specific_topic = "Python"
+        # Usar a primeira tarefa como tópico específico (o mesmo usado no pré-carregamento)
+        specific_topic = study_tip_topic(self.phase_data)
         
-        # Tentar gerar a dica com a API
-        tip = self.controller.generate_study_tip(topic, specific_topic)
+        if not (self.study_tip_text and self.study_tip_container):
+            print("❌ Container de dica não encontrado")
+            return
         
-        # Verificar se a dica contém mensagem de erro de API
-        if "não está configurada" in tip.lower():
-            # Usar dicas estáticas se a API não estiver disponível
-            if topic == "Fundamentos":
-                tip = "Pratique escrevendo pequenos programas Python todos os dias. Comece com scripts simples que usam print() e variáveis básicas."
-            elif topic == "Estruturas de Dados":
-                tip = "Experimente criar diferentes tipos de listas e dicionários. Tente converter entre eles para entender suas diferenças e semelhanças."
-            else:
-                tip = "Divida seu aprendizado em pequenas sessões diárias. Consistência é mais importante que sessões longas e esporádicas."
+        # Identificar a requisição para descartar respostas de cliques anteriores
+        self._tip_request_id += 1
+        request_id = self._tip_request_id
         
-        print(f"Dica gerada: {tip}")
+        # Exibir o estado de carregamento enquanto a IA responde
+        self.study_tip_text.value = Messages.AI_LOADING_TIP
+        self.study_tip_container.visible = True
+        self.updates.mark(self.study_tip_container)
         
-        # Atualizar o container de dica diretamente
-        if self.study_tip_text and self.study_tip_container:
+        def on_tip_ready(tip: str):
+            # Ignorar respostas de requisições que já foram substituídas
+            if request_id != self._tip_request_id:
+                return
+            
+            # Usar uma dica estática se a IA não estiver disponível (erros nunca vão para o cache)
+            if is_error_response(tip):
+                tip = fallback_study_tip(topic)
+            
+            print(f"Dica gerada: {tip}")
             self.study_tip_text.value = tip
-            self.study_tip_container.visible = True
             print("✅ Container de dica atualizado")
             
-            # Forçar atualização da interface
-            self.controller.page.update()
-        else:
-            print("❌ Container de dica não encontrado")
+            # Atualizar apenas o texto da dica
+            self.updates.mark(self.study_tip_text)
+        
+        def on_tip_error(error: BaseException):
+            if request_id != self._tip_request_id:
+                return
+            self.study_tip_text.value = Messages.AI_REQUEST_ERROR
+            self.updates.mark(self.study_tip_text)
+        
+        # Solicitar a dica em segundo plano
+        self.controller.generate_study_tip_async(
+            topic, specific_topic, on_done=on_tip_ready, on_error=on_tip_error
+        )
     
     def build_tasks_section(self) -> ft.Control:
         """
         Seção com lista de tarefas
         """
         task_items = []
-        
-        for i, task in enumerate(self.phase_data['tasks'], 1):
-            is_completed = self.phase_data['status'] == 'completed'
+        self.task_markers = []
+        is_completed = self.phase_data.status is PhaseStatus.COMPLETED
+        self._tasks_completed = is_completed
+        
+        for i, task in enumerate(self.phase_data.tasks, 1):
+            # Usando emojis em vez de ícones
+            marker = ft.Text(
+                "✓" if is_completed else "○",
+                color=Config.COLORS['success_green'] if is_completed else Config.COLORS['locked'],
+                size=20
+            )
+            self.task_markers.append(marker)
             
             task_item = ft.Container(
                 content=ft.Row([
-                    # Usando emojis em vez de ícones
-                    ft.Text(
-                        "✓" if is_completed else "○",
-                        color=Config.COLORS['success_green'] if is_completed else Config.COLORS['locked'],
-                        size=20
-                    ),
+                    marker,
                     ft.Text(
                         f"{i}. {task}",
                         size=Config.FONT_SIZE_BODY,
@@ -216,11 +299,10 @@ class PhaseDetailView:
         Seção com quiz da fase
         """
         # Verificar se a fase tem quiz
-        if not self.phase_data.get('quiz'):
+        quiz = self.phase_data.quiz
+        if quiz is None:
             return ft.Container()  # Retorna container vazio se não tiver quiz
         
-        quiz = self.phase_data['quiz']
-        
         # Criar container para explicação da IA
         self.ai_explanation_text = ft.Text(
             "",
@@ -261,7 +343,7 @@ class PhaseDetailView:
             # Pergunta do quiz
             ft.Container(
                 content=ft.Text(
-                    quiz['question'],
+                    quiz.question,
                     size=Config.FONT_SIZE_BODY,
                     color=Config.COLORS['text_dark'],
                     font_family=Config.TEXT_FONT
@@ -289,7 +371,7 @@ class PhaseDetailView:
         options_list = []
         self.option_containers = []  # Limpar lista de containers
         
-        for i, option in enumerate(quiz['options']):
+        for i, option in enumerate(quiz.options):
             # Criar container para cada opção
             option_container = ft.Container(
                 content=ft.Row([
@@ -387,34 +469,90 @@ class PhaseDetailView:
         
         return feedback_container
     
+    @metrics.timed("stuttz_handler_seconds", handler="ai_explanation")
     def generate_ai_explanation(self):
         """
         Gera uma explicação para a resposta do quiz usando IA
+        
+        A explicação é solicitada em segundo plano; enquanto isso o container
+        de explicação exibe um estado de carregamento.
         """
+        with self.updates.event():
+            self._request_explanation()
+    
+    def _request_explanation(self):
+        """Exibe o carregamento da explicação e a solicita à IA (dentro do lote do evento)"""
         # Mostrar loading
-        self.controller.show_message("⏳ Gerando explicação...")
+        self.controller.show_message(Messages.AI_LOADING_EXPLANATION)
         
         # Obter dados do quiz
-        quiz = self.phase_data['quiz']
-        question = quiz['question']
-        correct_answer = quiz['options'][quiz['correct_answer_index']]
+        quiz = self.phase_data.quiz
+        question = quiz.question
+        correct_answer = quiz.correct_answer
         
-        # Tentar gerar explicação com a API
-        explanation = self.controller.generate_explanation(question, correct_answer)
-        
-        # Verificar se a explicação contém mensagem de erro de API
-        if "não está configurada" in explanation.lower():
-            # Usar explicações estáticas se a API não estiver disponível
-            explanation = f"A resposta correta é '{correct_answer}'. Esta é a opção que melhor responde à pergunta, considerando os conceitos abordados nesta fase do curso."
+        if not (self.ai_explanation_text and self.ai_explanation_container):
+            return
         
-        # Atualizar o container de explicação
-        if self.ai_explanation_text and self.ai_explanation_container:
-            self.ai_explanation_text.value = explanation
-            self.ai_explanation_container.visible = True
+        # Identificar a requisição para descartar respostas de cliques anteriores
+        self._explanation_request_id += 1
+        request_id = self._explanation_request_id
+        
+        # Exibir o estado de carregamento enquanto a IA responde
+        self.ai_explanation_text.value = Messages.AI_LOADING_EXPLANATION
+        self.ai_explanation_container.visible = True
+        self.updates.mark(self.ai_explanation_container)
+        
+        # Trechos recebidos e momento da última atualização da tela
+        received: List[str] = []
+        last_update = [0.0]
+        
+        def on_explanation_chunk(chunk: str):
+            # Ignorar trechos de requisições que já foram substituídas
+            if request_id != self._explanation_request_id:
+                return
+            # Mensagens de erro são substituídas pela explicação estática ao final
+            if not received and is_error_response(chunk):
+                return
+            received.append(chunk)
+            
+            # Limitar a frequência de atualizações para não sobrecarregar a conexão
+            now = time.monotonic()
+            if now - last_update[0] < Config.STREAM_UPDATE_INTERVAL:
+                return
+            last_update[0] = now
+            
+            # Exibir o texto recebido até agora
+            self.ai_explanation_text.value = "".join(received)
+            self.updates.mark(self.ai_explanation_text)
+        
+        def on_explanation_ready(explanation: str):
+            # Ignorar respostas de requisições que já foram substituídas
+            if request_id != self._explanation_request_id:
+                return
+            
+            # Usar uma explicação estática se a IA não estiver disponível
+            if is_error_response(explanation):
+                explanation = fallback_explanation(correct_answer)
             
-            # Forçar atualização da interface
-            self.controller.page.update()
+            # Exibir a explicação completa (inclui trechos não exibidos pelo limite de frequência)
+            self.ai_explanation_text.value = explanation
+            self.updates.mark(self.ai_explanation_text)
+        
+        def on_explanation_error(error: BaseException):
+            # Stream interrompido: substituir o texto parcial pela explicação estática
+            if request_id != self._explanation_request_id:
+                return
+            self.ai_explanation_text.value = fallback_explanation(correct_answer)
+            self.updates.mark(self.ai_explanation_text)
+        
+        # Solicitar a explicação em segundo plano, recebendo o texto em partes
+        self.controller.stream_explanation_async(
+            question, correct_answer,
+            on_chunk=on_explanation_chunk,
+            on_done=on_explanation_ready, on_error=on_explanation_error
+        )
     
+    @metrics.timed("stuttz_handler_seconds", handler="option_click")
     def handle_option_click(self, option_index: int):
         """
         Manipula o clique em uma opção do quiz
@@ -423,35 +561,50 @@ class PhaseDetailView:
         self.controller.selected_option = option_index
         print(f"Opção selecionada: {option_index}")
         
-        # Atualizar o estilo visual das opções
-        for i, container in enumerate(self.option_containers):
-            if i == option_index:
-                # Destacar a opção selecionada
-                container.border = ft.border.all(2, Config.COLORS['primary_blue'])
-                container.bgcolor = "#E3F2FD"  # Fundo azul claro
-            else:
-                # Restaurar estilo padrão das outras opções
-                container.border = ft.border.all(2, "#DDDDDD")
-                container.bgcolor = None
-        
-        # Atualizar a interface
-        self.controller.page.update()
+        previous_index = self._selected_option_index
+        self._selected_option_index = option_index
+        if previous_index == option_index:
+            return  # A opção já está destacada
+        
+        with self.updates.event():
+            # Restaurar o estilo padrão da opção destacada antes (as demais não mudam)
+            if previous_index is not None:
+                previous = self.option_containers[previous_index]
+                previous.border = ft.border.all(2, "#DDDDDD")
+                previous.bgcolor = None
+                self.updates.mark(previous)
+            
+            # Destacar a opção selecionada
+            container = self.option_containers[option_index]
+            container.border = ft.border.all(2, Config.COLORS['primary_blue'])
+            container.bgcolor = "#E3F2FD"  # Fundo azul claro
+            self.updates.mark(container)
     
+    @metrics.timed("stuttz_handler_seconds", handler="quiz_submit")
     def handle_quiz_submit(self, e):
         """
         Manipula o envio da resposta do quiz
+        
+        O feedback é enviado uma única vez, ao final do evento, depois de
+        concedido o XP e desbloqueada a próxima fase
         """
+        with self.updates.event():
+            self._submit_answer()
+    
+    def _submit_answer(self):
+        """Corrige a resposta selecionada e prepara o feedback (dentro do lote do evento)"""
         # Verificar se há uma opção selecionada
         if self.controller.selected_option is None:
             self.controller.show_message(Messages.NO_ANSWER_SELECTED)
             return
         
         # Obter o índice da resposta correta
-        correct_index = self.phase_data['quiz']['correct_answer_index']
+        correct_index = self.phase_data.quiz.correct_answer_index
         selected_index = self.controller.selected_option
         
         # Verificar se a resposta está correta
         is_correct = selected_index == correct_index
+        self.controller.record_quiz_attempt(self.phase_id, selected_index, is_correct)
         
         # Preparar feedback
         if is_correct:
@@ -462,14 +615,16 @@ class PhaseDetailView:
             if self.feedback_container:
                 self.feedback_container.border = ft.border.all(2, Config.COLORS['success_green'])
             
-            # Conceder XP
-            self.award_xp_for_correct_answer()
-            
-            # Verificar se deve desbloquear a próxima fase
-            self.check_and_unlock_next_phase()
+            # Outras sessões do mesmo perfil podem alterar os mesmos dados
+            with self.controller.profile.lock:
+                # Conceder XP
+                self.award_xp_for_correct_answer()
+                
+                # Verificar se deve desbloquear a próxima fase
+                self.check_and_unlock_next_phase()
         else:
             # Resposta incorreta
-            correct_option = self.phase_data['quiz']['options'][correct_index]
+            correct_option = self.phase_data.quiz.correct_answer
             if self.feedback_text:
                 self.feedback_text.value = Messages.QUIZ_INCORRECT.format(correct=correct_option)
                 self.feedback_text.color = Config.COLORS['error_red']
@@ -481,44 +636,44 @@ class PhaseDetailView:
             self.feedback_container.visible = True
         if self.explanation_button:
             self.explanation_button.visible = True
-        # Atualizar interface
-        self.controller.page.update()
+        # Enviar o container do feedback (inclui o texto e o botão de explicação)
+        self.updates.mark(self.feedback_container)
     
     def award_xp_for_correct_answer(self):
         """
         Concede XP ao usuário por resposta correta
         """
         # Verificar se o quiz já foi respondido corretamente antes
-        if self.phase_data.get('quiz_completed', False):
+        if self.phase_data.quiz_completed:
             print("Quiz já foi completado anteriormente. Nenhum XP concedido.")
             return
         
         # Marcar o quiz como completado
-        self.phase_data['quiz_completed'] = True
+        self.phase_data.quiz_completed = True
         
         # Adicionar XP
         xp_gained = Config.XP_PER_CORRECT_ANSWER
         user = self.controller.user_data
         
         # Atualizar XP do usuário
-        user["xp"] += xp_gained
+        user.xp += xp_gained
         
         # Verificar se subiu de nível
-        if user["xp"] >= user["xp_to_next"]:
+        if user.xp >= user.xp_to_next:
             # Subir de nível
-            user["level"] += 1
+            user.level += 1
             # Calcular XP excedente
-            excess_xp = user["xp"] - user["xp_to_next"]
+            excess_xp = user.xp - user.xp_to_next
             # Definir novo limite de XP
-            user["xp_to_next"] = Config.XP_PER_LEVEL * user["level"]
+            user.xp_to_next = Config.XP_PER_LEVEL * user.level
             # Definir XP atual como o excedente
-            user["xp"] = excess_xp
+            user.xp = excess_xp
             
             # Mostrar mensagem de level up
-            self.controller.show_message(Messages.LEVEL_UP.format(level=user["level"]))
+            self.controller.show_message(Messages.LEVEL_UP.format(level=user.level))
         
-        # Salvar dados do usuário
-        self.controller.save_user_data()
+        # Salvar apenas os campos alterados do usuário
+        self.controller.save_user_fields("xp", "level", "xp_to_next")
         
         print(f"✅ {xp_gained} XP concedidos ao usuário!")
     
@@ -526,34 +681,26 @@ class PhaseDetailView:
         """
         Verifica se deve desbloquear a próxima fase
         """
-        # Marcar a fase atual como completada
-        self.phase_data['status'] = 'completed'
-        
-        # Obter todas as fases
-        phases = self.controller.roadmap_data['phases']
-        
-        # Encontrar a fase atual
-        current_phase_index = -1
-        for i, phase in enumerate(phases):
-            if phase['id'] == self.phase_id:
-                current_phase_index = i
-                break
-        
-        # Se encontrou a fase atual e não é a última
-        if current_phase_index >= 0 and current_phase_index < len(phases) - 1:
-            # Obter a próxima fase
-            next_phase = phases[current_phase_index + 1]
-            
-            # Se a próxima fase estiver bloqueada, desbloqueá-la
-            if next_phase['status'] == 'locked':
-                next_phase['status'] = 'unlocked'
-                
-                # Mostrar mensagem de fase desbloqueada
-                self.controller.show_message(
-                    Messages.PHASE_UNLOCKED.format(phase=next_phase['title'])
-                )
-                
-                print(f"✅ Fase {next_phase['id']} desbloqueada!")
+        roadmap = self.controller.roadmap
+        
+        # Marcar a fase atual como completada (status e progresso do usuário)
+        roadmap.mark_completed(self.phase_id)
+        self.controller.save_phase_progress(self.phase_id)
         
-        # Salvar dados do roadmap
-        self.controller.save_roadmap_data()
+        # Obter a próxima fase pelo índice do roadmap
+        next_phase = roadmap.next_phase(self.phase_id)
+        
+        # Se a próxima fase estiver bloqueada, desbloqueá-la
+        if next_phase is not None and next_phase.status is PhaseStatus.LOCKED:
+            roadmap.set_status(next_phase.id, PhaseStatus.UNLOCKED)
+            self.controller.save_phase_progress(next_phase.id)
+            
+            # Mostrar mensagem de fase desbloqueada
+            self.controller.show_message(
+                Messages.PHASE_UNLOCKED.format(phase=next_phase.title)
+            )
+            
+            print(f"✅ Fase {next_phase.id} desbloqueada!")
+            
+            # Gerar em segundo plano a dica e a explicação da fase desbloqueada
+            self.controller.prefetch_next_phase(self.phase_id)
@@ -5,9 +5,20 @@ Implementa a visualização principal do aplicativo
 """
 
 import flet as ft  # Biblioteca para construção da interface gráfica
-import math  # Módulo para operações matemáticas
-from typing import List, Tuple  # Tipos para anotações de tipo
+import flet.canvas as cv  # Formas desenhadas no mapa visual
+from typing import Dict, List, Optional, Tuple  # Tipos para anotações de tipo
 from config import Config  # Importa configurações globais do aplicativo
+from models.data_models import PhaseData, PhaseStatus  # Dados e status das fases
+from utils.metrics import metrics  # Métricas de latência dos handlers
+from utils.roadmap_layout import TrailLayout, trail_layout  # Geometria da trilha do mapa
+
+# Ícone exibido para cada status de fase
+STATUS_ICONS = {
+    PhaseStatus.COMPLETED: "✅",  # Fase completada
+    PhaseStatus.UNLOCKED: "🔵",  # Fase desbloqueada
+    PhaseStatus.CURRENT: "⭐",   # Fase atual
+    PhaseStatus.LOCKED: "🔒"     # Fase bloqueada
+}
 
 class RoadmapView:
     """
@@ -16,27 +27,76 @@ class RoadmapView:
     Esta view é responsável por exibir:
     - Informações do curso
     - Cartão do usuário com nível e progresso
-    - Lista de fases do roadmap com seus status
+    - Fases do roadmap com seus status (mapa visual ou lista)
     """
     
-    def __init__(self, controller):
+    def __init__(self, controller, lazy: Optional[bool] = None, canvas: Optional[bool] = None):
         """
         Inicializa a view com uma referência ao controlador
         
         Args:
             controller: Instância do AppController que gerencia o estado do app
+            lazy: Força (True) ou desativa (False) a lista virtualizada de fases.
+                  Se None, usa a lista virtualizada para cursos com mais de
+                  Config.ROADMAP_LAZY_THRESHOLD fases
+            canvas: Desenha as fases no mapa visual (trilha) em vez da lista de
+                    botões. Se None, usa Config.ROADMAP_CANVAS. Ignorado no
+                    modo virtualizado
         """
         self.controller = controller  # Armazena referência ao controlador
+        
+        # === MODO VIRTUALIZADO ===
+        if lazy is None:
+            lazy = len(controller.roadmap) > Config.ROADMAP_LAZY_THRESHOLD
+        self.lazy = lazy
+        self.phase_list_view = None  # ListView com as fases (apenas no modo virtualizado)
+        self._next_phase_index = 0  # Próxima fase a ser construída no modo virtualizado
+        
+        # === MAPA VISUAL ===
+        self.canvas = (Config.ROADMAP_CANVAS if canvas is None else canvas) and not lazy
+        self.layout: Optional[TrailLayout] = None  # Geometria da trilha (compartilhada entre as sessões)
+        
+        # === REFERÊNCIAS PARA ATUALIZAÇÃO INCREMENTAL ===
+        # Controles do cartão do usuário que mudam com XP, nível e streak
+        self.avatar_text = None
+        self.user_name_text = None
+        self.level_text = None
+        self.streak_text = None
+        self.xp_bar = None
+        self.xp_text = None
+        self._user_snapshot = {}  # Últimos valores exibidos no cartão do usuário
+        # Partes de cada botão de fase: {phase_id: (container, ícone, seta)}
+        self.phase_parts = {}
+        # Formas de cada fase no mapa visual: {phase_id: (círculo, contorno, ícone)}
+        self.node_shapes: Dict[int, Tuple[cv.Circle, cv.Circle, cv.Text]] = {}
+        self._phase_status = {}  # Último status exibido para cada fase
     
     def build(self) -> ft.Control:
         """
         Constrói toda a interface do roadmap
         
-        Organiza todos os componentes em uma coluna vertical com rolagem
+        Organiza todos os componentes em uma coluna vertical com rolagem.
+        No modo virtualizado, a rolagem fica a cargo da lista de fases.
         
         Returns:
             Componente Flet que representa a tela completa do roadmap
         """
+        if self.lazy:
+            return ft.Column([
+                self.build_header(),  # Cabeçalho com o nome do curso
+                self.build_user_card(),  # Cartão com informações do usuário
+                ft.Container(height=20),  # Espaçamento vertical
+                self.build_lazy_roadmap_display(),  # Lista virtualizada de fases
+            ], expand=True)
+        
+        if self.canvas:
+            return ft.Column([
+                self.build_header(),  # Cabeçalho com o nome do curso
+                self.build_user_card(),  # Cartão com informações do usuário
+                ft.Container(height=20),  # Espaçamento vertical
+                self.build_map_display(),  # Mapa visual com a trilha de fases
+            ], scroll=ft.ScrollMode.AUTO)
+        
         return ft.Column([
             self.build_header(),  # Cabeçalho com o nome do curso
             self.build_user_card(),  # Cartão com informações do usuário
@@ -53,7 +113,7 @@ class RoadmapView:
         """
         return ft.Container(
             content=ft.Text(
-                self.controller.roadmap_data["course_name"],  # Nome do curso obtido dos dados
+                self.controller.roadmap_data.course_name,  # Nome do curso obtido dos dados
                 size=Config.FONT_SIZE_TITLE,  # Tamanho da fonte aumentado
                 weight=ft.FontWeight.BOLD,  # Fonte em negrito
                 color=Config.COLORS['text_dark'],  # Cor do texto definida nas configurações
@@ -77,69 +137,72 @@ class RoadmapView:
         Returns:
             Card com informações do usuário
         """
-        user = self.controller.user_data  # Obtém dados do usuário do controlador
+        values = self.get_user_card_values()  # Valores exibidos no cartão
+        self._user_snapshot = values
         
-        # Calcular progresso XP como porcentagem (0 a 1)
-        progress_percent = user["xp"] / user["xp_to_next"] if user["xp_to_next"] > 0 else 0
-        
-        # Obter título do nível das configurações
-        level_title = Config.LEVEL_TITLES.get(user["level"], "Aprendiz")
+        # Avatar com as iniciais do usuário
+        self.avatar_text = ft.Text(
+            values["initials"],  # Primeiras duas letras do nome em maiúsculas
+            size=18,
+            weight=ft.FontWeight.BOLD
+        )
+        # Nome do usuário
+        self.user_name_text = ft.Text(
+            values["name"], 
+            size=Config.FONT_SIZE_SUBTITLE, 
+            weight=ft.FontWeight.BOLD,
+            color=Config.COLORS['text_dark'],
+            font_family=Config.INTERFACE_FONT
+        )
+        # Título baseado no nível
+        self.level_text = ft.Text(
+            values["level_title"],
+            size=Config.FONT_SIZE_BODY,
+            color=Config.COLORS['primary_blue'],
+            font_family=Config.TEXT_FONT
+        )
+        # Streak (dias consecutivos)
+        self.streak_text = ft.Text(
+            values["streak"],
+            size=Config.FONT_SIZE_BODY,
+            color=Config.COLORS['error_red'],
+            font_family=Config.TEXT_FONT
+        )
+        # Barra de progresso de XP
+        self.xp_bar = ft.ProgressBar(
+            value=values["progress"],  # Valor entre 0 e 1
+            height=6,  # Altura da barra
+            bgcolor="#E6E6E6",  # Cor de fundo
+            color=Config.COLORS['primary_blue']  # Cor da barra de progresso
+        )
+        # Texto com valores de XP
+        self.xp_text = ft.Text(
+            values["xp"],
+            size=10,
+            color=Config.COLORS['text_light'],
+            font_family=Config.TEXT_FONT
+        )
         
         return ft.Card(
             content=ft.Container(
                 content=ft.Row([
                     # Avatar circular com as iniciais do usuário
                     ft.CircleAvatar(
-                        content=ft.Text(
-                            user["name"][:2].upper(),  # Primeiras duas letras do nome em maiúsculas
-                            size=18,
-                            weight=ft.FontWeight.BOLD
-                        ),
+                        content=self.avatar_text,
                         radius=25,  # Raio do círculo
                         bgcolor=Config.COLORS['accent_gold'],  # Cor de fundo do avatar
                         color=Config.COLORS['text_dark']  # Cor do texto
                     ),
                     # Coluna com informações do usuário
                     ft.Column([
-                        # Nome do usuário
-                        ft.Text(
-                            user["name"], 
-                            size=Config.FONT_SIZE_SUBTITLE, 
-                            weight=ft.FontWeight.BOLD,
-                            color=Config.COLORS['text_dark'],
-                            font_family=Config.INTERFACE_FONT
-                        ),
-                        # Título baseado no nível
-                        ft.Text(
-                            f"✨ {level_title}",
-                            size=Config.FONT_SIZE_BODY,
-                            color=Config.COLORS['primary_blue'],
-                            font_family=Config.TEXT_FONT
-                        ),
-                        # Streak (dias consecutivos)
+                        self.user_name_text,
+                        self.level_text,
                         ft.Row([
                             ft.Text("🔥", size=Config.FONT_SIZE_BODY),  # Emoji de fogo
-                            ft.Text(
-                                f"{user['streak']} dias",
-                                size=Config.FONT_SIZE_BODY,
-                                color=Config.COLORS['error_red'],
-                                font_family=Config.TEXT_FONT
-                            )
+                            self.streak_text
                         ], spacing=5),
-                        # Barra de progresso de XP
-                        ft.ProgressBar(
-                            value=progress_percent,  # Valor entre 0 e 1
-                            height=6,  # Altura da barra
-                            bgcolor="#E6E6E6",  # Cor de fundo
-                            color=Config.COLORS['primary_blue']  # Cor da barra de progresso
-                        ),
-                        # Texto com valores de XP
-                        ft.Text(
-                            f"XP: {user['xp']}/{user['xp_to_next']}",
-                            size=10,
-                            color=Config.COLORS['text_light'],
-                            font_family=Config.TEXT_FONT
-                        )
+                        self.xp_bar,
+                        self.xp_text
                     ], spacing=3, expand=True)  # Espaçamento entre elementos e expansão para preencher espaço
                 ], spacing=15),  # Espaçamento entre avatar e informações
                 padding=15  # Espaçamento interno do container
@@ -147,6 +210,75 @@ class RoadmapView:
             elevation=3  # Sombra do card para efeito 3D
         )
     
+    def get_user_card_values(self) -> dict:
+        """
+        Calcula os valores exibidos no cartão do usuário
+        
+        Returns:
+            Dicionário com os textos e o progresso de XP já formatados
+        """
+        user = self.controller.user_data  # Obtém dados do usuário do controlador
+        
+        # Calcular progresso XP como porcentagem (0 a 1)
+        progress_percent = user.xp / user.xp_to_next if user.xp_to_next > 0 else 0
+        
+        # Obter título do nível das configurações
+        level_title = Config.LEVEL_TITLES.get(user.level, "Aprendiz")
+        
+        return {
+            "initials": user.name[:2].upper(),
+            "name": user.name,
+            "level_title": f"✨ {level_title}",
+            "streak": f"{user.streak} dias",
+            "progress": progress_percent,
+            "xp": f"XP: {user.xp}/{user.xp_to_next}",
+        }
+    
+    def refresh(self) -> List[ft.Control]:
+        """
+        Atualiza apenas os controles cujos dados mudaram desde a última exibição
+        
+        Compara o cartão do usuário e o status de cada fase com os valores
+        exibidos anteriormente e altera somente os controles afetados.
+        
+        Returns:
+            Lista de controles alterados que precisam ser enviados à interface
+        """
+        changed: List[ft.Control] = []
+        
+        # Cartão do usuário: cada valor corresponde a um controle
+        values = self.get_user_card_values()
+        user_controls = {
+            "initials": (self.avatar_text, "value"),
+            "name": (self.user_name_text, "value"),
+            "level_title": (self.level_text, "value"),
+            "streak": (self.streak_text, "value"),
+            "progress": (self.xp_bar, "value"),
+            "xp": (self.xp_text, "value"),
+        }
+        for key, (control, attr) in user_controls.items():
+            if control is not None and self._user_snapshot.get(key) != values[key]:
+                setattr(control, attr, values[key])
+                changed.append(control)
+        self._user_snapshot = values
+        
+        # Fases: reestilizar apenas as que já foram construídas e mudaram de status
+        for phase_id in self.phase_parts:
+            phase = self.controller.roadmap.get_phase(phase_id)
+            if phase is not None and self._phase_status[phase_id] is not phase.status:
+                container = self.apply_phase_style(phase)
+                if container is not None:
+                    changed.append(container)
+        
+        # Mapa visual: redesenhar apenas as fases que mudaram de status
+        for phase_id in self.node_shapes:
+            phase = self.controller.roadmap.get_phase(phase_id)
+            if phase is not None and self._phase_status[phase_id] is not phase.status:
+                changed.extend(self.apply_node_style(phase))
+        
+        return changed
+    
+    @metrics.timed("stuttz_handler_seconds", handler="phase_button_click")
     def handle_phase_button_click(self, e):
         """
         Manipula o clique em um botão de fase
@@ -163,6 +295,136 @@ class RoadmapView:
         print(f"Botão de fase clicado: {phase_id}")
         self.controller.handle_phase_click(phase_id)
     
+    @metrics.timed("stuttz_handler_seconds", handler="map_tap")
+    def handle_map_tap(self, e):
+        """
+        Manipula um toque no mapa visual
+        
+        Encontra a fase tocada pela posição do toque (sem percorrer as fases)
+        e abre a fase se ela não estiver bloqueada
+        
+        Args:
+            e: Evento de toque (TapEvent) com a posição relativa ao mapa
+        """
+        index = self.layout.node_at(e.local_x, e.local_y) if self.layout else None
+        if index is None:
+            return
+        
+        phase = self.controller.roadmap.phases[index]
+        if phase.status is PhaseStatus.LOCKED:
+            return
+        
+        print(f"Fase tocada no mapa: {phase.id}")
+        self.controller.handle_phase_click(phase.id)
+    
+    def build_map_display(self) -> ft.Control:
+        """
+        Exibição do roadmap como um mapa visual
+        
+        Desenha todas as fases em um único canvas: a trilha que liga as fases,
+        um círculo com o ícone de status para cada fase e o seu título. A
+        geometria vem de trail_layout (calculada uma vez por curso); apenas as
+        cores e os ícones dependem do progresso do usuário.
+        
+        Returns:
+            Coluna com título e o mapa de fases
+        """
+        phases = self.controller.roadmap.phases
+        self.layout = layout = trail_layout(len(phases))
+        self.node_shapes = {}
+        self._phase_status = {}
+        
+        shapes: List[ft.Control] = []
+        
+        # Trilha: uma única curva passando por todas as fases
+        if layout.nodes:
+            elements = [cv.Path.MoveTo(*layout.nodes[0])]
+            elements.extend(cv.Path.CubicTo(*segment) for segment in layout.segments)
+            shapes.append(cv.Path(
+                elements,
+                paint=ft.Paint(
+                    color="#D4B896",
+                    stroke_width=6,
+                    style=ft.PaintingStyle.STROKE,
+                    stroke_cap=ft.StrokeCap.ROUND,
+                    stroke_dash_pattern=[12, 10]  # Trilha tracejada
+                )
+            ))
+        
+        for phase, (x, y), (label_x, label_y, label_width, label_left) in zip(phases, layout.nodes, layout.labels):
+            # Círculo, contorno e ícone: alterados por apply_node_style
+            fill = cv.Circle(x, y, layout.node_radius)
+            ring = cv.Circle(x, y, layout.node_radius)
+            icon = cv.Text(x, y, "", style=ft.TextStyle(size=20), alignment=ft.alignment.center)
+            
+            # Título da fase (não muda com o status)
+            label = cv.Text(
+                label_x, label_y,
+                f"Fase {phase.id}: {phase.title}",
+                style=ft.TextStyle(
+                    size=Config.FONT_SIZE_CAPTION,
+                    weight=ft.FontWeight.BOLD,
+                    color=Config.COLORS['text_dark'],
+                    font_family=Config.TITLE_FONT
+                ),
+                alignment=ft.alignment.center_right if label_left else ft.alignment.center_left,
+                text_align=ft.TextAlign.RIGHT if label_left else ft.TextAlign.LEFT,
+                max_width=label_width,
+                max_lines=2,
+                ellipsis="…"
+            )
+            
+            shapes.extend((fill, ring, icon, label))
+            self.node_shapes[phase.id] = (fill, ring, icon)
+            self.apply_node_style(phase)
+        
+        # O toque é tratado no mapa inteiro e localizado pela geometria da trilha
+        phase_map = ft.GestureDetector(
+            content=cv.Canvas(shapes, width=layout.width, height=layout.height),
+            on_tap_down=self.handle_map_tap,
+            mouse_cursor=ft.MouseCursor.CLICK
+        )
+        
+        return ft.Column([
+            ft.Text(
+                "📚 Fases do Curso",
+                size=Config.FONT_SIZE_TITLE,
+                weight=ft.FontWeight.BOLD,
+                color=Config.COLORS['text_dark'],
+                font_family=Config.TITLE_FONT
+            ),
+            ft.Container(height=10),  # Espaçamento vertical
+            ft.Container(content=phase_map, alignment=ft.alignment.center)
+        ], spacing=5)
+    
+    def apply_node_style(self, phase: PhaseData) -> List[ft.Control]:
+        """
+        Aplica ao círculo da fase no mapa o visual correspondente ao seu status
+        
+        Args:
+            phase: Dados da fase
+            
+        Returns:
+            Formas alteradas (vazia se a fase não estiver no mapa)
+        """
+        shapes = self.node_shapes.get(phase.id)
+        if shapes is None:
+            return []
+        fill, ring, icon = shapes
+        
+        is_clickable = phase.status is not PhaseStatus.LOCKED
+        
+        fill.paint = ft.Paint(color=Config.COLORS.get(phase.status.value, "#DDDDDD"), style=ft.PaintingStyle.FILL)
+        ring.paint = ft.Paint(
+            color=Config.COLORS['primary_blue'] if is_clickable else Config.COLORS['locked'],
+            style=ft.PaintingStyle.STROKE,
+            stroke_width=3
+        )
+        icon.text = STATUS_ICONS.get(phase.status, "❓")
+        
+        self._phase_status[phase.id] = phase.status
+        return [fill, ring, icon]
+    
     def build_roadmap_display(self) -> ft.Control:
         """
         Exibição do roadmap - versão simplificada textual
@@ -174,84 +436,12 @@ class RoadmapView:
             Coluna com título e lista de fases do roadmap
         """
         phases_list = []  # Lista que armazenará os botões de fase
+        self.phase_parts = {}
+        self._phase_status = {}
         
         # Itera sobre todas as fases no roadmap
-        for phase in self.controller.roadmap_data["phases"]:
-            # Determinar ícone baseado no status da fase
-            status_icons = {
-                "completed": "✅",  # Fase completada
-                "unlocked": "🔵",  # Fase desbloqueada
-                "current": "⭐",   # Fase atual
-                "locked": "🔒"     # Fase bloqueada
-            }
-            
-            # Obtém o ícone correspondente ao status ou usa "❓" como fallback
-            icon = status_icons.get(phase["status"], "❓")
-            
-            # Determinar se o botão é clicável (apenas fases não bloqueadas)
-            is_clickable = phase["status"] != "locked"
-            
-            # Criar botão da fase
-            phase_button = ft.Container(
-                content=ft.Row([
-                    ft.Text(icon, size=20),  # Ícone de status
-                    ft.Column([
-                        # Título da fase
-                        ft.Text(
-                            f"Fase {phase['id']}: {phase['title']}",
-                            size=Config.FONT_SIZE_SUBTITLE,
-                            weight=ft.FontWeight.BOLD,
-                            color=Config.COLORS['text_dark'],
-                            font_family=Config.TITLE_FONT
-                        ),
-                        # Descrição da fase
-                        ft.Text(
-                            phase['description'],
-                            size=Config.FONT_SIZE_CAPTION,
-                            color=Config.COLORS['text_dark'],
-                            font_family=Config.TEXT_FONT
-                        )
-                    ], spacing=3, expand=True),  # Espaçamento entre título e descrição
-                    
-                    # Seta para direita (apenas para fases desbloqueadas)
-                    ft.Text(
-                        "➡️" if is_clickable else "",
-                        size=20,
-                        color=Config.COLORS['primary_blue'] if is_clickable else "transparent"
-                    )
-                ], spacing=10),
-                
-                # Definir o ID da fase como data do botão
-                data=phase["id"],
-                
-                # Estilo do container
-                bgcolor=Config.COLORS[phase["status"]] if phase["status"] in Config.COLORS else "#DDDDDD",
-                border_radius=10,
-                padding=15,
-                margin=ft.margin.only(bottom=10),
-                
-                # Adicionar borda mais visível
-                border=ft.border.all(
-                    width=2,
-                    color=Config.COLORS['primary_blue'] if is_clickable else Config.COLORS['locked']
-                ),
-                
-                # Adicionar efeito de clique apenas para fases desbloqueadas
-                on_click=self.handle_phase_button_click if is_clickable else None,
-                
-                # Cursor de mão para indicar que é clicável
-                ink=is_clickable,
-                
-                # Adicionar sombra para efeito 3D
-                shadow=ft.BoxShadow(
-                    spread_radius=0,
-                    blur_radius=4,
-                    color="#60000000",
-                    offset=ft.Offset(0, 2)
-                ) if is_clickable else None
-            )
-            
-            phases_list.append(phase_button)
+        for phase in self.controller.roadmap.phases:
+            phases_list.append(self.build_phase_button(phase))
         
         # Retornar coluna com título e lista de fases
         return ft.Column([
@@ -265,3 +455,187 @@ class RoadmapView:
             ft.Container(height=10),  # Espaçamento vertical
             ft.Column(phases_list)  # Lista de botões de fase
         ], spacing=5)
+    
+    def build_lazy_roadmap_display(self) -> ft.Control:
+        """
+        Exibição do roadmap para cursos grandes
+        
+        Usa um ListView com altura fixa por item, que só renderiza as fases
+        visíveis. Os botões das fases são construídos em páginas de
+        Config.ROADMAP_PAGE_SIZE, conforme o usuário rola a lista.
+        
+        Returns:
+            Coluna com título e lista virtualizada de fases
+        """
+        self.phase_parts = {}
+        self._phase_status = {}
+        self._next_phase_index = 0
+        
+        self.phase_list_view = ft.ListView(
+            item_extent=Config.ROADMAP_ITEM_EXTENT,  # Altura fixa: evita medir cada item
+            expand=True,  # Ocupa o espaço restante da tela
+            on_scroll_interval=100,  # Limita a frequência dos eventos de rolagem (ms)
+            on_scroll=self.handle_roadmap_scroll
+        )
+        
+        # Construir a primeira página de fases
+        self.load_more_phases()
+        
+        return ft.Column([
+            ft.Text(
+                "📚 Fases do Curso",
+                size=Config.FONT_SIZE_TITLE,
+                weight=ft.FontWeight.BOLD,
+                color=Config.COLORS['text_dark'],
+                font_family=Config.TITLE_FONT
+            ),
+            ft.Container(height=10),  # Espaçamento vertical
+            self.phase_list_view
+        ], spacing=5, expand=True)
+    
+    def load_more_phases(self) -> List[ft.Control]:
+        """
+        Constrói a próxima página de fases da lista virtualizada
+        
+        Returns:
+            Lista com os botões de fase recém-construídos (vazia se todas já foram construídas)
+        """
+        phases = self.controller.roadmap.phases
+        start = self._next_phase_index
+        end = min(start + Config.ROADMAP_PAGE_SIZE, len(phases))
+        
+        new_items = [self.build_phase_button(phase, fixed_height=True) for phase in phases[start:end]]
+        self._next_phase_index = end
+        
+        if self.phase_list_view is not None:
+            self.phase_list_view.controls.extend(new_items)
+        return new_items
+    
+    def handle_roadmap_scroll(self, e):
+        """
+        Manipula a rolagem da lista virtualizada
+        
+        Quando o usuário se aproxima do fim da lista, constrói a próxima página de fases
+        
+        Args:
+            e: Evento de rolagem (OnScrollEvent) com a posição atual
+        """
+        # Distância restante até o fim da lista
+        remaining = e.max_scroll_extent - e.pixels
+        if remaining > Config.ROADMAP_ITEM_EXTENT * 5:
+            return
+        
+        if self.load_more_phases():
+            self.controller.page.update(self.phase_list_view)
+    
+    def build_phase_button(self, phase: PhaseData, fixed_height: bool = False) -> ft.Control:
+        """
+        Cria o botão de uma fase
+        
+        A parte visual que depende do status (ícone, cores, clique) é aplicada
+        por apply_phase_style, para que possa ser refeita sem reconstruir o botão.
+        
+        Args:
+            phase: Dados da fase
+            fixed_height: Se True, limita os textos a uma linha para caber na
+                          altura fixa da lista virtualizada
+            
+        Returns:
+            Container representando a fase
+        """
+        # Na lista virtualizada os textos não podem quebrar linha
+        max_lines = 1 if fixed_height else None
+        overflow = ft.TextOverflow.ELLIPSIS if fixed_height else None
+        
+        icon_text = ft.Text("", size=20)  # Ícone de status
+        arrow_text = ft.Text("", size=20)  # Seta para direita (apenas fases desbloqueadas)
+        
+        # Criar botão da fase
+        phase_button = ft.Container(
+            content=ft.Row([
+                icon_text,
+                ft.Column([
+                    # Título da fase
+                    ft.Text(
+                        f"Fase {phase.id}: {phase.title}",
+                        size=Config.FONT_SIZE_SUBTITLE,
+                        weight=ft.FontWeight.BOLD,
+                        color=Config.COLORS['text_dark'],
+                        font_family=Config.TITLE_FONT,
+                        max_lines=max_lines,
+                        overflow=overflow
+                    ),
+                    # Descrição da fase
+                    ft.Text(
+                        phase.description,
+                        size=Config.FONT_SIZE_CAPTION,
+                        color=Config.COLORS['text_dark'],
+                        font_family=Config.TEXT_FONT,
+                        max_lines=max_lines,
+                        overflow=overflow
+                    )
+                ], spacing=3, expand=True),  # Espaçamento entre título e descrição
+                arrow_text
+            ], spacing=10),
+            
+            # Definir o ID da fase como data do botão
+            data=phase.id,
+            
+            # Estilo do container
+            border_radius=10,
+            padding=15,
+            margin=ft.margin.only(bottom=10)
+        )
+        
+        self.phase_parts[phase.id] = (phase_button, icon_text, arrow_text)
+        self.apply_phase_style(phase)
+        return phase_button
+    
+    def apply_phase_style(self, phase: PhaseData) -> Optional[ft.Control]:
+        """
+        Aplica ao botão da fase o visual correspondente ao seu status
+        
+        Args:
+            phase: Dados da fase
+            
+        Returns:
+            O container da fase, ou None se a fase não estiver na tela
+        """
+        parts = self.phase_parts.get(phase.id)
+        if parts is None:
+            return None
+        phase_button, icon_text, arrow_text = parts
+        
+        # Obtém o ícone correspondente ao status ou usa "❓" como fallback
+        icon_text.value = STATUS_ICONS.get(phase.status, "❓")
+        
+        # Determinar se o botão é clicável (apenas fases não bloqueadas)
+        is_clickable = phase.status is not PhaseStatus.LOCKED
+        
+        arrow_text.value = "➡️" if is_clickable else ""
+        arrow_text.color = Config.COLORS['primary_blue'] if is_clickable else "transparent"
+        
+        phase_button.bgcolor = Config.COLORS.get(phase.status.value, "#DDDDDD")
+        
+        # Adicionar borda mais visível
+        phase_button.border = ft.border.all(
+            width=2,
+            color=Config.COLORS['primary_blue'] if is_clickable else Config.COLORS['locked']
+        )
+        
+        # Adicionar efeito de clique apenas para fases desbloqueadas
+        phase_button.on_click = self.handle_phase_button_click if is_clickable else None
+        
+        # Cursor de mão para indicar que é clicável
+        phase_button.ink = is_clickable
+        
+        # Adicionar sombra para efeito 3D
+        phase_button.shadow = ft.BoxShadow(
+            spread_radius=0,
+            blur_radius=4,
+            color="#60000000",
+            offset=ft.Offset(0, 2)
+        ) if is_clickable else None
+        
+        self._phase_status[phase.id] = phase.status
+        return phase_button